@@ -384,7 +384,7 @@ So you are close to reaching the limit. You have to choose your own value, there
         "--batch",
         dest="batch_flag",
         action="store_true",
-        help="Enable batch translation using ChatGPT's batch API for improved efficiency",
+        help="Enable batch translation using ChatGPT's batch API (or Anthropic Message Batches for 3pass) for improved efficiency",
     )
     parser.add_argument(
         "--batch-use",
@@ -411,6 +411,27 @@ So you are close to reaching the limit. You have to choose your own value, there
         action="store_true",
         help="(3pass mode) Skip pass 2 review, do translate only (faster/cheaper)",
     )
+    parser.add_argument(
+        "--quality-gate-strict",
+        dest="quality_gate_strict",
+        action="store_true",
+        help="(3pass mode) Always run pass 2 review on reviewable paragraphs; "
+             "disables the local length/protected-noun/tag check that skips it",
+    )
+    parser.add_argument(
+        "--rpm",
+        dest="rpm",
+        type=int,
+        default=0,
+        help="(3pass mode) Client-side limit on API requests per minute (0 = unlimited)",
+    )
+    parser.add_argument(
+        "--tpm",
+        dest="tpm",
+        type=int,
+        default=0,
+        help="(3pass mode) Client-side limit on API tokens per minute (0 = unlimited)",
+    )
     parser.add_argument(
         "--translation-profile",
         dest="translation_profile",
@@ -658,13 +679,24 @@ So you are close to reaching the limit. You have to choose your own value, there
             # default 3pass -> sonnet (good balance of quality/cost)
             e.translate_model.set_claude_model("claude-sonnet-4-20250514")
         e.translate_model.skip_review = options.skip_review
+        e.translate_model.quality_gate = not options.quality_gate_strict
+        e.translate_model.set_rate_limits(options.rpm, options.tpm)
 
         # Load genre/style profile if specified
         if options.translation_profile:
             e.translate_model.load_profile(options.translation_profile)
 
-        # Auto block_size for cost efficiency
-        if options.block_size <= 0 and options.single_translate:
+        # Persist glossary/context next to the book so --resume picks them up
+        e.translate_model.state_path = f"{options.book_name}.trstate.json"
+        if options.resume:
+            e.translate_model.load_state()
+
+        # Auto block_size for cost efficiency. Batch mode (Message Batches)
+        # queues single paragraphs, so it leaves block_size off.
+        if options.batch_flag or options.batch_use_flag:
+            if options.context_flag:
+                print(f"  NOTE: --use_context is ignored in batch mode (glossary/context stay frozen)")
+        elif options.block_size <= 0 and options.single_translate:
             e.block_size = 1500
             print(f"  Auto-set --block_size 1500 (override with --block_size N)")
         elif options.block_size <= 0 and not options.single_translate:
@@ -697,7 +729,15 @@ So you are close to reaching the limit. You have to choose your own value, there
     if options.model == "geminipro":
         e.translate_model.set_geminipro_models()
 
-    e.make_bilingual_book()
+    try:
+        e.make_bilingual_book()
+        # A finished book leaves nothing to resume; a submitted batch still
+        # needs the state for its --batch_use run
+        if options.model.startswith("3pass") and not options.batch_flag:
+            e.translate_model.clear_state()
+    finally:
+        if options.model.startswith("3pass"):
+            e.translate_model.close()
 
 
 if __name__ == "__main__":
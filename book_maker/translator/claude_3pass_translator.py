@@ -11,39 +11,150 @@ Architecture:
   Smart dispatch:
     - Short paragraphs (<min_review_chars): Pass 1 only (saves cost)
     - Long paragraphs: Full 3-pass
+    - Mid-length paragraphs (<2x min_review_chars) skip Pass 2 when a local
+      check passes: length ratio in band, protected nouns kept, tag parity
+      (disable with --quality-gate-strict)
     - Batch mode (--block_size): Multiple paragraphs per API call
+    - translate_chapter() packs short paragraphs into batches of up to
+      batch_char_budget characters automatically
+
+  Message Batches (--batch / --batch-use):
+    - Pass 1 for every paragraph goes out as one Message Batch, Pass 2 as a
+      second batch, Pass 3 as a third batch for reviews that found issues
+    - Batch pricing is 50% of the synchronous API; glossary/context stay
+      frozen for the whole run, so use it without --use_context
 
   Prompt caching (automatic):
-    - System prompts are marked for caching via cache_control
+    - The static part of each system prompt (rules, style, protected nouns)
+      is marked for caching via cache_control, the glossary is a second
+      cache breakpoint, the frozen story summary a third, and the recent
+      narrative context follows uncached
     - First call costs +25% but all subsequent calls get 90% discount
     - For 1,300+ calls with the same prompt, saves ~$40-60 on Opus
 
+  Narrative context (--use_context):
+    - context_recent: re-summarised every context_update_interval chunks
+    - context_frozen: the recent window is folded into it every
+      context_freeze_interval chunks, so it stays byte-identical (and
+      cacheable) in between
+
   Genre profiles (JSON files) control:
     - Style instructions, protected nouns, seed glossary
     - Temperature per pass, review thresholds
     - Context/glossary update frequency
 
+  Async pipeline (atranslate / atranslate_chapter):
+    - Up to pipeline_depth paragraphs in flight on AsyncAnthropic, so one
+      paragraph's Pass 2 overlaps the next paragraph's Pass 1
+    - Glossary/context updates are ordered barriers: chunks before an update
+      boundary finish, the update runs, then later chunks start
+    - The context and glossary updates themselves are independent and run
+      concurrently (also on the sync path, via a background event loop)
+
   IMPORTANT: Do NOT use --parallel-workers > 1.
   Glossary and context are shared state.
 """
 
+import asyncio
 import json
 import os
+import random
+import re
+import sys
 import time
 import atexit
+import weakref
 from dataclasses import dataclass, field, asdict
-from threading import Lock
+from threading import Lock, Thread
 from typing import Callable, Optional, Any
 from rich import print as rprint
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json otherwise
+    orjson = None
+
 from .base_translator import Base
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
 DEFAULT_MIN_REVIEW_CHARS = 300
 DEFAULT_CONTEXT_INTERVAL = 15
 DEFAULT_GLOSSARY_INTERVAL = 20
+DEFAULT_CONTEXT_FREEZE_INTERVAL = 100
 PARA_DELIMITER = "|||PARA|||"
+BATCH_POLL_INTERVAL = 30
+DEFAULT_BATCH_TIMEOUT = 6 * 3600
+DEFAULT_PIPELINE_DEPTH = 3
+DEFAULT_API_CONCURRENCY = 4
+BATCH_MAX_REQUESTS = 10000
+DEFAULT_BATCH_CHAR_BUDGET = 4000
+DEFAULT_LENGTH_RATIO_BAND = (0.7, 1.8)
+SYSTEM_BLOCK_CACHE_SIZE = 16
+LOG_FLUSH_INTERVAL = 0.5
+# Streamed reviews are checked for a QUALITY_OK verdict once this much text arrived
+REVIEW_VERDICT_CHARS = 32
+
+# USD per million tokens
+_PRICING = {
+    "claude-opus-4-20250514": {"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75},
+    "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0, "cache_read": 0.30, "cache_write": 3.75},
+}
+
+# Reviewer's "no issues" verdict, in English or German spelling
+_QUALITY_OK_RE = re.compile(r"QUALITY_OK|QUALITAET_OK|QUALITÄT_OK")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# "source": "target" pairs, for salvaging truncated glossary JSON
+_GLOSSARY_PAIR_RE = re.compile(r'"([^"]{1,100})"\s*:\s*"([^"]{1,200})"')
+
+
+def _json_loads(data):
+    """json.loads via orjson when available (accepts str or bytes)."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """UTF-8 encoded JSON via orjson when available."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_glossary_json(resp: str) -> dict:
+    """Glossary object from a model reply.
+
+    Tolerates markdown fences, leading prose and trailing junk. If the JSON
+    is truncated, the complete "term": "translation" pairs are kept.
+    """
+    start = resp.find("{")
+    if start < 0:
+        return {}
+    try:
+        obj = _json_loads(resp[start:resp.rfind("}") + 1])
+        if isinstance(obj, dict):
+            return obj
+    except json.JSONDecodeError:
+        pass
+    try:
+        obj, _ = json.JSONDecoder().raw_decode(resp, start)
+        if isinstance(obj, dict):
+            return obj
+    except json.JSONDecodeError:
+        pass
+    return dict(_GLOSSARY_PAIR_RE.findall(resp, start))
+
+
+# Translators still alive at exit print their final stats. A WeakSet so
+# finished translators (and their clients and glossaries) can be collected.
+_LIVE: "weakref.WeakSet[Claude3Pass]" = weakref.WeakSet()
+
+
+@atexit.register
+def _print_all_final_stats():
+    for translator in list(_LIVE):
+        translator._print_final_stats()
 
 # ─── Data Classes ─────────────────────────────────────────────────────────────
 
@@ -86,18 +197,78 @@ class TranslationStats:
     full_3pass_count: int = 0
     reviews_ok: int = 0
     reviews_fixed: int = 0
+    reviews_skipped_local: int = 0
     chunk_counter: int = 0
     glossary_terms: int = 0
     cost_estimate: float = 0.0
     cost_without_cache: float = 0.0
 
 
+# ─── Rate Limiting ────────────────────────────────────────────────────────────
+
+
+class _RateLimiter:
+    """Client-side token bucket for requests/minute and tokens/minute.
+
+    Callers reserve capacity before each request; when a bucket runs dry the
+    reservation goes into debt and the caller sleeps until it is paid back.
+    A limit of 0 disables that bucket. The lock only guards the arithmetic,
+    so one limiter can be shared by threads and the async pipeline.
+    """
+
+    def __init__(self, rpm=0, tpm=0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = Lock()
+
+    def _reserve(self, tokens):
+        """Take capacity for one request; returns seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._last = now - self._last, now
+            wait = 0.0
+            if self.rpm:
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60) - 1
+                if self._requests < 0:
+                    wait = -self._requests * 60 / self.rpm
+            if self.tpm:
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60) - min(tokens, self.tpm)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tpm)
+            return wait
+
+    def acquire(self, tokens):
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens):
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 # ─── Prompt Templates ────────────────────────────────────────────────────────
 # Use {language} and {source_language} so they adapt to any language pair.
 # Designed to be long and detailed — prompt caching makes this nearly free
 # after the first call.
-
-SYSTEM_TRANSLATE = """\
+#
+# Each pass prompt is split in three system blocks:
+#   *_STATIC   — rules, style and protected nouns; fixed once the profile is
+#                loaded, cached for the whole book
+#   *_GLOSSARY — established term pairs; only changes every
+#                glossary_update_interval chunks, so it is a second cache
+#                breakpoint
+#   *_DYNAMIC  — recent narrative context and batch notes; changes between
+#                calls and is sent uncached after the cached prefix
+# The translate prompt has a fourth block, SYSTEM_TRANSLATE_FROZEN, between
+# glossary and dynamic: the long-range story summary, which only changes
+# every context_freeze_interval chunks and is cached as well.
+
+SYSTEM_TRANSLATE_STATIC = """\
 You are an expert literary translator specialising in {source_language} → {language} \
 translation. Your translations are published-quality: natural, fluent, and faithful \
 to the author's voice.
@@ -115,15 +286,22 @@ to the author's voice.
 7. For dialogue, use natural spoken {language} appropriate to the character
 8. Preserve intentional stylistic choices (short sentences for tension, \
 long sentences for atmosphere, etc.)
-{protected_nouns_section}
+{protected_nouns_section}"""
+
+SYSTEM_TRANSLATE_GLOSSARY = """\
 ═══ GLOSSARY (established translations in this book) ═══
-{glossary}
+{glossary}"""
 
+SYSTEM_TRANSLATE_FROZEN = """\
 ═══ NARRATIVE CONTEXT (story so far) ═══
+{context}"""
+
+SYSTEM_TRANSLATE_DYNAMIC = """\
+═══ RECENT EVENTS ═══
 {context}
 {batch_instruction}"""
 
-SYSTEM_REVIEW = """\
+SYSTEM_REVIEW_STATIC = """\
 You are a senior literary translation editor reviewing a {source_language} → {language} \
 translation. You have decades of experience with published literary translations.
 
@@ -142,9 +320,6 @@ Examine the translation against the original on ALL of these axes:
 7. GLOSSARY CONSISTENCY — Do translated terms match the established glossary?
 8. SENTENCE QUALITY — Are there awkward constructions, unnatural word order, \
 or anglicisms (or source-language interference)?
-{batch_review_note}
-═══ GLOSSARY ═══
-{glossary}
 
 ═══ OUTPUT FORMAT ═══
 If the translation is excellent with no issues, respond with ONLY: QUALITY_OK
@@ -155,7 +330,14 @@ Otherwise, produce a numbered list. For each issue:
 - SEVERITY: minor / moderate / critical
 - FIX: the corrected {language} text"""
 
-SYSTEM_REFINE = """\
+SYSTEM_REVIEW_GLOSSARY = """\
+═══ GLOSSARY ═══
+{glossary}"""
+
+SYSTEM_REVIEW_DYNAMIC = """\
+{batch_review_note}"""
+
+SYSTEM_REFINE_STATIC = """\
 You are a professional literary translator performing final revision of a \
 {source_language} → {language} translation.
 
@@ -165,20 +347,35 @@ You are a professional literary translator performing final revision of a \
 3. Protected proper nouns must NEVER be translated
 4. Maintain all HTML/XML tags exactly as they appear
 5. Output ONLY the corrected {language} translation — no notes or commentary
-6. If the review says "QUALITY_OK", return the translation UNCHANGED
-{batch_instruction}
+6. If the review says "QUALITY_OK", return the translation UNCHANGED"""
+
+SYSTEM_REFINE_GLOSSARY = """\
 ═══ GLOSSARY ═══
 {glossary}"""
 
+SYSTEM_REFINE_DYNAMIC = """\
+{batch_instruction}"""
+
 SYSTEM_CONTEXT = """\
-You are a literary translator's assistant maintaining a rolling narrative summary.
+You are a literary translator's assistant tracking recent narrative developments.
 
-Produce a concise summary (max 4 sentences) capturing:
+You receive the story so far (background only — do not repeat it), the current \
+recent-events notes and the newest passage. Produce concise bullets (max 4) \
+covering only the recent stretch of the story:
 - Key characters present and their current state/emotions
 - Current location and setting
 - Plot developments and narrative momentum
 - Overall mood/atmosphere
 
+Write the bullets in {language}. Respond ONLY with the bullets."""
+
+SYSTEM_CONTEXT_FOLD = """\
+You are a literary translator's assistant maintaining a long-range story summary.
+
+Merge the recent-events notes into the story so far. Produce one concise summary \
+(max 6 sentences) of the main characters, setting, plot and mood, keeping what \
+still matters for translating the rest of the book.
+
 Write the summary in {language}. Respond ONLY with the summary."""
 
 SYSTEM_GLOSSARY = """\
@@ -211,14 +408,31 @@ class Claude3Pass(Base):
         skip_review=False,
         model_name=None,
         source_lang=None,
+        state_path=None,
+        client=None,
         **kwargs,
     ) -> None:
         super().__init__(key, language)
 
         from anthropic import Anthropic
-        self.client = Anthropic(base_url=api_base, api_key=key, timeout=180)
-
-        self.model = model_name or "claude-sonnet-4-20250514"
+        self._client_kwargs = {"base_url": api_base, "api_key": key, "timeout": 180}
+        # A caller translating several books may share one client (and its
+        # connection pool) between translator instances
+        self.client = client or Anthropic(**self._client_kwargs)
+
+        # (AsyncAnthropic client, request semaphore) per event loop; each is
+        # bound to the loop that created it, so loops never share one
+        self.api_concurrency = DEFAULT_API_CONCURRENCY
+        self._async_clients = {}
+        # Event loop (and its thread) for context/glossary updates from the
+        # sync path; stopped by close()
+        self._update_loop = None
+        self._update_thread = None
+        # Client-side RPM/TPM limits, see set_rate_limits()
+        self._rate_limiter = None
+
+        self.model = model_name or DEFAULT_MODEL
+        self._price = _PRICING.get(self.model, _PRICING[DEFAULT_MODEL])
         self.language = language or "German"
         self.source_language = self._resolve_source_lang(source_lang)
 
@@ -232,7 +446,14 @@ class Claude3Pass(Base):
             "- Use natural target-language sentence structures"
         )
         self.protected_nouns = []
+        self._protected_nouns_section_str = ""
+        self._protected_nouns_list_str = "(none)"
+        # One alternation over all protected nouns, longest first
+        self._protected_re = None
         self.skip_review = skip_review
+        # Local pre-review check; --quality-gate-strict turns it off
+        self.quality_gate = True
+        self.length_ratio_band = DEFAULT_LENGTH_RATIO_BAND
 
         # Temperatures
         self.temp_translate = 0.3
@@ -242,13 +463,23 @@ class Claude3Pass(Base):
         # Thresholds
         self.min_review_chars = DEFAULT_MIN_REVIEW_CHARS
         self.context_update_interval = DEFAULT_CONTEXT_INTERVAL
+        self.context_freeze_interval = DEFAULT_CONTEXT_FREEZE_INTERVAL
         self.glossary_update_interval = DEFAULT_GLOSSARY_INTERVAL
+        self.batch_char_budget = DEFAULT_BATCH_CHAR_BUDGET
+        # Seconds to wait for Message Batches before cancelling them
+        self.batch_timeout = DEFAULT_BATCH_TIMEOUT
+
+        # Paragraphs waiting to be packed into one batched call
+        self._pending = []
 
         # Rolling state
         self.glossary = {}
-        self.context_summary = ""
+        self.context_frozen = ""
+        self.context_recent = ""
         self.context_flag = context_flag
         self.context_paragraph_limit = context_paragraph_limit
+        # Glossary/context snapshot for --resume (e.g. "{book_path}.trstate.json")
+        self.state_path = state_path
 
         # Compatibility attrs for epub_loader parallel context mechanism
         self.context_list = []
@@ -260,19 +491,41 @@ class Claude3Pass(Base):
         self.total_cache_read_tokens = 0
         self.total_cache_create_tokens = 0
         self.total_requests = 0
+        # Running cost in USD, updated per response by _track_usage()
+        self._cost = 0.0
+        self._cost_no_cache = 0.0
         self.pass1_only_count = 0
         self.full_3pass_count = 0
         self.reviews_ok = 0
         self.reviews_fixed = 0
+        self.reviews_skipped_local = 0
         self.chunk_counter = 0
         self.glossary_extract_failures = 0
 
         self._glossary_lock = Lock()
+        # Bumped on every glossary mutation; keys the cached glossary blocks
+        self._glossary_version = 0
+        self._glossary_cached = (None, "")
+        self._glossary_block_cache: dict[str, tuple[int, str]] = {}
+        self._static_blocks_cache = (None, ("", "", ""))
+        # Built system-message lists keyed by (system, use_cache), LRU order
+        self._system_block_cache: dict[tuple, Any] = {}
+
+        # Message Batches state (--batch / --batch-use)
+        self.batch_text_list = []
+        self._batch_results = None
+
+        # Per-chunk progress lines, printed in LOG_FLUSH_INTERVAL ticks;
+        # dropped when stdout is not a terminal
+        self._log_enabled = sys.stdout.isatty()
+        self._log_buf: list[str] = []
+        self._log_flushed = time.monotonic()
 
         # Internal tracking for translate_rich()
         self._last_passes_used = 0
         self._last_quality_ok = True
         self._last_review_text = ""
+        self._last_batch_exact = True
 
         # Event hooks
         self._hooks: dict[str, list[Callable]] = {
@@ -285,7 +538,7 @@ class Claude3Pass(Base):
         }
 
         # Print final stats on exit
-        atexit.register(self._print_final_stats)
+        _LIVE.add(self)
 
     # ─── Event Hooks ─────────────────────────────────────────────────────
 
@@ -322,15 +575,29 @@ class Claude3Pass(Base):
             return "English"
         return mapping.get(source_lang.lower(), source_lang)
 
+    def _log(self, msg, end="\n"):
+        """Buffer a progress line; flushed at most every LOG_FLUSH_INTERVAL seconds."""
+        if not self._log_enabled:
+            return
+        self._log_buf.append(msg + end)
+        if end and time.monotonic() - self._log_flushed >= LOG_FLUSH_INTERVAL:
+            self._flush_log()
+
+    def _flush_log(self):
+        if self._log_buf:
+            rprint("".join(self._log_buf), end="")
+            self._log_buf.clear()
+        self._log_flushed = time.monotonic()
+
     # ─── Profile Loading ─────────────────────────────────────────────────
 
     def load_profile(self, profile_path):
         """Load a genre/style profile from a JSON file."""
-        if not os.path.exists(profile_path):
-            raise FileNotFoundError(f"Translation profile not found: {profile_path}")
-
-        with open(profile_path, "r", encoding="utf-8") as f:
-            profile = json.load(f)
+        try:
+            with open(profile_path, "rb") as f:
+                profile = _json_loads(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Translation profile not found: {profile_path}") from None
 
         self.profile_name = profile.get("name", os.path.basename(profile_path))
 
@@ -342,6 +609,12 @@ class Claude3Pass(Base):
         self.protected_nouns = [
             n for n in nouns if not n.startswith(skip_prefixes) and len(n) < 100
         ]
+        # Fixed for the rest of the run — format once instead of per call
+        self._protected_nouns_section_str = self._protected_nouns_section()
+        self._protected_nouns_list_str = self._protected_nouns_list_short()
+        self._protected_re = re.compile("|".join(
+            re.escape(n) for n in sorted(self.protected_nouns, key=len, reverse=True)
+        )) if self.protected_nouns else None
 
         # Source language override from profile
         if "source_language" in profile:
@@ -350,6 +623,7 @@ class Claude3Pass(Base):
         seed = profile.get("glossary_seed", {})
         seed.pop("_comment", None)
         self.glossary.update(seed)
+        self._glossary_version += 1
 
         temps = profile.get("temperature", {})
         temps.pop("_comment", None)
@@ -358,8 +632,12 @@ class Claude3Pass(Base):
         self.temp_refine = temps.get("refine", self.temp_refine)
 
         self.min_review_chars = profile.get("min_review_chars", self.min_review_chars)
+        self.length_ratio_band = tuple(profile.get("length_ratio_band", self.length_ratio_band))
         self.context_update_interval = profile.get("context_update_interval", self.context_update_interval)
+        self.context_freeze_interval = profile.get("context_freeze_interval", self.context_freeze_interval)
         self.glossary_update_interval = profile.get("glossary_update_interval", self.glossary_update_interval)
+        self.batch_char_budget = profile.get("batch_char_budget", self.batch_char_budget)
+        self.batch_timeout = profile.get("batch_timeout", self.batch_timeout)
 
         rprint(f"  [bold green]Profile: {self.profile_name}[/bold green]")
         if self.protected_nouns:
@@ -372,6 +650,11 @@ class Claude3Pass(Base):
 
     def set_claude_model(self, model_name):
         self.model = model_name
+        self._price = _PRICING.get(model_name, _PRICING[DEFAULT_MODEL])
+
+    def set_rate_limits(self, rpm=0, tpm=0):
+        """Throttle API calls to rpm requests and tpm tokens per minute (0 = unlimited)."""
+        self._rate_limiter = _RateLimiter(rpm, tpm) if rpm or tpm else None
 
     # ─── Main Entry Point ────────────────────────────────────────────────
 
@@ -394,6 +677,7 @@ class Claude3Pass(Base):
             self.total_input_tokens, self.total_output_tokens,
             self.total_cache_read_tokens, self.total_cache_create_tokens,
         )
+        cost_before = self._cost
 
         translated = self.translate(text)
 
@@ -413,17 +697,177 @@ class Claude3Pass(Base):
             output_tokens=delta[1],
             cache_read_tokens=delta[2],
             cache_create_tokens=delta[3],
-            cost_estimate=self._estimate_delta_cost(delta),
+            cost_estimate=self._cost - cost_before,
         )
 
     def translate_chapter(self, paragraphs: list[str]) -> list[TranslationResult]:
-        """Translate a list of paragraphs as a chapter."""
+        """Translate a list of paragraphs as a chapter.
+
+        Consecutive single-line paragraphs are packed into one batched call
+        of up to batch_char_budget characters. Results are still returned
+        one per input paragraph; a batch's token counts and cost are
+        reported on its first paragraph.
+        """
         results = []
         for para in paragraphs:
-            result = self.translate_rich(para)
+            if "\n" in para or not para.strip() or self._on_context_boundary():
+                results.extend(self.flush())
+                results.append(self.translate_rich(para))
+                continue
+            if self._pending and sum(map(len, self._pending)) + len(para) > self.batch_char_budget:
+                results.extend(self.flush())
+            self._pending.append(para)
+        results.extend(self.flush())
+        return results
+
+    def flush(self) -> list[TranslationResult]:
+        """Translate all pending paragraphs in one call, one result per paragraph."""
+        pending, self._pending = self._pending, []
+        if len(pending) <= 1:
+            return [self.translate_rich(p) for p in pending]
+
+        batch = self.translate_rich("\n".join(pending))
+        lines = batch.text.split("\n")
+        if not self._last_batch_exact or len(lines) != len(pending):
+            # The reply can't be lined up with its inputs; spend the extra
+            # calls rather than shift every later paragraph by one
+            rprint(f"  [yellow]Batch reply did not keep {len(pending)} paragraphs, "
+                   f"translating them one by one[/yellow]")
+            results = [self.translate_rich(p) for p in pending]
+            first = results[0]
+            first.input_tokens += batch.input_tokens
+            first.output_tokens += batch.output_tokens
+            first.cache_read_tokens += batch.cache_read_tokens
+            first.cache_create_tokens += batch.cache_create_tokens
+            first.cost_estimate += batch.cost_estimate
+            return results
+
+        results = []
+        for i, line in enumerate(lines):
+            result = TranslationResult(
+                text=line,
+                passes_used=batch.passes_used,
+                quality_ok=batch.quality_ok,
+                review_text=batch.review_text,
+            )
+            if i == 0:
+                result.input_tokens = batch.input_tokens
+                result.output_tokens = batch.output_tokens
+                result.cache_read_tokens = batch.cache_read_tokens
+                result.cache_create_tokens = batch.cache_create_tokens
+                result.cost_estimate = batch.cost_estimate
             results.append(result)
         return results
 
+    def _on_context_boundary(self):
+        """True if the next paragraph's chunk triggers a context update; it runs unbatched.
+
+        With paragraphs pending, their flush takes the next chunk number and
+        the paragraph gets the one after it.
+        """
+        return self._is_context_boundary(self.chunk_counter + (2 if self._pending else 1))
+
+    def _is_context_boundary(self, chunk_number):
+        return self.context_flag and (
+            chunk_number % self.context_update_interval == 0
+            or chunk_number % self.context_freeze_interval == 0
+        )
+
+    # ─── Async Pipeline ──────────────────────────────────────────────────
+
+    async def atranslate(self, text):
+        """Async translate() for a single paragraph or block."""
+        return (await self.atranslate_chapter([text]))[0]
+
+    async def atranslate_chapter(self, paragraphs, pipeline_depth=DEFAULT_PIPELINE_DEPTH):
+        """Translate paragraphs with up to pipeline_depth of them in flight.
+
+        Work is cut into segments ending at context/glossary update boundaries.
+        Each segment runs concurrently; the update for its last chunk runs once
+        the whole segment is done, so later chunks always see the new state.
+        Returns translations in input order.
+        """
+        results = [None] * len(paragraphs)
+        window = asyncio.Semaphore(pipeline_depth)
+
+        async def run(i, chunk_number):
+            async with window:
+                results[i] = await self._atranslate_chunk(paragraphs[i], chunk_number)
+
+        start = 0
+        while start < len(paragraphs):
+            tasks = []
+            end = start
+            while end < len(paragraphs):
+                self.chunk_counter += 1
+                tasks.append(run(end, self.chunk_counter))
+                end += 1
+                if self._is_update_boundary(self.chunk_counter):
+                    break
+            await asyncio.gather(*tasks)
+            if self._update_due():
+                await self._amaybe_update_context_glossary(paragraphs[end - 1], results[end - 1])
+            start = end
+
+        return results
+
+    def _is_update_boundary(self, chunk_number):
+        return (
+            self._is_context_boundary(chunk_number)
+            or chunk_number % self.glossary_update_interval == 0
+        )
+
+    async def _atranslate_chunk(self, text, chunk_number):
+        """One paragraph or block through the passes, without state updates."""
+        is_batch = "\n" in text.strip()
+        paragraphs = text.split("\n") if is_batch else [text]
+        source = f"\n{PARA_DELIMITER}\n".join(paragraphs) if is_batch else text
+        bi = self._batch_instruction(len(paragraphs)) if is_batch else ""
+        review_needed = not self.skip_review and len(text) >= self.min_review_chars
+
+        translation = await self._aapi_call(*self._pass1_prompt(source, bi), self.temp_translate)
+        self._fire("on_pass_complete", 1, translation)
+        passes_used, quality_ok, label = 1, True, "P1"
+
+        gated = review_needed and self._cheap_quality_gate(source, translation)
+        if gated:
+            self.reviews_skipped_local += 1
+            label = "P1 gate:OK"
+        elif review_needed:
+            review = await self._aapi_call(
+                *self._pass2_prompt(source, translation, is_batch), self.temp_review,
+                stop_on_ok=True,
+            )
+            self._fire("on_pass_complete", 2, review)
+            if self._is_quality_ok(review):
+                self.reviews_ok += 1
+                passes_used, label = 2, "P1 P2:OK"
+            else:
+                self.reviews_fixed += 1
+                translation = await self._aapi_call(
+                    *self._pass3_prompt(source, translation, review, bi), self.temp_refine,
+                )
+                self._fire("on_pass_complete", 3, translation)
+                passes_used, quality_ok, label = 3, False, "P1 P2:fix P3"
+
+        if is_batch or review_needed:
+            self.full_3pass_count += 1
+        else:
+            self.pass1_only_count += 1
+        self._log(f"  [cyan]#{chunk_number} ({len(paragraphs)}p, {len(text)}c) {label}[/cyan]")
+
+        result = self._reassemble_batch(translation, paragraphs) if is_batch else translation
+        self._fire("on_chunk_complete", ChunkEvent(
+            chunk_number=chunk_number,
+            original_text=text,
+            translated_text=result,
+            passes_used=passes_used,
+            quality_ok=quality_ok,
+            is_batch=is_batch,
+            paragraph_count=len(paragraphs),
+        ))
+        return result
+
     # ─── State Accessors ─────────────────────────────────────────────────
 
     def get_glossary(self) -> dict[str, str]:
@@ -433,12 +877,20 @@ class Claude3Pass(Base):
     def set_glossary(self, glossary: dict[str, str]) -> None:
         with self._glossary_lock:
             self.glossary = dict(glossary)
+            self._glossary_version += 1
+
+    @property
+    def context_summary(self) -> str:
+        """Frozen story summary followed by the recent-events notes."""
+        return "\n".join(c for c in (self.context_frozen, self.context_recent) if c)
 
     def get_context(self) -> str:
         return self.context_summary
 
     def set_context(self, context: str) -> None:
-        self.context_summary = context
+        """Replace the narrative context; it becomes the frozen summary."""
+        self.context_frozen = context
+        self.context_recent = ""
 
     def get_stats(self) -> TranslationStats:
         cost, cost_no_cache = self._cost_estimate()
@@ -452,17 +904,71 @@ class Claude3Pass(Base):
             full_3pass_count=self.full_3pass_count,
             reviews_ok=self.reviews_ok,
             reviews_fixed=self.reviews_fixed,
+            reviews_skipped_local=self.reviews_skipped_local,
             chunk_counter=self.chunk_counter,
             glossary_terms=len(self.glossary),
             cost_estimate=cost,
             cost_without_cache=cost_no_cache,
         )
 
+    # ─── State Persistence ───────────────────────────────────────────────
+
+    def load_state(self):
+        """Restore glossary, context and chunk counter from state_path.
+
+        Returns True if a snapshot was loaded. The saved glossary is merged
+        over the profile's seed glossary, so call this after load_profile().
+        """
+        if not self.state_path or not os.path.exists(self.state_path):
+            return False
+        try:
+            with open(self.state_path, "rb") as f:
+                state = _json_loads(f.read())
+        except (OSError, json.JSONDecodeError) as e:
+            rprint(f"  [dim](could not read translator state: {e})[/dim]")
+            return False
+
+        with self._glossary_lock:
+            self.glossary.update(state.get("glossary", {}))
+            self._glossary_version += 1
+        self.context_frozen = state.get("context_frozen", self.context_frozen)
+        self.context_recent = state.get("context", self.context_recent)
+        self.chunk_counter = state.get("chunk_counter", self.chunk_counter)
+        rprint(f"  Resumed state: {len(self.glossary)} glossary terms, chunk #{self.chunk_counter}")
+        return True
+
+    def _save_state(self):
+        """Atomically write glossary, context and chunk counter to state_path."""
+        if not self.state_path:
+            return
+        with self._glossary_lock:
+            state = {
+                "glossary": dict(self.glossary),
+                "context_frozen": self.context_frozen,
+                "context": self.context_recent,
+                "chunk_counter": self.chunk_counter,
+            }
+        tmp = f"{self.state_path}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_json_dumps(state))
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            rprint(f"  [dim](could not save translator state: {e})[/dim]")
+
+    def clear_state(self):
+        """Remove the state_path snapshot once a book is finished; nothing is left to resume."""
+        if self.state_path:
+            try:
+                os.remove(self.state_path)
+            except FileNotFoundError:
+                pass
+
     # ─── Translation Modes ───────────────────────────────────────────────
 
     def _translate_pass1_only(self, text):
         self.pass1_only_count += 1
-        rprint(f"  [dim]#{self.chunk_counter} ({len(text)}c) P1[/dim]")
+        self._log(f"  [dim]#{self.chunk_counter} ({len(text)}c) P1[/dim]")
         translation = self._pass1(text)
         self._fire("on_pass_complete", 1, translation)
 
@@ -487,24 +993,46 @@ class Claude3Pass(Base):
 
     def _translate_3pass(self, text):
         self.full_3pass_count += 1
-        rprint(f"  [cyan]#{self.chunk_counter} ({len(text)}c) 3-pass[/cyan]", end="")
+        self._log(f"  [cyan]#{self.chunk_counter} ({len(text)}c) 3-pass[/cyan]", end="")
 
         translation = self._pass1(text)
-        rprint(f" [green]P1[/green]", end="")
+        self._log(f" [green]P1[/green]", end="")
         self._fire("on_pass_complete", 1, translation)
 
+        if self._cheap_quality_gate(text, translation):
+            self.reviews_skipped_local += 1
+            self._log(f" [green]gate:OK[/green]")
+
+            self._last_passes_used = 1
+            self._last_quality_ok = True
+            self._last_review_text = ""
+
+            self._maybe_update_context_glossary(text, translation)
+
+            self._fire("on_chunk_complete", ChunkEvent(
+                chunk_number=self.chunk_counter,
+                original_text=text,
+                translated_text=translation,
+                passes_used=1,
+                quality_ok=True,
+                is_batch=False,
+                paragraph_count=1,
+            ))
+
+            return translation
+
         review = self._pass2(text, translation)
         self._fire("on_pass_complete", 2, review)
 
         if self._is_quality_ok(review):
             self.reviews_ok += 1
-            rprint(f" [green]P2:OK[/green]")
+            self._log(f" [green]P2:OK[/green]")
 
             self._last_passes_used = 2
             self._last_quality_ok = True
             self._last_review_text = review
 
-            self._maybe_update_context_glossary(text, translation)
+            self._maybe_update_context_glossary(text, translation, reviewed_ok=True)
 
             self._fire("on_chunk_complete", ChunkEvent(
                 chunk_number=self.chunk_counter,
@@ -520,7 +1048,7 @@ class Claude3Pass(Base):
 
         self.reviews_fixed += 1
         refined = self._pass3(text, translation, review)
-        rprint(f" [yellow]P2:fix[/yellow] [green]P3[/green]")
+        self._log(f" [yellow]P2:fix[/yellow] [green]P3[/green]")
         self._fire("on_pass_complete", 3, refined)
 
         self._last_passes_used = 3
@@ -547,62 +1075,50 @@ class Claude3Pass(Base):
         total_chars = len(text)
         self.full_3pass_count += 1
 
-        rprint(f"  [cyan]#{self.chunk_counter} BATCH ({para_count}p, {total_chars}c)[/cyan]", end="")
+        self._log(f"  [cyan]#{self.chunk_counter} BATCH ({para_count}p, {total_chars}c)[/cyan]", end="")
 
         delimited = f"\n{PARA_DELIMITER}\n".join(paragraphs)
-        bi = (
-            f"\n═══ BATCH MODE ═══\n"
-            f"The input contains {para_count} paragraphs separated by {PARA_DELIMITER}\n"
-            f"Separate translated paragraphs with {PARA_DELIMITER} as well.\n"
-            f"Translate EVERY paragraph completely. The paragraph count MUST stay exactly {para_count}."
-        )
+        bi = self._batch_instruction(para_count)
 
         translation = self._pass1(delimited, batch_instruction=bi)
-        rprint(f" [green]P1[/green]", end="")
+        self._log(f" [green]P1[/green]", end="")
         self._fire("on_pass_complete", 1, translation)
 
         quality_ok = True
         review_text = ""
         passes_used = 1
 
-        if not self.skip_review and total_chars >= self.min_review_chars:
+        if (not self.skip_review and total_chars >= self.min_review_chars
+                and self._cheap_quality_gate(delimited, translation)):
+            self.reviews_skipped_local += 1
+            self._log(f" [green]gate:OK[/green]")
+        elif not self.skip_review and total_chars >= self.min_review_chars:
             review = self._pass2(delimited, translation, is_batch=True)
             review_text = review
             self._fire("on_pass_complete", 2, review)
             if self._is_quality_ok(review):
                 self.reviews_ok += 1
-                rprint(f" [green]P2:OK[/green]")
+                self._log(f" [green]P2:OK[/green]")
                 passes_used = 2
             else:
                 self.reviews_fixed += 1
                 translation = self._pass3(delimited, translation, review, batch_instruction=bi)
-                rprint(f" [yellow]P2:fix[/yellow] [green]P3[/green]")
+                self._log(f" [yellow]P2:fix[/yellow] [green]P3[/green]")
                 self._fire("on_pass_complete", 3, translation)
                 quality_ok = False
                 passes_used = 3
         else:
-            rprint(f" [dim]skip review[/dim]")
+            self._log(f" [dim]skip review[/dim]")
 
-        # Reassemble paragraphs
-        parts = [p.strip().replace("\n", " ") for p in translation.split(PARA_DELIMITER) if p.strip()]
+        result = self._reassemble_batch(translation, paragraphs)
 
-        if len(parts) == para_count:
-            result = "\n".join(parts)
-        elif len(parts) > para_count:
-            merged = parts[:para_count - 1] + [" ".join(parts[para_count - 1:])]
-            result = "\n".join(merged)
-            rprint(f"  [dim](merged {len(parts)}→{para_count} paras)[/dim]")
-        else:
-            padded = parts + paragraphs[len(parts):]
-            result = "\n".join(padded[:para_count])
-            rprint(f"  [dim](padded {len(parts)}→{para_count} paras)[/dim]")
-
-        # Track for translate_rich()
+        # Track for translate_rich() and flush()
+        self._last_batch_exact = len(self._split_batch(translation)) == para_count
         self._last_passes_used = passes_used
         self._last_quality_ok = quality_ok
         self._last_review_text = review_text
 
-        self._maybe_update_context_glossary(text, result)
+        self._maybe_update_context_glossary(text, result, reviewed_ok=passes_used == 2)
 
         self._fire("on_chunk_complete", ChunkEvent(
             chunk_number=self.chunk_counter,
@@ -618,9 +1134,58 @@ class Claude3Pass(Base):
             self._print_stats()
         return result
 
+    @staticmethod
+    def _batch_instruction(para_count):
+        return (
+            f"\n═══ BATCH MODE ═══\n"
+            f"The input contains {para_count} paragraphs separated by {PARA_DELIMITER}\n"
+            f"Separate translated paragraphs with {PARA_DELIMITER} as well.\n"
+            f"Keep each translated paragraph on a single line, one per input paragraph.\n"
+            f"Translate EVERY paragraph completely. The paragraph count MUST stay exactly {para_count}."
+        )
+
+    @staticmethod
+    def _split_batch(translation):
+        """The translated paragraphs of a delimited batch reply, one line each."""
+        return [p.strip().replace("\n", " ") for p in translation.split(PARA_DELIMITER) if p.strip()]
+
+    @classmethod
+    def _reassemble_batch(cls, translation, paragraphs):
+        """Split a delimited batch translation back into exactly len(paragraphs) lines."""
+        para_count = len(paragraphs)
+        parts = cls._split_batch(translation)
+
+        if len(parts) == para_count:
+            return "\n".join(parts)
+        if len(parts) > para_count:
+            merged = parts[:para_count - 1] + [" ".join(parts[para_count - 1:])]
+            rprint(f"  [dim](merged {len(parts)}→{para_count} paras)[/dim]")
+            return "\n".join(merged)
+        padded = parts + paragraphs[len(parts):]
+        rprint(f"  [dim](padded {len(parts)}→{para_count} paras)[/dim]")
+        return "\n".join(padded[:para_count])
+
+    def _cheap_quality_gate(self, original, translation):
+        """True if Pass 2 can be skipped for a mid-length chunk.
+
+        Only chunks shorter than 2x min_review_chars qualify. The translation
+        must stay within length_ratio_band of the original, keep every
+        protected noun that occurs in the original, and have as many tags.
+        """
+        if not self.quality_gate or not original or len(original) >= 2 * self.min_review_chars:
+            return False
+        low, high = self.length_ratio_band
+        if not low <= len(translation) / len(original) <= high:
+            return False
+        if self._protected_re is not None:
+            found = set(self._protected_re.findall(original))
+            if found and not found <= set(self._protected_re.findall(translation)):
+                return False
+        return len(_HTML_TAG_RE.findall(original)) == len(_HTML_TAG_RE.findall(translation))
+
     @staticmethod
     def _is_quality_ok(review):
-        return any(tag in review for tag in ("QUALITY_OK", "QUALITAET_OK", "QUALITÄT_OK"))
+        return _QUALITY_OK_RE.search(review) is not None
 
     # ─── Prompt Builders ─────────────────────────────────────────────────
 
@@ -640,216 +1205,663 @@ class Claude3Pass(Base):
             return "(none)"
         return ", ".join(self.protected_nouns[:30])
 
-    def _pass1(self, text, batch_instruction=""):
-        system = SYSTEM_TRANSLATE.format(
-            source_language=self.source_language,
-            language=self.language,
-            style_instructions=self.style_instructions,
-            protected_nouns_section=self._protected_nouns_section(),
-            glossary=self._format_glossary() or "(none yet — beginning of book)",
-            context=self.context_summary or "(beginning of text)",
+    def _static_blocks(self):
+        """(translate, review, refine) static system blocks.
+
+        Formatted once and reused until the language pair, style instructions
+        or protected nouns change, so the large templates are not re-parsed on
+        every call.
+        """
+        key = (
+            self.source_language, self.language,
+            self.style_instructions, self._protected_nouns_section_str,
+        )
+        if self._static_blocks_cache[0] != key:
+            translate = SYSTEM_TRANSLATE_STATIC.format(
+                source_language=self.source_language,
+                language=self.language,
+                style_instructions=self.style_instructions,
+                protected_nouns_section=self._protected_nouns_section_str,
+            )
+            review = SYSTEM_REVIEW_STATIC.format(
+                source_language=self.source_language,
+                language=self.language,
+                style_instructions=self.style_instructions,
+                protected_nouns_list=self._protected_nouns_list_str,
+            )
+            refine = SYSTEM_REFINE_STATIC.format(
+                source_language=self.source_language,
+                language=self.language,
+            )
+            self._static_blocks_cache = (key, (translate, review, refine))
+        return self._static_blocks_cache[1]
+
+    def _pass1_prompt(self, text, batch_instruction=""):
+        static = self._static_blocks()[0]
+        glossary = self._glossary_block(SYSTEM_TRANSLATE_GLOSSARY, "(none yet — beginning of book)")
+        frozen = SYSTEM_TRANSLATE_FROZEN.format(context=self.context_frozen) if self.context_frozen else ""
+        if self.context_recent:
+            recent = self.context_recent
+        else:
+            recent = "(nothing new yet)" if self.context_frozen else "(beginning of text)"
+        dynamic = SYSTEM_TRANSLATE_DYNAMIC.format(
+            context=recent,
             batch_instruction=batch_instruction,
         )
         user = f"Translate the following {self.source_language} text into {self.language}:\n\n{text}"
-        return self._api_call(system, user, self.temp_translate)
+        return (static, glossary, frozen, dynamic), user
 
-    def _pass2(self, original, translation, is_batch=False):
+    def _pass2_prompt(self, original, translation, is_batch=False):
         batch_note = ""
         if is_batch:
             batch_note = (
                 f"\nNOTE: The text contains {PARA_DELIMITER} paragraph delimiters. "
                 f"Treat each delimited section as a separate paragraph for review."
             )
-        system = SYSTEM_REVIEW.format(
-            source_language=self.source_language,
-            language=self.language,
-            style_instructions=self.style_instructions,
-            protected_nouns_list=self._protected_nouns_list_short(),
-            glossary=self._format_glossary() or "(empty)",
-            batch_review_note=batch_note,
-        )
+        static = self._static_blocks()[1]
+        glossary = self._glossary_block(SYSTEM_REVIEW_GLOSSARY, "(empty)")
+        dynamic = SYSTEM_REVIEW_DYNAMIC.format(batch_review_note=batch_note)
         user = f"ORIGINAL ({self.source_language}):\n{original}\n\nTRANSLATION ({self.language}):\n{translation}"
-        return self._api_call(system, user, self.temp_review)
+        return (static, glossary, dynamic), user
 
-    def _pass3(self, original, translation, review, batch_instruction=""):
-        system = SYSTEM_REFINE.format(
-            source_language=self.source_language,
-            language=self.language,
-            glossary=self._format_glossary() or "(empty)",
-            batch_instruction=batch_instruction,
-        )
+    def _pass3_prompt(self, original, translation, review, batch_instruction=""):
+        static = self._static_blocks()[2]
+        glossary = self._glossary_block(SYSTEM_REFINE_GLOSSARY, "(empty)")
+        dynamic = SYSTEM_REFINE_DYNAMIC.format(batch_instruction=batch_instruction)
         user = (
             f"ORIGINAL ({self.source_language}):\n{original}\n\n"
             f"CURRENT TRANSLATION ({self.language}):\n{translation}\n\n"
             f"EDITOR REVIEW:\n{review}\n\n"
             f"Produce the corrected final {self.language} translation:"
         )
+        return (static, glossary, dynamic), user
+
+    def _pass1(self, text, batch_instruction=""):
+        system, user = self._pass1_prompt(text, batch_instruction)
+        return self._api_call(system, user, self.temp_translate)
+
+    def _pass2(self, original, translation, is_batch=False):
+        system, user = self._pass2_prompt(original, translation, is_batch)
+        return self._api_call(system, user, self.temp_review, stop_on_ok=True)
+
+    def _pass3(self, original, translation, review, batch_instruction=""):
+        system, user = self._pass3_prompt(original, translation, review, batch_instruction)
         return self._api_call(system, user, self.temp_refine)
 
     # ─── Context & Glossary ──────────────────────────────────────────────
 
-    def _maybe_update_context_glossary(self, original, translation):
-        if self.context_flag and self.chunk_counter % self.context_update_interval == 0:
+    def _maybe_update_context_glossary(self, original, translation, reviewed_ok=False):
+        """Sync entry point for _amaybe_update_context_glossary().
+
+        Runs on a private background event loop, so it also works when the
+        caller is itself inside a running loop.
+        """
+        if not self._update_due():
+            return
+        if self._update_loop is None:
+            self._update_loop = asyncio.new_event_loop()
+            self._update_thread = Thread(target=self._update_loop.run_forever, daemon=True)
+            self._update_thread.start()
+        asyncio.run_coroutine_threadsafe(
+            self._amaybe_update_context_glossary(original, translation, reviewed_ok),
+            self._update_loop,
+        ).result()
+
+    def _update_due(self):
+        return (
+            self._is_context_boundary(self.chunk_counter)
+            or self.chunk_counter % self.glossary_update_interval == 0
+        )
+
+    async def _amaybe_update_context_glossary(self, original, translation, reviewed_ok=False):
+        """Run the context and glossary updates due at this chunk concurrently.
+
+        reviewed_ok marks a translation that Pass 2 accepted as is; the context
+        summary then reads only the translation, not the original as well.
+        """
+        todo = []
+        if self._is_context_boundary(self.chunk_counter):
+            todo.append(self._run_context_update(original, translation, reviewed_ok))
+        if self.chunk_counter % self.glossary_update_interval == 0:
+            todo.append(self._run_glossary_update(original, translation))
+        for result in await asyncio.gather(*todo, return_exceptions=True):
+            if isinstance(result, Exception):
+                self._fire("on_error", result, "context_glossary_update")
+
+    async def _run_context_update(self, original, translation, reviewed_ok=False):
+        """Refresh the recent-events notes, then fold them in on freeze boundaries."""
+        if self.chunk_counter % self.context_update_interval == 0:
             try:
-                prev = self.context_summary
                 msg = (
-                    f"Previous summary:\n{prev}\n\n"
-                    f"New original text:\n{original[:1500]}\n\n"
-                    f"New translation:\n{translation[:1500]}"
-                ) if prev else f"Original:\n{original[:2000]}\n\nTranslation:\n{translation[:2000]}"
-                self.context_summary = self._api_call(
+                    f"Story so far:\n{self.context_frozen or '(beginning of book)'}\n\n"
+                    f"Recent events:\n{self.context_recent or '(none yet)'}\n\n"
+                )
+                if not reviewed_ok:
+                    msg += f"New original text:\n{original[:1500]}\n\n"
+                msg += f"New translation:\n{translation[:1500]}"
+                self.context_recent = await self._aapi_call(
                     SYSTEM_CONTEXT.format(language=self.language),
                     msg, 0.3, max_tokens=512, use_cache=False,
                 )
+                self._save_state()
                 self._fire("on_context_update", self.context_summary)
             except Exception as e:
                 self._fire("on_error", e, "context_update")
                 rprint(f"  [dim](context update failed: {e})[/dim]")
 
-        if self.chunk_counter % self.glossary_update_interval == 0:
+        if self.context_recent and self.chunk_counter % self.context_freeze_interval == 0:
             try:
                 msg = (
-                    f"ORIGINAL ({self.source_language}):\n{original[:2000]}\n\n"
-                    f"TRANSLATION ({self.language}):\n{translation[:2000]}"
+                    f"Story so far:\n{self.context_frozen or '(beginning of book)'}\n\n"
+                    f"Recent events:\n{self.context_recent}"
                 )
-                resp = self._api_call(
-                    SYSTEM_GLOSSARY.format(language=self.language),
-                    msg, 0.1, max_tokens=1024, use_cache=False,
+                self.context_frozen = await self._aapi_call(
+                    SYSTEM_CONTEXT_FOLD.format(language=self.language),
+                    msg, 0.3, max_tokens=768, use_cache=False,
                 )
-                resp = resp.strip()
-                if resp.startswith("```"):
-                    resp = resp.split("\n", 1)[1].rsplit("```", 1)[0]
-                new_terms = json.loads(resp)
-                if isinstance(new_terms, dict):
-                    # Filter out junk entries
-                    valid = {k: v for k, v in new_terms.items()
-                             if isinstance(k, str) and isinstance(v, str)
-                             and len(k) < 100 and len(v) < 200
-                             and not k.startswith("_")}
-                    if valid:
-                        with self._glossary_lock:
-                            self.glossary.update(valid)
-                        self._fire("on_glossary_update", valid)
-                        rprint(f"  [dim]+{len(valid)} glossary terms (total: {len(self.glossary)})[/dim]")
-            except json.JSONDecodeError as e:
+                self.context_recent = ""
+                self._save_state()
+                self._fire("on_context_update", self.context_summary)
+            except Exception as e:
+                self._fire("on_error", e, "context_fold")
+                rprint(f"  [dim](context fold failed: {e})[/dim]")
+
+    async def _run_glossary_update(self, original, translation):
+        try:
+            msg = (
+                f"ORIGINAL ({self.source_language}):\n{original[:2000]}\n\n"
+                f"TRANSLATION ({self.language}):\n{translation[:2000]}"
+            )
+            resp = await self._aapi_call(
+                SYSTEM_GLOSSARY.format(language=self.language),
+                msg, 0.1, max_tokens=1024, use_cache=False,
+            )
+            new_terms = _parse_glossary_json(resp)
+            if not new_terms:
                 self.glossary_extract_failures += 1
+                e = ValueError("no glossary JSON object in response")
                 self._fire("on_error", e, "glossary_parse")
                 if self.glossary_extract_failures <= 5:
                     rprint(f"  [dim](glossary JSON parse failed: {e})[/dim]")
                 elif self.glossary_extract_failures == 6:
                     rprint(f"  [dim](suppressing further glossary warnings)[/dim]")
-            except Exception as e:
-                self.glossary_extract_failures += 1
-                self._fire("on_error", e, "glossary_extraction")
-                if self.glossary_extract_failures <= 3:
-                    rprint(f"  [dim](glossary extraction failed: {e})[/dim]")
+                return
+            # Filter out junk entries
+            valid = {k: v for k, v in new_terms.items()
+                     if isinstance(k, str) and isinstance(v, str)
+                     and len(k) < 100 and len(v) < 200
+                     and not k.startswith("_")}
+            if valid:
+                with self._glossary_lock:
+                    self.glossary.update(valid)
+                    self._glossary_version += 1
+                self._save_state()
+                self._fire("on_glossary_update", valid)
+                self._log(f"  [dim]+{len(valid)} glossary terms (total: {len(self.glossary)})[/dim]")
+        except Exception as e:
+            self.glossary_extract_failures += 1
+            self._fire("on_error", e, "glossary_extraction")
+            if self.glossary_extract_failures <= 3:
+                rprint(f"  [dim](glossary extraction failed: {e})[/dim]")
+
+    def _glossary_block(self, template, empty):
+        """Formatted glossary system block, rebuilt only when the glossary changes."""
+        cached = self._glossary_block_cache.get(template)
+        if cached is None or cached[0] != self._glossary_version:
+            cached = (self._glossary_version, template.format(glossary=self._format_glossary() or empty))
+            self._glossary_block_cache[template] = cached
+        return cached[1]
 
     def _format_glossary(self):
+        """Sorted glossary listing, memoized until the glossary version changes."""
         with self._glossary_lock:
-            if not self.glossary:
-                return ""
+            if self._glossary_cached[0] == self._glossary_version:
+                return self._glossary_cached[1]
             lines = [f"  {src} → {tgt}" for src, tgt in sorted(self.glossary.items())
                      if not src.startswith("_")]
-        return "\n".join(lines[:60])
+            formatted = "\n".join(lines[:60])
+            self._glossary_cached = (self._glossary_version, formatted)
+        return formatted
 
     # ─── API Client with Prompt Caching ──────────────────────────────────
 
+    def _request_params(self, system, user, temperature, max_tokens=8192, use_cache=True):
+        """Build messages.create() kwargs; shared by direct calls and Message Batches.
+
+        `system` is either a plain string or a tuple of blocks from the pass
+        prompt builders: (static, glossary, [frozen context,] dynamic). Every
+        block but the last is its own cache breakpoint (empty ones are
+        dropped); the dynamic block is never cached, so recent-context changes
+        never invalidate the cached prefix.
+        """
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": self._system_blocks(system, use_cache),
+            "messages": [{"role": "user", "content": user}],
+        }
+
+    def _system_blocks(self, system, use_cache):
+        """System message for `system`, reused for identical prompts.
+
+        The last SYSTEM_BLOCK_CACHE_SIZE built lists are kept, so repeated
+        calls with the same prompt send the very same objects. Callers must
+        not mutate the result.
+        """
+        key = (system, use_cache)
+        system_msg = self._system_block_cache.pop(key, None)
+        if system_msg is None:
+            # Build system message — with or without cache control
+            if isinstance(system, tuple):
+                *cached, dynamic = system
+                system_msg = [{"type": "text", "text": block} for block in cached if block]
+                if use_cache:
+                    for block in system_msg:
+                        block["cache_control"] = {"type": "ephemeral"}
+                if dynamic.strip():
+                    system_msg.append({"type": "text", "text": dynamic})
+            elif use_cache:
+                system_msg = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"},
+                }]
+            else:
+                system_msg = system
+            if len(self._system_block_cache) >= SYSTEM_BLOCK_CACHE_SIZE:
+                del self._system_block_cache[next(iter(self._system_block_cache))]
+        # Re-insert so the dict stays in least-recently-used order
+        self._system_block_cache[key] = system_msg
+        return system_msg
+
+    def _track_usage(self, usage, output_tokens=None):
+        """Add a response's usage to the totals; output_tokens overrides usage.output_tokens."""
+        if output_tokens is None:
+            output_tokens = usage.output_tokens
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_create = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        self.total_input_tokens += usage.input_tokens
+        self.total_output_tokens += output_tokens
+        self.total_cache_read_tokens += cache_read
+        self.total_cache_create_tokens += cache_create
+        self.total_requests += 1
+
+        # input_tokens excludes cached tokens; without caching all three would
+        # have been billed as regular input
+        p = self._price
+        self._cost += (
+            usage.input_tokens * p["input"]
+            + output_tokens * p["output"]
+            + cache_read * p["cache_read"]
+            + cache_create * p["cache_write"]
+        ) / 1e6
+        self._cost_no_cache += (
+            (usage.input_tokens + cache_read + cache_create) * p["input"]
+            + output_tokens * p["output"]
+        ) / 1e6
+
     def _api_call(self, system, user, temperature, max_tokens=8192,
-                  retries=5, use_cache=True):
+                  retries=5, use_cache=True, stop_on_ok=False):
         """
         Make an API call with automatic prompt caching.
 
-        Prompt caching: the system prompt is marked with cache_control so that
-        repeated calls with the same system prompt get 90% input token discount.
+        Prompt caching: the static system block is marked with cache_control so
+        that repeated calls with the same prefix get 90% input token discount.
         First call: +25% cost for cache write. All subsequent: -90% for cache read.
         For 1,300+ translate() calls, this saves ~$40-60 on Opus.
+
+        stop_on_ok streams the response instead and returns "QUALITY_OK" as
+        soon as the opening text is that verdict (used for Pass 2 reviews).
         """
-        # Build system message — with or without cache control
-        if use_cache:
-            system_msg = [{
-                "type": "text",
-                "text": system,
-                "cache_control": {"type": "ephemeral"},
-            }]
-        else:
-            system_msg = system
+        kwargs = self._request_params(system, user, temperature, max_tokens, use_cache)
+
+        est_tokens = self._estimate_tokens(system, user, max_tokens)
 
         for attempt in range(retries):
             try:
-                kwargs = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                    "system": system_msg,
-                    "messages": [{"role": "user", "content": user}],
-                }
-
+                if self._rate_limiter:
+                    self._rate_limiter.acquire(est_tokens)
+                if stop_on_ok:
+                    return self._stream_until_ok(kwargs)
                 response = self.client.messages.create(**kwargs)
+                self._track_usage(response.usage)
+                return "".join(b.text for b in response.content if b.type == "text")
+
+            except Exception as e:
+                self._fire("on_error", e, "api_call")
+                if attempt < retries - 1:
+                    wait = self._retry_wait(e, attempt)
+                    self._flush_log()
+                    rprint(f"  [red]{type(e).__name__}, retry in {wait:.1f}s[/red]")
+                    time.sleep(wait)
+                else:
+                    raise
+        raise RuntimeError(f"Failed after {retries} retries")
+
+    def _stream_until_ok(self, kwargs):
+        """Stream a response, closing it early if it opens with QUALITY_OK.
+
+        A stream closed early never receives its final usage, so its output
+        tokens are estimated from the text received (see _early_stop_output_tokens()).
+        """
+        text = ""
+        with self.client.messages.stream(**kwargs) as stream:
+            checked = False
+            for chunk in stream.text_stream:
+                text += chunk
+                if not checked and len(text) >= REVIEW_VERDICT_CHARS:
+                    checked = True
+                    if self._is_quality_ok(text):
+                        usage = stream.current_message_snapshot.usage
+                        self._track_usage(usage, self._early_stop_output_tokens(usage, text))
+                        return "QUALITY_OK"
+            self._track_usage(stream.current_message_snapshot.usage)
+        return text
+
+    async def _astream_until_ok(self, client, kwargs):
+        """Async _stream_until_ok() on AsyncAnthropic."""
+        text = ""
+        async with client.messages.stream(**kwargs) as stream:
+            checked = False
+            async for chunk in stream.text_stream:
+                text += chunk
+                if not checked and len(text) >= REVIEW_VERDICT_CHARS:
+                    checked = True
+                    if self._is_quality_ok(text):
+                        usage = stream.current_message_snapshot.usage
+                        self._track_usage(usage, self._early_stop_output_tokens(usage, text))
+                        return "QUALITY_OK"
+            self._track_usage(stream.current_message_snapshot.usage)
+        return text
+
+    @staticmethod
+    def _early_stop_output_tokens(usage, received):
+        """Output tokens of a stream closed after the text received.
+
+        Its snapshot only counts output up to the message start, so the
+        received text is counted at ~4 characters per token instead, like
+        _estimate_tokens(). Tokens generated after the last chunk read are
+        missed, so this is a lower bound.
+        """
+        return max(usage.output_tokens, len(received) // 4)
+
+    @staticmethod
+    def _estimate_tokens(system, user, max_tokens):
+        """Rough upper bound on a request's tokens for the rate limiter."""
+        system_chars = sum(map(len, system)) if isinstance(system, tuple) else len(system)
+        return system_chars // 4 + len(user) // 4 + max_tokens
+
+    @staticmethod
+    def _retry_wait(error, attempt):
+        """Seconds to wait before retrying a failed API call.
+
+        Rate limits honour the server's Retry-After header when present,
+        timeouts back off briefly, everything else exponentially. All waits
+        are jittered so resumed runs do not retry in lockstep.
+        """
+        from anthropic import RateLimitError, APITimeoutError
 
-                # Track tokens
-                usage = response.usage
-                self.total_input_tokens += usage.input_tokens
-                self.total_output_tokens += usage.output_tokens
-                self.total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
-                self.total_cache_create_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                self.total_requests += 1
+        jitter = random.uniform(0.5, 1.5)
+        if isinstance(error, RateLimitError):
+            response = getattr(error, "response", None)
+            retry_after = response.headers.get("retry-after") if response is not None else None
+            try:
+                return float(retry_after) + jitter
+            except (TypeError, ValueError):
+                return min(60, 2 ** attempt * 5) * jitter
+        if isinstance(error, APITimeoutError):
+            return min(10, 1 + attempt) * jitter
+        return min(60, 2 ** attempt * 3) * jitter
+
+    def _async_client(self):
+        """(AsyncAnthropic client, request semaphore) for the running loop.
+
+        Entries of loops that have since closed are dropped; their
+        connections can no longer be closed cleanly and are left to the GC.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            from anthropic import AsyncAnthropic
+            for old in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[old]
+            entry = (AsyncAnthropic(**self._client_kwargs), asyncio.Semaphore(self.api_concurrency))
+            self._async_clients[loop] = entry
+        return entry
+
+    async def aclose(self):
+        """Close the async client of the running loop, if one was created."""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].close()
+
+    async def _adrain_update_loop(self):
+        """Let pending updates on the update loop finish, then aclose()."""
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.aclose()
+
+    def close(self):
+        """Wait for pending updates, then stop the background update loop
+        and close its async client.
+
+        Async callers should also await aclose() on their own loop. The
+        translator stays usable; a later update starts a new loop.
+        """
+        loop = self._update_loop
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._adrain_update_loop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._update_thread.join()
+        loop.close()
+        self._update_loop = self._update_thread = None
 
+    async def _aapi_call(self, system, user, temperature, max_tokens=8192,
+                         retries=5, use_cache=True, stop_on_ok=False):
+        """Async _api_call() on AsyncAnthropic, limited to api_concurrency requests."""
+        client, semaphore = self._async_client()
+
+        kwargs = self._request_params(system, user, temperature, max_tokens, use_cache)
+
+        est_tokens = self._estimate_tokens(system, user, max_tokens)
+
+        for attempt in range(retries):
+            try:
+                if self._rate_limiter:
+                    await self._rate_limiter.aacquire(est_tokens)
+                async with semaphore:
+                    if stop_on_ok:
+                        return await self._astream_until_ok(client, kwargs)
+                    response = await client.messages.create(**kwargs)
+                self._track_usage(response.usage)
                 return "".join(b.text for b in response.content if b.type == "text")
 
             except Exception as e:
                 self._fire("on_error", e, "api_call")
-                err = type(e).__name__
                 if attempt < retries - 1:
-                    wait = min(60, 2 ** attempt * (5 if "RateLimit" in err or "rate" in str(e).lower() else 3))
-                    rprint(f"  [red]{err}, retry in {wait}s[/red]")
-                    time.sleep(wait)
+                    wait = self._retry_wait(e, attempt)
+                    self._flush_log()
+                    rprint(f"  [red]{type(e).__name__}, retry in {wait:.1f}s[/red]")
+                    await asyncio.sleep(wait)
                 else:
                     raise
         raise RuntimeError(f"Failed after {retries} retries")
 
-    # ─── Cost Estimation ─────────────────────────────────────────────────
+    # ─── Message Batches API ─────────────────────────────────────────────
+    # Implements epub_loader's --batch / --batch-use protocol: the --batch run
+    # queues every paragraph and translates them through Message Batches, the
+    # --batch-use run builds the book from the stored results by index.
 
-    def _cost_estimate(self):
-        pricing = {
-            "claude-opus-4-20250514": {"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75},
-            "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0, "cache_read": 0.30, "cache_write": 3.75},
-        }
-        p = pricing.get(self.model, pricing["claude-sonnet-4-20250514"])
-
-        # Tokens that hit the cache don't count as regular input
-        uncached_input = self.total_input_tokens - self.total_cache_read_tokens - self.total_cache_create_tokens
-        cost = (
-            max(0, uncached_input) / 1e6 * p["input"]
-            + self.total_output_tokens / 1e6 * p["output"]
-            + self.total_cache_read_tokens / 1e6 * p["cache_read"]
-            + self.total_cache_create_tokens / 1e6 * p["cache_write"]
-        )
-        # What it would have cost without caching
-        cost_no_cache = (
-            self.total_input_tokens / 1e6 * p["input"]
-            + self.total_output_tokens / 1e6 * p["output"]
-        )
-        return cost, cost_no_cache
+    def batch_init(self, book_name):
+        self.book_name = re.sub(r"[^\w\-_\.]", "_", book_name).strip("._")
 
-    def _estimate_delta_cost(self, delta):
-        """Estimate cost for a token usage delta (input, output, cache_read, cache_create)."""
-        pricing = {
-            "claude-opus-4-20250514": {"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75},
-            "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0, "cache_read": 0.30, "cache_write": 3.75},
-        }
-        p = pricing.get(self.model, pricing["claude-sonnet-4-20250514"])
-        d_in, d_out, d_cache_read, d_cache_create = delta
-        uncached = d_in - d_cache_read - d_cache_create
-        return (
-            max(0, uncached) / 1e6 * p["input"]
-            + d_out / 1e6 * p["output"]
-            + d_cache_read / 1e6 * p["cache_read"]
-            + d_cache_create / 1e6 * p["cache_write"]
+    def add_to_batch_translate_queue(self, book_index, text):
+        self.batch_text_list.append({"book_index": book_index, "text": text})
+
+    def batch_results_path(self):
+        return os.path.join(os.getcwd(), "batch_files", f"{self.book_name}_3pass.json")
+
+    def batch(self):
+        """Translate all queued paragraphs via Message Batches and save the results."""
+        translations = self.translate_batched(
+            [item["text"] for item in self.batch_text_list]
         )
+        results = {
+            str(item["book_index"]): text
+            for item, text in zip(self.batch_text_list, translations)
+        }
+        path = self.batch_results_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_json_dumps({
+                "book_id": self.book_name,
+                "batch_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "model": self.model,
+                "results": results,
+            }))
+        rprint(f"  [bold green]Batch results saved: {path}[/bold green]")
+
+    def is_completed_batch(self):
+        if not os.path.exists(self.batch_results_path()):
+            rprint("[red]Batch result file does not exist[/red]")
+            raise Exception("Batch result file does not exist. Run with --batch first")
+        return True
+
+    def batch_translate(self, book_index):
+        if self._batch_results is None:
+            with open(self.batch_results_path(), "rb") as f:
+                self._batch_results = _json_loads(f.read())["results"]
+        try:
+            return self._batch_results[str(book_index)]
+        except KeyError:
+            raise ValueError(f"No batch result found for book_index {book_index}")
+
+    def translate_batched(self, paragraphs):
+        """Run the 3-pass pipeline over many paragraphs as three Message Batches.
+
+        Pass 1 covers every paragraph, Pass 2 the ones long enough for review,
+        Pass 3 only those whose review did not return QUALITY_OK. Glossary and
+        context are not updated mid-run, so callers should only use this with
+        context_flag off.
+        """
+        ids = [f"p{i}" for i in range(len(paragraphs))]
+        originals = dict(zip(ids, paragraphs))
+
+        rprint(f"  [cyan]BATCH P1 ({len(ids)}p)[/cyan]")
+        translations = self._run_message_batch({
+            cid: (*self._pass1_prompt(text), self.temp_translate)
+            for cid, text in originals.items()
+        })
+
+        reviews = {}
+        if not self.skip_review:
+            to_review = [cid for cid in ids if len(originals[cid]) >= self.min_review_chars]
+            gated = {cid for cid in to_review if self._cheap_quality_gate(originals[cid], translations[cid])}
+            self.reviews_skipped_local += len(gated)
+            to_review = [cid for cid in to_review if cid not in gated]
+            if to_review:
+                rprint(f"  [cyan]BATCH P2 ({len(to_review)}p)[/cyan]")
+                reviews = self._run_message_batch({
+                    cid: (*self._pass2_prompt(originals[cid], translations[cid]), self.temp_review)
+                    for cid in to_review
+                })
+
+        refined = {}
+        to_refine = [cid for cid, review in reviews.items() if not self._is_quality_ok(review)]
+        if to_refine:
+            rprint(f"  [cyan]BATCH P3 ({len(to_refine)}p)[/cyan]")
+            refined = self._run_message_batch({
+                cid: (*self._pass3_prompt(originals[cid], translations[cid], reviews[cid]), self.temp_refine)
+                for cid in to_refine
+            })
+
+        results = []
+        for cid in ids:
+            self.chunk_counter += 1
+            if cid in refined:
+                self.full_3pass_count += 1
+                self.reviews_fixed += 1
+                text, passes_used, quality_ok = refined[cid], 3, False
+            elif cid in reviews:
+                self.full_3pass_count += 1
+                self.reviews_ok += 1
+                text, passes_used, quality_ok = translations[cid], 2, True
+            else:
+                self.pass1_only_count += 1
+                text, passes_used, quality_ok = translations[cid], 1, True
+
+            self._fire("on_chunk_complete", ChunkEvent(
+                chunk_number=self.chunk_counter,
+                original_text=originals[cid],
+                translated_text=text,
+                passes_used=passes_used,
+                quality_ok=quality_ok,
+                is_batch=False,
+                paragraph_count=1,
+            ))
+            results.append(text)
+
+        self._print_stats()
+        return results
+
+    def _run_message_batch(self, calls):
+        """Submit {custom_id: (system, user, temperature)} as Message Batches and wait.
+
+        Returns {custom_id: text}. Batches still running batch_timeout
+        seconds after submission are cancelled; requests that did not succeed
+        inside a batch are retried synchronously through _api_call.
+        """
+        ids = list(calls)
+        batch_ids = []
+        for start in range(0, len(ids), BATCH_MAX_REQUESTS):
+            batch = self.client.messages.batches.create(requests=[
+                {"custom_id": cid, "params": self._request_params(*calls[cid])}
+                for cid in ids[start:start + BATCH_MAX_REQUESTS]
+            ])
+            batch_ids.append(batch.id)
+
+        deadline = time.monotonic() + self.batch_timeout
+        texts = {}
+        for batch_id in batch_ids:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            while batch.processing_status != "ended":
+                # A cancelled batch still ends with the results that finished
+                if batch.processing_status != "canceling" and time.monotonic() >= deadline:
+                    rprint(f"  [yellow]{batch_id}: not done after {self.batch_timeout}s, cancelling[/yellow]")
+                    batch = self.client.messages.batches.cancel(batch_id)
+                    continue
+                rprint(f"  [dim]{batch_id}: {batch.request_counts.processing} processing[/dim]")
+                time.sleep(BATCH_POLL_INTERVAL)
+                batch = self.client.messages.batches.retrieve(batch_id)
+
+            for entry in self.client.messages.batches.results(batch_id):
+                if entry.result.type != "succeeded":
+                    continue
+                message = entry.result.message
+                self._track_usage(message.usage)
+                texts[entry.custom_id] = "".join(
+                    b.text for b in message.content if b.type == "text"
+                )
+
+        for cid in ids:
+            if cid not in texts:
+                rprint(f"  [yellow]{cid}: batch request failed, retrying directly[/yellow]")
+                texts[cid] = self._api_call(*calls[cid])
+        return texts
+
+    # ─── Cost Estimation ─────────────────────────────────────────────────
+
+    def _cost_estimate(self):
+        """(cost, cost without caching) so far, in USD."""
+        return self._cost, self._cost_no_cache
 
     # ─── Stats ───────────────────────────────────────────────────────────
 
     def _print_stats(self):
+        self._flush_log()
         cost, cost_no_cache = self._cost_estimate()
         saved = cost_no_cache - cost
 
@@ -857,7 +1869,7 @@ class Claude3Pass(Base):
         rprint(f"  API calls: {self.total_requests:,} | {self.total_input_tokens:,} in / {self.total_output_tokens:,} out")
         if self.total_cache_read_tokens > 0:
             rprint(f"  Cache: {self.total_cache_read_tokens:,} read / {self.total_cache_create_tokens:,} write (saved ${saved:.2f})")
-        rprint(f"  P1-only: {self.pass1_only_count} | 3-pass: {self.full_3pass_count} | OK: {self.reviews_ok} | fixed: {self.reviews_fixed}")
+        rprint(f"  P1-only: {self.pass1_only_count} | 3-pass: {self.full_3pass_count} | OK: {self.reviews_ok} | fixed: {self.reviews_fixed} | gated: {self.reviews_skipped_local}")
         rprint(f"  Glossary: {len(self.glossary)} terms | Cost: ${cost:.2f}")
         rprint(f"[bold blue]{'-' * 50}[/bold blue]\n")
 
@@ -867,6 +1879,7 @@ class Claude3Pass(Base):
         if self.total_requests == 0:
             return
         try:
+            self._flush_log()
             cost, cost_no_cache = self._cost_estimate()
             saved = cost_no_cache - cost
 
@@ -879,11 +1892,14 @@ class Claude3Pass(Base):
             rprint(f"  API calls: {self.total_requests:,}")
             rprint(f"  Tokens: {self.total_input_tokens:,} input / {self.total_output_tokens:,} output")
             if self.total_cache_read_tokens > 0:
-                pct = self.total_cache_read_tokens / max(1, self.total_input_tokens) * 100
+                all_input = self.total_input_tokens + self.total_cache_read_tokens + self.total_cache_create_tokens
+                pct = self.total_cache_read_tokens / all_input * 100
                 rprint(f"  Prompt cache hit rate: {pct:.0f}%")
                 rprint(f"  Cache savings: ${saved:.2f}")
             rprint(f"  Pass 1 only: {self.pass1_only_count} | Full 3-pass: {self.full_3pass_count}")
             rprint(f"  Reviews OK: {self.reviews_ok} | Reviews with fixes: {self.reviews_fixed}")
+            if self.reviews_skipped_local > 0:
+                rprint(f"  Reviews skipped by local check: {self.reviews_skipped_local}")
             rprint(f"  Glossary terms: {len(self.glossary)}")
             if self.glossary_extract_failures > 0:
                 rprint(f"  Glossary extraction failures: {self.glossary_extract_failures}")
@@ -75,6 +75,24 @@ def parse_args(argv=None):
         default=0,
         help="Limit translation to N paragraphs (0 = full book, default: 0)",
     )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=0,
+        help="Limit translation API requests per minute (0 = unlimited, default: 0)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=0,
+        help="Limit translation API tokens per minute (0 = unlimited, default: 0)",
+    )
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Run the fixed pipeline in-process instead of through the agent "
+             "(faster; uses 3pass-sonnet for --model auto and no separate test run)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -88,6 +106,26 @@ def main(argv=None):
     """Main entry point."""
     args = parse_args(argv)
 
+    if args.direct:
+        from .pipeline import run_pipeline
+
+        asyncio.run(run_pipeline(
+            book_path=args.book_path,
+            language=args.language,
+            model=args.model,
+            profile_path=args.profile_path,
+            source_lang=args.source_lang,
+            profiles_dir=args.profiles_dir,
+            report_dir=args.report_dir,
+            skip_analysis=args.skip_analysis,
+            skip_quality_check=args.skip_quality_check,
+            resume=args.resume,
+            test_num=args.test_num,
+            rpm=args.rpm,
+            tpm=args.tpm,
+        ))
+        return
+
     from .orchestrator import run_orchestrator
 
     asyncio.run(run_orchestrator(
@@ -104,6 +142,8 @@ def main(argv=None):
         resume=args.resume,
         verbose=args.verbose,
         test_num=args.test_num,
+        rpm=args.rpm,
+        tpm=args.tpm,
     ))
 
 
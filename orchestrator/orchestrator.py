@@ -12,21 +12,30 @@ Manages the full translation workflow:
 import asyncio
 import json
 import os
+import sys
 from pathlib import Path
 
 from claude_agent_sdk import (
-    query,
+    ClaudeSDKClient,
     ClaudeAgentOptions,
     AgentDefinition,
     AssistantMessage,
     ResultMessage,
     TextBlock,
+    ToolUseBlock,
 )
 
 from .tools import create_mcp_server, TOOL_NAMES
 
 
+# Buffered agent output is written out once it exceeds this many characters
+OUTPUT_FLUSH_CHARS = 4096
+
+
 # ─── System Prompt ────────────────────────────────────────────────────────────
+# The agent runtime sends the system prompt and subagent prompts as a cached
+# prefix, so they must stay byte-identical between runs: keep anything
+# run-specific (book path, language, steps) in _build_prompt() instead.
 
 ORCHESTRATOR_SYSTEM_PROMPT = """\
 You are a literary translation orchestrator. You manage the complete workflow \
@@ -73,6 +82,26 @@ A 100k-word book with block_size=1500:
 
 # ─── Subagent Definitions ────────────────────────────────────────────────────
 
+_ANALYZER_TOOLS = (
+    "mcp__translation-orchestrator__analyze_book",
+    "mcp__translation-orchestrator__list_profiles",
+)
+_PROFILE_TOOLS = (
+    "mcp__translation-orchestrator__list_profiles",
+    "mcp__translation-orchestrator__create_profile",
+)
+_REVIEWER_TOOLS = (
+    "mcp__translation-orchestrator__extract_paragraphs",
+    "mcp__translation-orchestrator__quality_spot_check",
+    "mcp__translation-orchestrator__quality_spot_check_batch",
+)
+
+# The orchestrator itself may call every tool. "Task" is the one built-in
+# tool it gets: it launches the subagents above, each limited to its own
+# tools (see "Orchestrator Permissions" in docs/architecture.md)
+_ALLOWED_TOOLS = tuple(TOOL_NAMES) + ("Task",)
+
+
 def _get_agents():
     """Define subagents for specialized tasks."""
     return {
@@ -87,10 +116,7 @@ You are a book analysis specialist. When given a book file:
 5. Report your findings clearly with cost estimates
 
 Be concise and actionable in your recommendations.""",
-            tools=[
-                "mcp__translation-orchestrator__analyze_book",
-                "mcp__translation-orchestrator__list_profiles",
-            ],
+            tools=_ANALYZER_TOOLS,
             model="sonnet",
         ),
         "profile-creator": AgentDefinition(
@@ -109,10 +135,7 @@ When creating profiles:
 - For non-fiction: temp_translate=0.2, temp_review=0.3, temp_refine=0.15
 
 Be thorough in setting protected nouns from the book's character/place names.""",
-            tools=[
-                "mcp__translation-orchestrator__list_profiles",
-                "mcp__translation-orchestrator__create_profile",
-            ],
+            tools=_PROFILE_TOOLS,
             model="sonnet",
         ),
         "quality-reviewer": AgentDefinition(
@@ -120,17 +143,15 @@ Be thorough in setting protected nouns from the book's character/place names."""
             prompt="""\
 You are a translation quality reviewer. Your job is to:
 1. Use extract_paragraphs to get sample pairs from original and translated books
-2. Use quality_spot_check on each pair to evaluate quality
+2. Use quality_spot_check_batch on the extracted pairs to evaluate them all at once
+   (quality_spot_check scores a single pair)
 3. Identify systemic issues (consistent errors across samples)
 4. Provide an overall quality score and detailed feedback
 
 Check at least 10 samples using evenly_spaced strategy for representativeness.
 Report both individual scores and overall average.
 Flag any samples scoring below 3.0 as needing attention.""",
-            tools=[
-                "mcp__translation-orchestrator__extract_paragraphs",
-                "mcp__translation-orchestrator__quality_spot_check",
-            ],
+            tools=_REVIEWER_TOOLS,
             model="sonnet",
         ),
     }
@@ -156,6 +177,8 @@ class TranslationOrchestrator:
         resume: bool = False,
         verbose: bool = False,
         test_num: int = 0,
+        rpm: int = 0,
+        tpm: int = 0,
     ):
         self.book_path = book_path
         self.language = language
@@ -170,14 +193,32 @@ class TranslationOrchestrator:
         self.resume = resume
         self.verbose = verbose
         self.test_num = test_num
+        self.rpm = rpm
+        self.tpm = tpm
+        self._out = []
+        self._out_chars = 0
 
     async def run(self):
         """Execute the full orchestration workflow."""
+        await self._run_all([self])
+
+    @classmethod
+    async def run_many(cls, jobs: list[dict]):
+        """Run the workflow for several books over one agent session.
+
+        Each job is a dict of constructor arguments. Sharing the client keeps
+        the system prompt and subagent definitions in the prompt cache from
+        one book to the next instead of paying to write them again per book.
+        """
+        await cls._run_all([cls(**job) for job in jobs])
+
+    @staticmethod
+    async def _run_all(orchestrators: list["TranslationOrchestrator"]):
         mcp_server = create_mcp_server()
 
         options = ClaudeAgentOptions(
             mcp_servers={"translation-orchestrator": mcp_server},
-            allowed_tools=TOOL_NAMES,
+            allowed_tools=_ALLOWED_TOOLS,
             agents=_get_agents(),
             system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
             permission_mode="bypassPermissions",
@@ -185,8 +226,15 @@ class TranslationOrchestrator:
             max_turns=30,
         )
 
-        prompt = self._build_prompt()
+        async with ClaudeSDKClient(options=options) as client:
+            for orchestrator in orchestrators:
+                orchestrator._print_header()
+                await client.query(orchestrator._build_prompt())
+                async for message in client.receive_response():
+                    orchestrator._handle_message(message)
+                orchestrator._flush_output()
 
+    def _print_header(self):
         print(f"Starting translation orchestrator for: {self.book_path}")
         print(f"Target language: {self.language}")
         print(f"Model: {self.model}")
@@ -196,59 +244,78 @@ class TranslationOrchestrator:
             print(f"Profile: {self.profile_path}")
         print()
 
-        async for message in query(prompt=prompt, options=options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print(block.text)
-            elif isinstance(message, ResultMessage):
-                if self.verbose:
-                    print(f"[Result: cost=${message.cost_usd:.4f}]" if hasattr(message, 'cost_usd') else "[Done]")
+    def _handle_message(self, message):
+        if isinstance(message, AssistantMessage):
+            calls_tools = False
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    self._write_line(block.text)
+                elif isinstance(block, ToolUseBlock):
+                    calls_tools = True
+            # Don't hold text back while the agent goes off to run tools
+            if calls_tools:
+                self._flush_output()
+        elif isinstance(message, ResultMessage):
+            self._flush_output()
+            usage = getattr(message, "usage", None) or {}
+            cache_read = usage.get("cache_read_input_tokens", 0)
+            cache_write = usage.get("cache_creation_input_tokens", 0)
+            if cache_read or cache_write:
+                print(f"[Prompt cache: {cache_read:,} tokens read / {cache_write:,} written]")
+            if self.verbose:
+                print(f"[Result: cost=${message.cost_usd:.4f}]" if hasattr(message, 'cost_usd') else "[Done]")
+
+    def _write_line(self, text: str):
+        # Agent text often arrives as many short blocks; collect those and
+        # write them together instead of one print() per block. The buffer
+        # also goes out before tool calls and at the end of each job.
+        self._out.append(text + "\n")
+        self._out_chars += len(text) + 1
+        if self._out_chars > OUTPUT_FLUSH_CHARS:
+            self._flush_output()
+
+    def _flush_output(self):
+        if self._out:
+            sys.stdout.write("".join(self._out))
+            sys.stdout.flush()
+            self._out.clear()
+            self._out_chars = 0
 
     def _build_prompt(self) -> str:
         """Build the orchestration prompt from CLI options."""
-        parts = [f"Translate the book at: {self.book_path}"]
-        parts.append(f"Target language: {self.language}")
-
-        if self.model != "auto":
-            parts.append(f"Use model: {self.model}")
-        else:
-            parts.append("Choose the best model (sonnet for most, opus for literary fiction)")
-
-        if self.source_lang != "auto":
-            parts.append(f"Source language: {self.source_lang}")
-
-        if self.profile_path:
-            parts.append(f"Use translation profile: {self.profile_path}")
-        else:
-            parts.append(f"Check profiles in: {self.profiles_dir}")
-
-        steps = []
-        if not self.skip_analysis:
-            steps.append("1. Analyze the book (metadata, language, genre, cost estimate)")
-        if not self.profile_path:
-            steps.append("2. Select or create an appropriate translation profile")
-        if self.test_num > 0:
-            steps.append(f"3. Skip separate test — translate {self.test_num} paragraphs "
-                         f"(test_mode=true, test_num={self.test_num})")
-        else:
-            if not self.skip_test:
-                steps.append("3. Run a test translation (5 paragraphs) and verify quality")
-            steps.append("4. Run the full translation")
-        if not self.skip_quality_check:
-            n = min(5, self.test_num) if self.test_num > 0 else 10
-            steps.append(f"5. Quality spot-check ({n} samples)")
-        steps.append("6. Generate a report")
-
-        parts.append(f"\nFollow these steps:\n" + "\n".join(steps))
-
-        if self.resume:
-            parts.append("\nResume any interrupted translation (resume=true).")
-
+        test_num = self.test_num
         report_path = os.path.join(self.report_dir, "translation_report.md")
-        parts.append(f"\nSave the final report to: {report_path}")
 
-        return "\n".join(parts)
+        steps = [
+            (not self.skip_analysis,
+             "1. Analyze the book (metadata, language, genre, cost estimate)"),
+            (not self.profile_path,
+             "2. Select or create an appropriate translation profile"),
+            (test_num > 0,
+             f"3. Skip separate test — translate {test_num} paragraphs "
+             f"(test_mode=true, test_num={test_num})"),
+            (test_num <= 0 and not self.skip_test,
+             "3. Run a test translation (5 paragraphs) and verify quality"),
+            (test_num <= 0, "4. Run the full translation"),
+            (not self.skip_quality_check,
+             f"5. Quality spot-check ({min(5, test_num) if test_num > 0 else 10} samples)"),
+            (True, "6. Generate a report"),
+        ]
+        lines = [
+            (True, f"Translate the book at: {self.book_path}"),
+            (True, f"Target language: {self.language}"),
+            (self.model != "auto", f"Use model: {self.model}"),
+            (self.model == "auto", "Choose the best model (sonnet for most, opus for literary fiction)"),
+            (self.source_lang != "auto", f"Source language: {self.source_lang}"),
+            (bool(self.profile_path), f"Use translation profile: {self.profile_path}"),
+            (not self.profile_path, f"Check profiles in: {self.profiles_dir}"),
+            (True, "\nFollow these steps:\n" + "\n".join(step for want, step in steps if want)),
+            (self.resume, "\nResume any interrupted translation (resume=true)."),
+            (bool(self.rpm or self.tpm),
+             f"\nPass rpm={self.rpm} and tpm={self.tpm} to every run_translation call."),
+            (True, f"\nSave the final report to: {report_path}"),
+        ]
+        return "\n".join(line for want, line in lines if want)
 
 
 async def run_orchestrator(**kwargs):
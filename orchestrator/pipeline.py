@@ -0,0 +1,153 @@
+"""In-process translation pipeline — the orchestrator workflow without the agent.
+
+Runs the same steps the agent would (analyze, select profile, translate,
+quality-check, report) by calling the tool functions directly. Nothing goes
+through the Agent SDK, so there is no CLI subprocess to start and no
+JSON-RPC round trip per tool call; in exchange, the choices the agent would
+make (model, profile) follow fixed rules instead.
+"""
+
+import asyncio
+import os
+
+from .tools import (
+    analyze_book_dict,
+    list_profiles_dict,
+    run_translation_dict,
+    extract_paragraphs_dict,
+    quality_spot_check_batch,
+    generate_report_async,
+)
+from .tools._json import dumps, loads
+from .tools.translate import language_to_name
+
+# Profile used when none is given and the profiles directory has one
+DEFAULT_PROFILE = "default.json"
+
+# Model used when the agent would otherwise choose ("auto")
+DEFAULT_MODEL = "3pass-sonnet"
+
+
+async def run_pipeline(
+    book_path: str,
+    language: str = "de",
+    model: str = "auto",
+    profile_path: str = "",
+    source_lang: str = "auto",
+    profiles_dir: str = "examples/profiles",
+    report_dir: str = ".",
+    skip_analysis: bool = False,
+    skip_quality_check: bool = False,
+    resume: bool = False,
+    test_num: int = 0,
+    rpm: int = 0,
+    tpm: int = 0,
+) -> dict:
+    """Translate a book and report on it, calling the tools in-process.
+
+    Args mirror TranslationOrchestrator. model="auto" means DEFAULT_MODEL;
+    without profile_path, DEFAULT_PROFILE from profiles_dir is used if it
+    exists.
+
+    Returns:
+        The report tool's result, or an error dict from the step that failed.
+    """
+    if model == "auto":
+        model = DEFAULT_MODEL
+
+    print(f"Starting translation pipeline for: {book_path}")
+    print(f"Target language: {language}")
+    print(f"Model: {model}")
+    if test_num > 0:
+        print(f"Limited to: {test_num} paragraphs")
+
+    # Steps 1-2: analysis and the profile listing don't depend on each other
+    analysis, profiles = await asyncio.gather(
+        asyncio.to_thread(analyze_book_dict, book_path, 3)
+        if not skip_analysis else _done({}),
+        asyncio.to_thread(list_profiles_dict, profiles_dir)
+        if not profile_path else _done({}),
+    )
+    if analysis.get("error"):
+        print(f"Analysis failed: {analysis['error']}")
+        return analysis
+    if analysis:
+        print(f"Analyzed: {analysis.get('title') or book_path} — "
+              f"{analysis.get('estimated_words', '?')} words, "
+              f"language {analysis.get('detected_language', '?')}")
+
+    if not profile_path:
+        profile_path = next(
+            (p["path"] for p in profiles.get("profiles", []) if p.get("file") == DEFAULT_PROFILE),
+            "",
+        )
+    print(f"Profile: {profile_path or 'none'}")
+
+    # Step 3: translate
+    result = await asyncio.to_thread(
+        run_translation_dict,
+        book_path=book_path,
+        language=language,
+        model=model,
+        profile_path=profile_path,
+        test_mode=test_num > 0,
+        test_num=test_num,
+        resume=resume,
+        source_lang=source_lang,
+        rpm=rpm,
+        tpm=tpm,
+    )
+    if result.get("error"):
+        print(f"Translation failed: {result['error']}")
+        return result
+    stats = result.get("stats", {})
+    print(f"Translated: {result.get('output_path')} "
+          f"(${stats.get('cost_estimate', 0):.2f})")
+
+    # Steps 4-6: the report renders its other sections while the
+    # spot-checks run
+    target_language = language_to_name(language)
+    source_code = source_lang if source_lang != "auto" else analysis.get("detected_language", "")
+    source_language = language_to_name(source_code, "English")
+    output_path = result.get("output_path", "")
+    # Paragraph pairs can only be extracted from EPUBs
+    if skip_quality_check or not output_path.endswith(".epub"):
+        quality = _done([])
+    else:
+        quality = asyncio.create_task(asyncio.to_thread(
+            _spot_check, book_path, output_path, test_num, source_language, target_language,
+        ))
+
+    report = loads(await generate_report_async(
+        translation_stats=stats,
+        quality_results=quality,
+        book_metadata=analysis,
+        profile_name=result.get("profile") or "Default",
+        model_used=result.get("model", model),
+        output_path=os.path.join(report_dir, "translation_report.md"),
+    ))
+    print(f"Report saved to: {report.get('path')}")
+    return report
+
+
+def _spot_check(original_path, translated_path, test_num, source_language, target_language) -> list:
+    """Scored sample pairs of the translated book; empty if none can be extracted."""
+    pairs = extract_paragraphs_dict(
+        original_path, translated_path,
+        sample_count=min(5, test_num) if test_num > 0 else 10,
+    )
+    if not pairs.get("pairs"):
+        print(f"Quality check skipped: {pairs.get('error', 'no pairs')}")
+        return []
+    checked = loads(quality_spot_check_batch(
+        dumps(pairs["pairs"]), source_language, target_language,
+    ))
+    if checked.get("error"):
+        print(f"Quality check failed: {checked['error']}")
+        return []
+    print(f"Quality: {checked.get('average')}/5 over {checked.get('checked')} samples")
+    return checked["results"]
+
+
+async def _done(value):
+    return value
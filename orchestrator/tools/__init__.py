@@ -4,11 +4,21 @@ Tools are plain Python functions that can be called directly or wrapped
 in the Claude Agent SDK's MCP server for use by agents.
 """
 
-from .analyze import analyze_book
-from .profiles import list_profiles, create_profile
-from .translate import run_translation
-from .quality import extract_paragraphs, quality_spot_check
-from .report import generate_report
+import asyncio
+
+from .analyze import analyze_book, analyze_book_dict
+from .profiles import list_profiles, list_profiles_dict, create_profile
+from .translate import run_translation, run_translation_dict
+from .quality import (
+    extract_paragraphs, extract_paragraphs_dict,
+    quality_spot_check, quality_spot_check_dict, quality_spot_check_batch,
+)
+from .report import generate_report, generate_report_async
+
+
+def _text(result: str) -> dict:
+    """Wrap a tool's string result in the MCP text-content envelope."""
+    return {"content": [{"type": "text", "text": result}]}
 
 
 def create_mcp_server():
@@ -25,11 +35,12 @@ def create_mcp_server():
         {"book_path": str, "sample_count": int},
     )
     async def analyze_book_tool(args):
-        result = analyze_book(
+        result = await asyncio.to_thread(
+            analyze_book,
             book_path=args["book_path"],
             sample_count=args.get("sample_count", 5),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
 
     @tool(
         "list_profiles",
@@ -37,8 +48,11 @@ def create_mcp_server():
         {"profiles_dir": str},
     )
     async def list_profiles_tool(args):
-        result = list_profiles(profiles_dir=args.get("profiles_dir", "examples/profiles"))
-        return {"content": [{"type": "text", "text": result}]}
+        result = await asyncio.to_thread(
+            list_profiles,
+            profiles_dir=args.get("profiles_dir", "examples/profiles"),
+        )
+        return _text(result)
 
     @tool(
         "create_profile",
@@ -64,7 +78,8 @@ def create_mcp_server():
         },
     )
     async def create_profile_tool(args):
-        result = create_profile(
+        result = await asyncio.to_thread(
+            create_profile,
             name=args["name"],
             output_path=args["output_path"],
             description=args.get("description", ""),
@@ -79,7 +94,7 @@ def create_mcp_server():
             context_update_interval=args.get("context_update_interval", 15),
             glossary_update_interval=args.get("glossary_update_interval", 20),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
 
     @tool(
         "run_translation",
@@ -98,12 +113,20 @@ def create_mcp_server():
                 "block_size": {"type": "integer"},
                 "resume": {"type": "boolean"},
                 "source_lang": {"type": "string"},
+                "batch_api": {
+                    "type": "boolean",
+                    "description": "Use Anthropic Message Batches (50% cheaper, slower). "
+                                   "Requires use_context=false and resume=false",
+                },
+                "rpm": {"type": "integer", "description": "Requests per minute limit (default: 0, no limit)"},
+                "tpm": {"type": "integer", "description": "Tokens per minute limit (default: 0, no limit)"},
             },
             "required": ["book_path"],
         },
     )
     async def run_translation_tool(args):
-        result = run_translation(
+        result = await asyncio.to_thread(
+            run_translation,
             book_path=args["book_path"],
             language=args.get("language", "de"),
             model=args.get("model", "3pass-sonnet"),
@@ -115,8 +138,11 @@ def create_mcp_server():
             block_size=args.get("block_size", 1500),
             resume=args.get("resume", False),
             source_lang=args.get("source_lang", "auto"),
+            batch_api=args.get("batch_api", False),
+            rpm=args.get("rpm", 0),
+            tpm=args.get("tpm", 0),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
 
     @tool(
         "extract_paragraphs",
@@ -133,13 +159,14 @@ def create_mcp_server():
         },
     )
     async def extract_paragraphs_tool(args):
-        result = extract_paragraphs(
+        result = await asyncio.to_thread(
+            extract_paragraphs,
             original_path=args["original_path"],
             translated_path=args["translated_path"],
             sample_count=args.get("sample_count", 10),
             strategy=args.get("strategy", "evenly_spaced"),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
 
     @tool(
         "quality_spot_check",
@@ -158,7 +185,8 @@ def create_mcp_server():
         },
     )
     async def quality_spot_check_tool(args):
-        result = quality_spot_check(
+        result = await asyncio.to_thread(
+            quality_spot_check,
             original_text=args["original_text"],
             translated_text=args["translated_text"],
             source_language=args.get("source_language", "English"),
@@ -166,7 +194,43 @@ def create_mcp_server():
             style_instructions=args.get("style_instructions", ""),
             protected_nouns=args.get("protected_nouns", ""),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
+
+    @tool(
+        "quality_spot_check_batch",
+        "Evaluate translation quality of many paragraph pairs at once using Claude (concurrent).",
+        {
+            "type": "object",
+            "properties": {
+                "pairs": {
+                    "type": "string",
+                    "description": "JSON list of {original, translated} objects, "
+                                   "or the extract_paragraphs result as-is",
+                },
+                "source_language": {"type": "string"},
+                "target_language": {"type": "string"},
+                "style_instructions": {"type": "string"},
+                "protected_nouns": {"type": "string"},
+                "batch_api": {
+                    "type": "boolean",
+                    "description": "Use Anthropic Message Batches (50% cheaper, "
+                                   "results take minutes)",
+                },
+            },
+            "required": ["pairs"],
+        },
+    )
+    async def quality_spot_check_batch_tool(args):
+        result = await asyncio.to_thread(
+            quality_spot_check_batch,
+            pairs=args["pairs"],
+            source_language=args.get("source_language", "English"),
+            target_language=args.get("target_language", "German"),
+            style_instructions=args.get("style_instructions", ""),
+            protected_nouns=args.get("protected_nouns", ""),
+            batch_api=args.get("batch_api", False),
+        )
+        return _text(result)
 
     @tool(
         "generate_report",
@@ -184,7 +248,8 @@ def create_mcp_server():
         },
     )
     async def generate_report_tool(args):
-        result = generate_report(
+        result = await asyncio.to_thread(
+            generate_report,
             translation_stats=args.get("translation_stats", "{}"),
             quality_results=args.get("quality_results", "{}"),
             book_metadata=args.get("book_metadata", "{}"),
@@ -192,7 +257,7 @@ def create_mcp_server():
             model_used=args.get("model_used", "claude-sonnet-4-20250514"),
             output_path=args.get("output_path", ""),
         )
-        return {"content": [{"type": "text", "text": result}]}
+        return _text(result)
 
     server = create_sdk_mcp_server(
         name="translation-orchestrator",
@@ -204,6 +269,7 @@ def create_mcp_server():
             run_translation_tool,
             extract_paragraphs_tool,
             quality_spot_check_tool,
+            quality_spot_check_batch_tool,
             generate_report_tool,
         ],
     )
@@ -219,5 +285,6 @@ TOOL_NAMES = [
     "mcp__translation-orchestrator__run_translation",
     "mcp__translation-orchestrator__extract_paragraphs",
     "mcp__translation-orchestrator__quality_spot_check",
+    "mcp__translation-orchestrator__quality_spot_check_batch",
     "mcp__translation-orchestrator__generate_report",
 ]
@@ -0,0 +1,14 @@
+"""Anthropic client shared by the tools."""
+
+import functools
+
+
+@functools.lru_cache(maxsize=4)
+def anthropic_client(api_key: str):
+    """Anthropic client for api_key, shared by every tool call.
+
+    Reusing one client keeps its connection pool, so later calls skip the
+    TCP/TLS handshake with the API.
+    """
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key, timeout=180)
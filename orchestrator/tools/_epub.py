@@ -0,0 +1,42 @@
+"""EPUB helpers for the tools."""
+
+import os
+import functools
+import hashlib
+import pickle
+from pathlib import Path
+
+# Parsed EPUB paragraphs are cached per (path, mtime, size), so the analyze
+# and quality tools share one parse of a book, within and across runs.
+PARAGRAPH_CACHE_DIR = Path.home() / ".cache" / "book-translator" / "paragraphs"
+
+
+def chapter_paragraphs(path: str) -> dict:
+    """EPUBBookLoader.extract_chapter_paragraphs(path), cached in memory and on disk.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    st = os.stat(path)
+    return _extract_paragraphs_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_paragraphs_cached(path: str, mtime_ns: int, size: int) -> dict:
+    key = hashlib.blake2b(f"{path}:{mtime_ns}:{size}".encode()).hexdigest()
+    cache_file = PARAGRAPH_CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    from book_maker.loader.epub_loader import EPUBBookLoader
+
+    data = EPUBBookLoader.extract_chapter_paragraphs(path)
+    try:
+        PARAGRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(data, f, protocol=5)
+    except OSError:
+        pass  # cache is best-effort
+    return data
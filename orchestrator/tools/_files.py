@@ -0,0 +1,22 @@
+"""File helpers for the tools."""
+
+import os
+
+
+def write_atomic(path: str, data: bytes):
+    """Write data to path in one buffered write, replacing the file atomically.
+
+    The bytes go to a sibling temp file first, so an interrupted run never
+    leaves a truncated report or profile behind.
+    """
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
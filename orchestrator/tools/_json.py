@@ -0,0 +1,39 @@
+"""JSON helpers for the tools — orjson when installed, stdlib json otherwise.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching the stdlib exception either way. orjson is given OPT_NON_STR_KEYS
+so that int keys are written as strings, as json.dumps does.
+"""
+
+import json
+
+from ._files import write_atomic
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Compact JSON text with non-ASCII characters kept as-is."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_indented(obj) -> bytes:
+    """Human-readable (2-space indented) UTF-8 JSON."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dump_file(obj, path: str):
+    """Atomically write obj to path as human-readable (2-space indented) UTF-8 JSON."""
+    write_atomic(path, dumps_indented(obj))
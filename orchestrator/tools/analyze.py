@@ -1,9 +1,48 @@
 """Book analysis tool — extract metadata, detect language, sample text."""
 
 import os
-import json
+import bisect
+import functools
+import hashlib
+import itertools
+import re
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from ._epub import chapter_paragraphs
+from ._files import write_atomic
+from ._json import dumps, loads
+
+# Non-blank lines with surrounding whitespace stripped
+_LINE_RE = re.compile(r"^[^\S\n]*(\S(?:[^\n]*\S)?)", re.M)
+_WORD_RE = re.compile(r"\S+")
+
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+# Language detection only looks at the opening text
+LANG_DETECT_CHARS = 2000
+
+# Samples skip paragraphs shorter than SAMPLE_MIN_CHARS (headings, scene
+# breaks) and are cut to SAMPLE_CHARS
+SAMPLE_MIN_CHARS = 50
+SAMPLE_CHARS = 500
+
+# Books with more paragraphs than this count words with numpy, if available
+NUMPY_WORD_COUNT_MIN = 10_000
+
+# (model, $ per MTok input, $ per MTok output) for cost estimates
+_PRICES = (("sonnet", 3.0, 15.0), ("opus", 15.0, 75.0))
+_PER_MTOK = 1 / 1e6
+# Cache discount ~60%
+_CACHED_COST_FACTOR = 0.4
+
+# Results are cached per (path, mtime, size, sample_count); editing or
+# replacing the book invalidates its entry automatically. Bump
+# ANALYZE_CACHE_VERSION whenever the analysis or its output changes.
+ANALYZE_CACHE_DIR = Path.home() / ".cache" / "book-translator" / "analyze"
+ANALYZE_CACHE_VERSION = 1
+
 
 def analyze_book(book_path: str, sample_count: int = 5) -> str:
     """Extract metadata, detect language, and sample text from a book.
@@ -15,14 +54,43 @@ def analyze_book(book_path: str, sample_count: int = 5) -> str:
     Returns:
         JSON string with book metadata and analysis.
     """
-    if not os.path.exists(book_path):
-        return json.dumps({"error": f"File not found: {book_path}"})
+    result, output = _analyze(book_path, sample_count)
+    return output if output is not None else dumps(result)
+
+
+def analyze_book_dict(book_path: str, sample_count: int = 5) -> dict:
+    """analyze_book(), returning the result as a dict instead of a JSON string."""
+    result, output = _analyze(book_path, sample_count)
+    return result if result is not None else loads(output)
+
+
+def _analyze(book_path: str, sample_count: int) -> tuple[dict | None, str | None]:
+    """(result, JSON text) for analyze_book; either may be None, not both.
+
+    A cache hit only has the text, an error only the dict, and a fresh
+    analysis both, so neither caller parses or serializes needlessly. The
+    cache holds the result without "file", which is spliced back in from
+    book_path, so a hit reports the path as the caller gave it.
+    """
+    try:
+        st = os.stat(book_path)
+    except FileNotFoundError:
+        return {"error": f"File not found: {book_path}"}, None
+
+    key = hashlib.blake2b(
+        f"{ANALYZE_CACHE_VERSION}:{os.path.abspath(book_path)}:"
+        f"{st.st_mtime_ns}:{st.st_size}:{sample_count}".encode()
+    ).hexdigest()
+    cache_file = ANALYZE_CACHE_DIR / f"{key}.json"
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return None, _with_file(book_path, cached)
 
     ext = Path(book_path).suffix.lower()
     result = {
         "file": book_path,
         "format": ext.lstrip("."),
-        "file_size_bytes": os.path.getsize(book_path),
+        "file_size_bytes": st.st_size,
     }
 
     if ext == ".epub":
@@ -34,63 +102,68 @@ def analyze_book(book_path: str, sample_count: int = 5) -> str:
     else:
         result["error"] = f"Unsupported format: {ext}"
 
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    if "error" in result:
+        return result, None
+    cached = dumps({k: v for k, v in result.items() if k != "file"})
+    try:
+        ANALYZE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(str(cache_file), cached.encode("utf-8"))
+    except OSError:
+        pass  # cache is best-effort
+    return result, _with_file(book_path, cached)
 
 
-def _analyze_epub(epub_path: str, sample_count: int) -> dict:
-    """Analyze an EPUB file."""
-    from ebooklib import epub, ITEM_DOCUMENT
-    from book_maker.loader.epub_loader import EPUBBookLoader
+def _read_cache(cache_file: Path) -> str | None:
+    """The cached JSON object text, or None on a miss.
+
+    An entry that does not parse as a JSON object is deleted, so the book
+    is analyzed again and the entry rewritten.
+    """
+    try:
+        cached = cache_file.read_text(encoding="utf-8")
+        if isinstance(loads(cached), dict):
+            return cached
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        cache_file.unlink()
+    except OSError:
+        pass
+    return None
 
-    book = epub.read_epub(epub_path)
 
+def _with_file(book_path: str, cached: str) -> str:
+    """The cached JSON object text with "file": book_path as its first key."""
+    return f'{{"file":{dumps(book_path)},{cached[1:]}'
+
+
+def _analyze_epub(epub_path: str, sample_count: int) -> dict:
+    """Analyze an EPUB file."""
     # Extract metadata
-    title = ""
-    author = ""
-    language = ""
-    for ns, metas in book.metadata.items():
-        if isinstance(metas, dict):
-            for name, values in metas.items():
-                for val in values:
-                    v = val[0] if isinstance(val, tuple) else val
-                    if name == "title" and not title:
-                        title = str(v)
-                    elif name == "creator" and not author:
-                        author = str(v)
-                    elif name == "language" and not language:
-                        language = str(v)
-
-    # Extract chapter info
-    data = EPUBBookLoader.extract_chapter_paragraphs(epub_path)
+    title, author, language = _epub_metadata(epub_path)
+
+    # Extract chapter info; extract_paragraphs reuses this parse
+    data = chapter_paragraphs(epub_path)
     chapters = data["chapters"]
     total_paragraphs = data["total_paragraphs"]
 
     # Estimate word count
-    total_words = 0
-    all_paragraphs = []
-    for ch in chapters:
-        for p in ch["paragraphs"]:
-            total_words += len(p.split())
-            all_paragraphs.append(p)
-
-    # Sample paragraphs (evenly spaced)
-    samples = []
-    if all_paragraphs:
-        step = max(1, len(all_paragraphs) // sample_count)
-        for i in range(0, len(all_paragraphs), step):
-            if len(samples) >= sample_count:
-                break
-            samples.append(all_paragraphs[i][:500])
+    total_words = _count_words(_paragraphs(chapters), total_paragraphs)
+
+    # Sample paragraphs (evenly spaced), locating each global index by
+    # binary search over the per-chapter prefix sums
+    prefix = list(itertools.accumulate(len(ch["paragraphs"]) for ch in chapters))
+
+    def paragraph_at(gi: int) -> str:
+        ci = bisect.bisect_right(prefix, gi)
+        return chapters[ci]["paragraphs"][gi - (prefix[ci - 1] if ci else 0)]
+
+    samples = _sample(paragraph_at, prefix[-1] if prefix else 0, sample_count)
 
     # Detect source language
-    source_language = "unknown"
-    try:
-        from langdetect import detect
-        sample_text = " ".join(all_paragraphs[:20])
-        if sample_text.strip():
-            source_language = detect(sample_text)
-    except Exception:
-        pass
+    source_language = _detect_language(_paragraphs(chapters))
 
     # Cost estimates (rough)
     cost_estimates = _estimate_costs(total_words)
@@ -109,30 +182,38 @@ def _analyze_epub(epub_path: str, sample_count: int) -> dict:
     }
 
 
+def _epub_metadata(epub_path: str) -> tuple[str, str, str]:
+    """(title, author, language) from the EPUB's OPF <metadata> element.
+
+    Only container.xml and the OPF are read, and parsing stops at the end
+    of <metadata>, so no content documents are unpacked.
+    """
+    with zipfile.ZipFile(epub_path) as zf:
+        container = ET.fromstring(zf.read("META-INF/container.xml"))
+        rootfile = container.find(".//{*}rootfile")
+        if rootfile is None:
+            return "", "", ""
+        with zf.open(rootfile.get("full-path")) as opf:
+            for _, elem in ET.iterparse(opf, events=("end",)):
+                if elem.tag.endswith("}metadata") or elem.tag == "metadata":
+                    return tuple(
+                        (elem.findtext(f"{_DC}{name}") or "").strip()
+                        for name in ("title", "creator", "language")
+                    )
+    return "", "", ""
+
+
 def _analyze_txt(txt_path: str, sample_count: int) -> dict:
     """Analyze a TXT file."""
     with open(txt_path, "r", encoding="utf-8") as f:
         content = f.read()
 
-    lines = [l.strip() for l in content.split("\n") if l.strip()]
-    total_words = sum(len(l.split()) for l in lines)
+    lines = _LINE_RE.findall(content)
+    total_words = len(_WORD_RE.findall(content))
 
-    samples = []
-    if lines:
-        step = max(1, len(lines) // sample_count)
-        for i in range(0, len(lines), step):
-            if len(samples) >= sample_count:
-                break
-            samples.append(lines[i][:500])
+    samples = _sample(lines.__getitem__, len(lines), sample_count)
 
-    source_language = "unknown"
-    try:
-        from langdetect import detect
-        sample_text = " ".join(lines[:20])
-        if sample_text.strip():
-            source_language = detect(sample_text)
-    except Exception:
-        pass
+    source_language = _detect_language(lines)
 
     return {
         "title": Path(txt_path).stem,
@@ -149,35 +230,25 @@ def _analyze_txt(txt_path: str, sample_count: int) -> dict:
 def _analyze_pdf(pdf_path: str, sample_count: int) -> dict:
     """Analyze a PDF file."""
     try:
-        import fitz
+        fitz = _fitz()
     except ImportError:
         return {"error": "PyMuPDF (fitz) not installed. Install with: pip install PyMuPDF"}
 
+    # Pages are extracted one after another: MuPDF holds a global lock, so
+    # threads gain nothing, and its documents must not be shared across them
     doc = fitz.open(pdf_path)
-    all_text = []
-    for page in doc:
-        all_text.append(page.get_text())
-    doc.close()
-
-    lines = [l.strip() for l in "\n".join(all_text).split("\n") if l.strip()]
-    total_words = sum(len(l.split()) for l in lines)
-
-    samples = []
-    if lines:
-        step = max(1, len(lines) // sample_count)
-        for i in range(0, len(lines), step):
-            if len(samples) >= sample_count:
-                break
-            samples.append(lines[i][:500])
-
-    source_language = "unknown"
     try:
-        from langdetect import detect
-        sample_text = " ".join(lines[:20])
-        if sample_text.strip():
-            source_language = detect(sample_text)
-    except Exception:
-        pass
+        all_text = [page.get_text() for page in doc]
+    finally:
+        doc.close()
+
+    text = "\n".join(all_text)
+    lines = _LINE_RE.findall(text)
+    total_words = len(_WORD_RE.findall(text))
+
+    samples = _sample(lines.__getitem__, len(lines), sample_count)
+
+    source_language = _detect_language(lines)
 
     return {
         "title": Path(pdf_path).stem,
@@ -191,6 +262,117 @@ def _analyze_pdf(pdf_path: str, sample_count: int) -> dict:
     }
 
 
+def _pick_sample(paragraph: str) -> str | None:
+    """The paragraph stripped and cut to SAMPLE_CHARS, or None if it is too short to be useful."""
+    text = paragraph.strip()
+    return text[:SAMPLE_CHARS] if len(text) >= SAMPLE_MIN_CHARS else None
+
+
+def _sample(paragraph_at, total: int, sample_count: int) -> list[str]:
+    """Up to sample_count evenly spaced samples from paragraph_at(0..total-1).
+
+    Each sample is the first usable paragraph in its evenly sized window;
+    windows without one (headings, scene breaks) are backfilled with other
+    usable paragraphs, and the result is kept in book order.
+    """
+    picked = {}
+    for k in range(sample_count):
+        for i in range(k * total // sample_count, (k + 1) * total // sample_count):
+            text = _pick_sample(paragraph_at(i))
+            if text is not None:
+                picked[i] = text
+                break
+    for i in range(total):
+        if len(picked) >= sample_count:
+            break
+        if i not in picked:
+            text = _pick_sample(paragraph_at(i))
+            if text is not None:
+                picked[i] = text
+    return [picked[i] for i in sorted(picked)]
+
+
+def _paragraphs(chapters):
+    """The paragraphs of extract_chapter_paragraphs() chapters, in book order."""
+    return itertools.chain.from_iterable(ch["paragraphs"] for ch in chapters)
+
+
+def _count_words(paragraphs, count: int) -> int:
+    """Whitespace-separated word count across count paragraphs.
+
+    The paragraphs are consumed in one pass, without building a list of
+    them. Above NUMPY_WORD_COUNT_MIN paragraphs, and with numpy installed,
+    words are counted as ASCII-whitespace to non-whitespace transitions over
+    the UTF-8 bytes instead of splitting each paragraph.
+    """
+    np = _numpy() if count > NUMPY_WORD_COUNT_MIN else None
+    if np is None:
+        return sum(len(p.split()) for p in paragraphs)
+    buf = np.frombuffer((" " + " ".join(paragraphs)).encode("utf-8"), dtype=np.uint8)
+    space = (buf == 0x20) | ((buf >= 0x09) & (buf <= 0x0D))
+    return int(np.count_nonzero(space[:-1] & ~space[1:]))
+
+
+def _detect_language(paragraphs) -> str:
+    """Language code of the opening LANG_DETECT_CHARS characters, or "unknown".
+
+    Uses gcld3 when installed, langdetect otherwise.
+    """
+    parts = []
+    size = 0
+    for p in paragraphs:
+        if size >= LANG_DETECT_CHARS:
+            break
+        parts.append(p)
+        size += len(p) + 1
+    text = " ".join(parts)[:LANG_DETECT_CHARS]
+    if not text.strip():
+        return "unknown"
+
+    detect = _language_detector()
+    if detect is None:
+        return "unknown"
+    try:
+        return detect(text)
+    except Exception:
+        return "unknown"
+
+
+# Heavy optional modules are imported on first use and then reused.
+
+@functools.cache
+def _fitz():
+    import fitz
+    return fitz
+
+
+@functools.cache
+def _numpy():
+    """numpy, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@functools.cache
+def _language_detector():
+    """text -> language code, backed by gcld3 or langdetect; None if neither is installed."""
+    try:
+        import gcld3
+    except ImportError:
+        pass
+    else:
+        identifier = gcld3.NNetLanguageIdentifier(0, LANG_DETECT_CHARS)
+        return lambda text: identifier.FindLanguage(text).language
+    try:
+        from langdetect import detect
+    except ImportError:
+        return None
+    return detect
+
+
 def _estimate_costs(total_words: int) -> dict:
     """Rough cost estimates based on word count."""
     # ~1.3 tokens per word, ~5000 paragraphs per 100k words
@@ -207,18 +389,12 @@ def _estimate_costs(total_words: int) -> dict:
     total_input = int(api_calls_block * input_tokens_per_call)
     total_output = int(api_calls_block * output_tokens_per_call)
 
-    sonnet_cost = total_input / 1e6 * 3.0 + total_output / 1e6 * 15.0
-    opus_cost = total_input / 1e6 * 15.0 + total_output / 1e6 * 75.0
-
-    # Cache discount ~60%
-    sonnet_cached = sonnet_cost * 0.4
-    opus_cached = opus_cost * 0.4
-
-    return {
-        "estimated_api_calls": int(api_calls_block),
-        "sonnet_no_cache": f"${sonnet_cost:.2f}",
-        "sonnet_with_cache": f"${sonnet_cached:.2f}",
-        "opus_no_cache": f"${opus_cost:.2f}",
-        "opus_with_cache": f"${opus_cached:.2f}",
-        "recommendation": "sonnet" if total_words < 50000 else "sonnet (use opus for literary fiction)",
-    }
+    estimates = {"estimated_api_calls": int(api_calls_block)}
+    for model, in_price, out_price in _PRICES:
+        cost = (total_input * in_price + total_output * out_price) * _PER_MTOK
+        estimates[f"{model}_no_cache"] = f"${cost:.2f}"
+        estimates[f"{model}_with_cache"] = f"${cost * _CACHED_COST_FACTOR:.2f}"
+    estimates["recommendation"] = (
+        "sonnet" if total_words < 50000 else "sonnet (use opus for literary fiction)"
+    )
+    return estimates
@@ -1,8 +1,17 @@
 """Profile management tools — list and create translation profiles."""
 
 import os
+import functools
 import json
-import glob as globmod
+from concurrent.futures import ThreadPoolExecutor
+
+from ._json import dumps, dump_file, loads
+
+# Profile summaries by path, reused while (st_mtime_ns, st_size) is unchanged
+_PROFILE_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+# Upper bound on threads reading profile files in list_profiles
+PROFILE_LOAD_WORKERS = 16
 
 
 def list_profiles(profiles_dir: str = "examples/profiles") -> str:
@@ -14,34 +23,70 @@ def list_profiles(profiles_dir: str = "examples/profiles") -> str:
     Returns:
         JSON string with profile summaries.
     """
-    if not os.path.isdir(profiles_dir):
-        return json.dumps({"error": f"Profiles directory not found: {profiles_dir}"})
-
-    profiles = []
-    for path in sorted(globmod.glob(os.path.join(profiles_dir, "*.json"))):
-        basename = os.path.basename(path)
-        if basename.startswith("_"):
-            continue
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            profiles.append({
-                "file": basename,
-                "path": path,
-                "name": data.get("name", basename),
-                "description": data.get("description", ""),
-                "source_language": data.get("source_language", "English"),
-                "protected_nouns_count": len(data.get("protected_nouns", [])),
-                "glossary_seed_count": len([k for k in data.get("glossary_seed", {}) if k != "_comment"]),
-                "temperature": data.get("temperature", {}).get("translate", 0.3),
-                "min_review_chars": data.get("min_review_chars", 300),
-            })
-        except Exception as e:
-            profiles.append({"file": basename, "error": str(e)})
-
-    return json.dumps({"profiles": profiles, "total": len(profiles)}, ensure_ascii=False, indent=2)
+    return dumps(list_profiles_dict(profiles_dir))
+
+
+def list_profiles_dict(profiles_dir: str = "examples/profiles") -> dict:
+    """list_profiles(), returning the result as a dict instead of a JSON string."""
+    try:
+        with os.scandir(profiles_dir) as it:
+            entries = sorted(
+                (entry for entry in it
+                 if entry.name.endswith(".json") and not entry.name.startswith(("_", "."))),
+                key=lambda entry: entry.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return {"error": f"Profiles directory not found: {profiles_dir}"}
+
+    # Unchanged profiles come from the cache; the rest are read in parallel,
+    # since on network mounts the time goes into opening files
+    profiles = [_cached_summary(entry) for entry in entries]
+    missing = [i for i, summary in enumerate(profiles) if summary is None]
+    if len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=min(PROFILE_LOAD_WORKERS, len(missing))) as ex:
+            loaded = list(ex.map(_load_summary, (entries[i] for i in missing)))
+    else:
+        loaded = [_load_summary(entries[i]) for i in missing]
+    for i, summary in zip(missing, loaded):
+        profiles[i] = summary
+
+    return {"profiles": profiles, "total": len(profiles)}
+
+
+def _cached_summary(entry: os.DirEntry) -> dict | None:
+    """The cached summary for entry if the file is unchanged, else None."""
+    cached = _PROFILE_CACHE.get(entry.path)
+    if cached is None:
+        return None
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return cached[2] if cached[:2] == (st.st_mtime_ns, st.st_size) else None
+
+
+def _load_summary(entry: os.DirEntry) -> dict:
+    """Read and summarize one profile, caching the result; an error dict on failure."""
+    try:
+        st = entry.stat()
+        with open(entry.path, "rb") as f:
+            data = loads(f.read())
+
+        summary = {
+            "file": entry.name,
+            "path": entry.path,
+            "name": data.get("name", entry.name),
+            "description": data.get("description", ""),
+            "source_language": data.get("source_language", "English"),
+            "protected_nouns_count": len(data.get("protected_nouns", [])),
+            "glossary_seed_count": len([k for k in data.get("glossary_seed", {}) if k != "_comment"]),
+            "temperature": data.get("temperature", {}).get("translate", 0.3),
+            "min_review_chars": data.get("min_review_chars", 300),
+        }
+        _PROFILE_CACHE[entry.path] = (st.st_mtime_ns, st.st_size, summary)
+        return summary
+    except Exception as e:
+        return {"file": entry.name, "error": str(e)}
 
 
 def create_profile(
@@ -80,17 +125,13 @@ def create_profile(
         JSON string with result status.
     """
     # Parse protected nouns
-    nouns_list = [n.strip() for n in protected_nouns.split(",") if n.strip()] if protected_nouns else []
+    nouns_list = list(_parse_nouns(protected_nouns))
 
     # Parse glossary seed
-    seed = {}
-    if glossary_seed:
-        try:
-            seed = json.loads(glossary_seed)
-            if not isinstance(seed, dict):
-                seed = {}
-        except json.JSONDecodeError:
-            return json.dumps({"error": f"Invalid glossary_seed JSON: {glossary_seed}"})
+    try:
+        seed = dict(_parse_glossary(glossary_seed))
+    except json.JSONDecodeError:
+        return dumps({"error": f"Invalid glossary_seed JSON: {glossary_seed}"})
 
     profile = {
         "name": name,
@@ -112,13 +153,33 @@ def create_profile(
     # Ensure directory exists
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(profile, f, ensure_ascii=False, indent=2)
+    dump_file(profile, output_path)
 
-    return json.dumps({
+    return dumps({
         "status": "created",
         "path": output_path,
         "name": name,
         "protected_nouns": len(nouns_list),
         "glossary_seed_terms": len(seed),
     })
+
+
+# Agents pass the same noun and glossary strings over and over, so parsed
+# results are memoized; immutable return types keep the cache safe to share.
+
+@functools.lru_cache(maxsize=256)
+def _parse_nouns(protected_nouns: str) -> tuple[str, ...]:
+    """Comma-separated nouns, stripped, blanks dropped."""
+    return tuple(n.strip() for n in protected_nouns.split(",") if n.strip())
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_glossary(glossary_seed: str) -> tuple[tuple[str, str], ...]:
+    """(source, target) pairs of a JSON glossary object; empty if not an object.
+
+    Raises json.JSONDecodeError for invalid JSON.
+    """
+    if not glossary_seed:
+        return ()
+    seed = loads(glossary_seed)
+    return tuple(seed.items()) if isinstance(seed, dict) else ()
@@ -1,8 +1,51 @@
 """Quality review tools — extract paragraph pairs and spot-check translation quality."""
 
 import os
+import asyncio
+import functools
 import json
 import random
+import time
+
+from ._client import anthropic_client
+from ._epub import chapter_paragraphs
+from ._json import dumps, loads
+from .profiles import _parse_nouns
+
+SPOT_CHECK_MODEL = "claude-sonnet-4-20250514"
+# Spot-check requests in flight at once in quality_spot_check_batch
+SPOT_CHECK_CONCURRENCY = 8
+# Seconds between status polls of a spot-check Message Batch
+SPOT_CHECK_BATCH_POLL_INTERVAL = 15
+# Seconds after which a spot-check Message Batch that has not ended is
+# cancelled and its remaining pairs are scored directly
+SPOT_CHECK_BATCH_TIMEOUT = 3600
+
+# Fixed part of the evaluator system prompt; language, style and protected
+# nouns follow in a separate block.
+EVALUATOR_RUBRIC = """\
+You are a professional translation quality evaluator.
+
+Rate the translation on these 5 dimensions (1-5 scale, 5 = excellent):
+1. ACCURACY — Faithfulness to meaning
+2. FLUENCY — Natural target-language prose
+3. STYLE — Preservation of author's voice/tone
+4. COMPLETENESS — Nothing missing or added
+5. TERMINOLOGY — Correct use of terms/names
+
+Respond with ONLY a valid JSON object:
+{
+  "scores": {
+    "accuracy": <1-5>,
+    "fluency": <1-5>,
+    "style": <1-5>,
+    "completeness": <1-5>,
+    "terminology": <1-5>
+  },
+  "average": <float>,
+  "issues": ["issue 1", "issue 2"],
+  "summary": "One sentence overall assessment"
+}"""
 
 
 def extract_paragraphs(
@@ -22,50 +65,87 @@ def extract_paragraphs(
     Returns:
         JSON string with matched paragraph pairs.
     """
-    from book_maker.loader.epub_loader import EPUBBookLoader
+    return dumps(extract_paragraphs_dict(
+        original_path=original_path,
+        translated_path=translated_path,
+        sample_count=sample_count,
+        strategy=strategy,
+    ))
 
-    if not os.path.exists(original_path):
-        return json.dumps({"error": f"Original file not found: {original_path}"})
-    if not os.path.exists(translated_path):
-        return json.dumps({"error": f"Translated file not found: {translated_path}"})
 
-    orig_data = EPUBBookLoader.extract_chapter_paragraphs(original_path)
-    trans_data = EPUBBookLoader.extract_chapter_paragraphs(translated_path)
+def extract_paragraphs_dict(
+    original_path: str,
+    translated_path: str,
+    sample_count: int = 10,
+    strategy: str = "evenly_spaced",
+) -> dict:
+    """extract_paragraphs(), returning the result as a dict instead of a JSON string."""
+    try:
+        orig_data = chapter_paragraphs(original_path)
+    except FileNotFoundError:
+        return {"error": f"Original file not found: {original_path}"}
+    try:
+        trans_data = chapter_paragraphs(translated_path)
+    except FileNotFoundError:
+        return {"error": f"Translated file not found: {translated_path}"}
 
     # Build lookup by chapter filename
     trans_by_file = {ch["filename"]: ch["paragraphs"] for ch in trans_data["chapters"]}
 
-    # Collect all matchable pairs
-    all_pairs = []
+    # Count matchable pairs per chapter; only the sampled ones are built
+    matched = []
     for ch in orig_data["chapters"]:
         trans_paras = trans_by_file.get(ch["filename"], [])
-        for i, orig_para in enumerate(ch["paragraphs"]):
-            if i < len(trans_paras):
-                all_pairs.append({
-                    "chapter": ch["filename"],
-                    "index": i,
-                    "original": orig_para,
-                    "translated": trans_paras[i],
-                })
-
-    if not all_pairs:
-        return json.dumps({"error": "No matching paragraph pairs found"})
+        count = min(len(ch["paragraphs"]), len(trans_paras))
+        if count:
+            matched.append((ch["filename"], ch["paragraphs"], trans_paras, count))
+    total = sum(count for *_, count in matched)
+
+    if not total:
+        return {"error": "No matching paragraph pairs found"}
 
     # Sample
     if strategy == "random":
-        selected = random.sample(all_pairs, min(sample_count, len(all_pairs)))
+        indices = sorted(random.sample(range(total), min(sample_count, total)))
     elif strategy == "first":
-        selected = all_pairs[:sample_count]
+        indices = range(min(sample_count, total))
     else:  # evenly_spaced
-        step = max(1, len(all_pairs) // sample_count)
-        selected = [all_pairs[i] for i in range(0, len(all_pairs), step)][:sample_count]
+        indices = range(0, total, max(1, total // sample_count))[:sample_count]
 
-    return json.dumps({
+    selected = list(_pairs_at(matched, indices))
+
+    return {
         "pairs": selected,
-        "total_available": len(all_pairs),
+        "total_available": total,
         "sampled": len(selected),
         "strategy": strategy,
-    }, ensure_ascii=False, indent=2)
+    }
+
+
+def _pairs_at(matched, indices):
+    """Yield the pair dicts at the given ascending global indices.
+
+    Stops as soon as the last index is reached, so "first" sampling only
+    touches the opening chapters.
+    """
+    wanted = iter(indices)
+    gi = next(wanted, None)
+    offset = 0
+    if gi is None:
+        return
+    for filename, orig_paras, trans_paras, count in matched:
+        while gi < offset + count:
+            i = gi - offset
+            yield {
+                "chapter": filename,
+                "index": i,
+                "original": orig_paras[i],
+                "translated": trans_paras[i],
+            }
+            gi = next(wanted, None)
+            if gi is None:
+                return
+        offset += count
 
 
 def quality_spot_check(
@@ -91,69 +171,228 @@ def quality_spot_check(
     Returns:
         JSON string with quality scores and issues.
     """
+    return dumps(quality_spot_check_dict(
+        original_text=original_text,
+        translated_text=translated_text,
+        source_language=source_language,
+        target_language=target_language,
+        style_instructions=style_instructions,
+        protected_nouns=protected_nouns,
+    ))
+
+
+def quality_spot_check_dict(
+    original_text: str,
+    translated_text: str,
+    source_language: str = "English",
+    target_language: str = "German",
+    style_instructions: str = "",
+    protected_nouns: str = "",
+) -> dict:
+    """quality_spot_check(), returning the result as a dict instead of a JSON string."""
     api_key = os.environ.get("BBM_CLAUDE_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        return json.dumps({"error": "No API key found. Set ANTHROPIC_API_KEY or BBM_CLAUDE_API_KEY."})
+        return {"error": "No API key found. Set ANTHROPIC_API_KEY or BBM_CLAUDE_API_KEY."}
 
-    from anthropic import Anthropic
+    client = anthropic_client(api_key)
 
-    client = Anthropic(api_key=api_key)
+    system = _evaluator_system(
+        source_language, target_language, style_instructions, protected_nouns,
+    )
 
-    system_prompt = f"""\
-You are a professional translation quality evaluator assessing {source_language} → {target_language} translations.
+    try:
+        response = client.messages.create(**_spot_check_request(
+            system, original_text, translated_text, source_language, target_language,
+        ))
+        return _parse_spot_check(response)
+    except Exception as e:
+        return {"error": str(e), "type": type(e).__name__}
 
-Rate the translation on these 5 dimensions (1-5 scale, 5 = excellent):
-1. ACCURACY — Faithfulness to meaning
-2. FLUENCY — Natural target-language prose
-3. STYLE — Preservation of author's voice/tone
-4. COMPLETENESS — Nothing missing or added
-5. TERMINOLOGY — Correct use of terms/names
 
-{f"Style context: {style_instructions}" if style_instructions else ""}
-{f"Protected nouns (must not be translated): {protected_nouns}" if protected_nouns else ""}
+def quality_spot_check_batch(
+    pairs: str,
+    source_language: str = "English",
+    target_language: str = "German",
+    style_instructions: str = "",
+    protected_nouns: str = "",
+    batch_api: bool = False,
+) -> str:
+    """Evaluate many paragraph pairs concurrently using Claude.
+
+    Same scoring as quality_spot_check, but all pairs are sent at once (up to
+    SPOT_CHECK_CONCURRENCY in flight) over one client. With batch_api they go
+    out as one Anthropic Message Batch instead — half the price, but results
+    take minutes rather than seconds.
 
-Respond with ONLY a valid JSON object:
-{{
-  "scores": {{
-    "accuracy": <1-5>,
-    "fluency": <1-5>,
-    "style": <1-5>,
-    "completeness": <1-5>,
-    "terminology": <1-5>
-  }},
-  "average": <float>,
-  "issues": ["issue 1", "issue 2"],
-  "summary": "One sentence overall assessment"
-}}"""
+    Args:
+        pairs: JSON list of {"original": ..., "translated": ...} objects, or
+            the extract_paragraphs output as-is
+        source_language: Source language name
+        target_language: Target language name
+        style_instructions: Style instructions for evaluation context
+        protected_nouns: Comma-separated protected nouns
+        batch_api: Score through Anthropic Message Batches (default: False)
 
-    user_msg = f"ORIGINAL ({source_language}):\n{original_text}\n\nTRANSLATION ({target_language}):\n{translated_text}"
+    Returns:
+        JSON string with per-pair results (in input order) and their average.
+    """
+    api_key = os.environ.get("BBM_CLAUDE_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        return dumps({"error": "No API key found. Set ANTHROPIC_API_KEY or BBM_CLAUDE_API_KEY."})
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            temperature=0.2,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_msg}],
-        )
-
-        result_text = "".join(b.text for b in response.content if b.type == "text").strip()
-
-        # Parse JSON from response
-        if result_text.startswith("```"):
-            result_text = result_text.split("\n", 1)[1].rsplit("```", 1)[0]
-
-        result = json.loads(result_text)
-        result["tokens_used"] = {
-            "input": response.usage.input_tokens,
-            "output": response.usage.output_tokens,
-        }
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        pair_list = loads(pairs)
+    except json.JSONDecodeError as e:
+        return dumps({"error": f"Invalid pairs JSON: {e}"})
+    if isinstance(pair_list, dict):
+        pair_list = pair_list.get("pairs", [])
+    if not pair_list:
+        return dumps({"error": "No paragraph pairs given"})
+
+    system = _evaluator_system(
+        source_language, target_language, style_instructions, protected_nouns,
+    )
+    if batch_api:
+        try:
+            results = _spot_check_message_batch(
+                api_key, system, pair_list, source_language, target_language,
+            )
+        except Exception as e:
+            return dumps({"error": str(e), "type": type(e).__name__})
+    else:
+        results = asyncio.run(_spot_check_all(
+            api_key, system, pair_list, source_language, target_language,
+        ))
 
+    scores = [r["average"] for r in results if isinstance(r.get("average"), (int, float))]
+    return dumps({
+        "results": results,
+        "checked": len(results),
+        "failed": len(results) - len(scores),
+        "average": round(sum(scores) / len(scores), 2) if scores else None,
+    })
+
+
+async def _spot_check_all(api_key, system, pairs, source_language, target_language) -> list[dict]:
+    from anthropic import AsyncAnthropic
+
+    client = AsyncAnthropic(api_key=api_key)
+    limit = asyncio.Semaphore(SPOT_CHECK_CONCURRENCY)
+
+    async def score(pair):
+        async with limit:
+            try:
+                response = await client.messages.create(**_spot_check_request(
+                    system, pair["original"], pair["translated"], source_language, target_language,
+                ))
+                return _parse_spot_check(response)
+            except Exception as e:
+                return {"error": str(e), "type": type(e).__name__}
+
+    try:
+        return await asyncio.gather(*(score(pair) for pair in pairs))
+    finally:
+        await client.close()
+
+
+def _spot_check_message_batch(api_key, system, pairs, source_language, target_language) -> list[dict]:
+    """Score every pair in one Message Batch and wait for it to end.
+
+    A batch still running SPOT_CHECK_BATCH_TIMEOUT seconds after submission
+    is cancelled; pairs that did not succeed inside it are scored through
+    messages.create() instead.
+    """
+    client = anthropic_client(api_key)
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": f"pair_{i}", "params": _spot_check_request(
+            system, pair["original"], pair["translated"], source_language, target_language,
+        )}
+        for i, pair in enumerate(pairs)
+    ])
+    deadline = time.monotonic() + SPOT_CHECK_BATCH_TIMEOUT
+    while batch.processing_status != "ended":
+        # A cancelled batch still ends with the results that finished
+        if batch.processing_status != "canceling" and time.monotonic() >= deadline:
+            batch = client.messages.batches.cancel(batch.id)
+            continue
+        time.sleep(SPOT_CHECK_BATCH_POLL_INTERVAL)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    results = [None] * len(pairs)
+    for entry in client.messages.batches.results(batch.id):
+        i = int(entry.custom_id.removeprefix("pair_"))
+        if entry.result.type == "succeeded":
+            results[i] = _parse_spot_check(entry.result.message)
+
+    for i, pair in enumerate(pairs):
+        if results[i] is None:
+            try:
+                response = client.messages.create(**_spot_check_request(
+                    system, pair["original"], pair["translated"], source_language, target_language,
+                ))
+                results[i] = _parse_spot_check(response)
+            except Exception as e:
+                results[i] = {"error": str(e), "type": type(e).__name__}
+    return results
+
+
+def _spot_check_request(system, original_text, translated_text, source_language, target_language) -> dict:
+    """messages.create() arguments for scoring one pair."""
+    user_msg = f"ORIGINAL ({source_language}):\n{original_text}\n\nTRANSLATION ({target_language}):\n{translated_text}"
+    return {
+        "model": SPOT_CHECK_MODEL,
+        "max_tokens": 1024,
+        "temperature": 0.2,
+        "system": system,
+        "messages": [{"role": "user", "content": user_msg}],
+    }
+
+
+def _parse_spot_check(response) -> dict:
+    """Scores dict from an evaluator response, or an error dict if it isn't JSON."""
+    result_text = "".join(b.text for b in response.content if b.type == "text")
+
+    # The object spans the first "{" to the last "}", which skips markdown
+    # fences and any prose around it
+    start = result_text.find("{")
+    end = result_text.rfind("}") + 1
+    try:
+        if start < 0 or end <= start:
+            raise json.JSONDecodeError("No JSON object in response", result_text, 0)
+        result = loads(result_text[start:end])
     except json.JSONDecodeError:
-        return json.dumps({
+        return {
             "error": "Failed to parse quality evaluation response",
-            "raw_response": result_text[:500],
-        })
-    except Exception as e:
-        return json.dumps({"error": str(e), "type": type(e).__name__})
+            "raw_response": result_text.strip()[:500],
+        }
+    result["tokens_used"] = {
+        "input": response.usage.input_tokens,
+        "output": response.usage.output_tokens,
+    }
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def _evaluator_system(
+    source_language: str,
+    target_language: str,
+    style_instructions: str,
+    protected_nouns: str,
+) -> list[dict]:
+    """System blocks for the evaluator: the fixed rubric, then this profile's context.
+
+    Neither block is marked for prompt caching: the whole prompt is a few
+    hundred tokens, below Sonnet's 1024-token minimum, so a breakpoint would
+    be ignored. The same list is returned for the same arguments; callers
+    must not mutate it.
+    """
+    nouns = ", ".join(_parse_nouns(protected_nouns))
+    context = "\n".join(line for line in (
+        f"You are assessing {source_language} → {target_language} translations.",
+        f"Style context: {style_instructions}" if style_instructions else "",
+        f"Protected nouns (must not be translated): {nouns}" if nouns else "",
+    ) if line)
+    return [
+        {"type": "text", "text": EVALUATOR_RUBRIC},
+        {"type": "text", "text": context},
+    ]
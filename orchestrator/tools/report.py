@@ -1,14 +1,46 @@
 """Report generation tool — create markdown translation quality/cost reports."""
 
+import io
 import json
 import os
+from collections.abc import Awaitable
 from datetime import datetime
 
+from ._files import write_atomic
+from ._json import dumps, loads
+
+# ASCII characters that are not allowed in a report filename
+_FILENAME_DELETE = str.maketrans("", "", "".join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) in " -_")
+))
+
+_METADATA_FIELDS = tuple(
+    (key, key.replace("_", " ").title())
+    for key in (
+        "title", "author", "format", "detected_language",
+        "chapters", "total_paragraphs", "estimated_words",
+    )
+)
+
+_STAT_FIELDS = (
+    ("total_requests", "API Calls"),
+    ("chunk_counter", "Chunks Processed"),
+    ("pass1_only_count", "Pass 1 Only"),
+    ("full_3pass_count", "Full 3-Pass"),
+    ("reviews_ok", "Reviews OK"),
+    ("reviews_fixed", "Reviews Fixed"),
+    ("glossary_terms", "Glossary Terms"),
+    ("total_input_tokens", "Input Tokens"),
+    ("total_output_tokens", "Output Tokens"),
+    ("total_cache_read_tokens", "Cache Read Tokens"),
+    ("total_cache_create_tokens", "Cache Create Tokens"),
+)
+
 
 def generate_report(
-    translation_stats: str = "{}",
-    quality_results: str = "{}",
-    book_metadata: str = "{}",
+    translation_stats: str | dict = "{}",
+    quality_results: str | dict | list = "{}",
+    book_metadata: str | dict = "{}",
     profile_name: str = "Default",
     model_used: str = "claude-sonnet-4-20250514",
     output_path: str = "",
@@ -16,9 +48,9 @@ def generate_report(
     """Generate a markdown translation quality/cost report.
 
     Args:
-        translation_stats: JSON string with TranslationStats data
-        quality_results: JSON string with quality spot-check results
-        book_metadata: JSON string with book analysis data
+        translation_stats: TranslationStats data, as JSON string or dict
+        quality_results: Quality spot-check results, as JSON string or parsed
+        book_metadata: Book analysis data, as JSON string or dict
         profile_name: Name of the translation profile used
         model_used: Model ID used for translation
         output_path: Where to save the report (default: auto-generate)
@@ -27,142 +59,169 @@ def generate_report(
         JSON string with report path and summary.
     """
     try:
-        stats = json.loads(translation_stats) if translation_stats else {}
-        quality = json.loads(quality_results) if quality_results else {}
-        metadata = json.loads(book_metadata) if book_metadata else {}
+        stats = _as_data(translation_stats)
+        quality = _as_data(quality_results)
+        metadata = _as_data(book_metadata)
     except json.JSONDecodeError as e:
-        return json.dumps({"error": f"Invalid JSON input: {e}"})
+        return dumps({"error": f"Invalid JSON input: {e}"})
 
-    # Auto-generate output path
-    if not output_path:
-        title = metadata.get("title", "unknown")
-        safe_title = "".join(c for c in title if c.isalnum() or c in " -_")[:50].strip()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = f"report_{safe_title}_{timestamp}.md"
+    buf = io.StringIO()
+    _write_head(buf, stats, metadata, profile_name, model_used)
+    _write_quality(buf, quality)
+    return _save(buf, stats, quality, metadata, output_path)
+
+
+async def generate_report_async(
+    translation_stats: str | dict = "{}",
+    quality_results: Awaitable[str | dict | list] | None = None,
+    book_metadata: str | dict = "{}",
+    profile_name: str = "Default",
+    model_used: str = "claude-sonnet-4-20250514",
+    output_path: str = "",
+) -> str:
+    """generate_report, with the quality results still pending.
 
-    # Build report
-    lines = []
-    lines.append(f"# Translation Report")
-    lines.append(f"")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"**Model:** {model_used}")
-    lines.append(f"**Profile:** {profile_name}")
-    lines.append(f"")
+    The book and statistics sections are rendered first; quality_results
+    is only awaited for the quality section, so the report can be started
+    while the spot-checks are still running.
+    """
+    try:
+        stats = _as_data(translation_stats)
+        metadata = _as_data(book_metadata)
+    except json.JSONDecodeError as e:
+        return dumps({"error": f"Invalid JSON input: {e}"})
+
+    buf = io.StringIO()
+    _write_head(buf, stats, metadata, profile_name, model_used)
+
+    try:
+        quality = _as_data(await quality_results if quality_results is not None else "")
+    except json.JSONDecodeError as e:
+        return dumps({"error": f"Invalid JSON input: {e}"})
+    _write_quality(buf, quality)
+    return _save(buf, stats, quality, metadata, output_path)
+
+
+def _as_data(value):
+    """A tool input that may arrive as JSON text or already parsed."""
+    if isinstance(value, (str, bytes)):
+        return loads(value) if value else {}
+    return value or {}
+
+
+def _write_head(buf, stats, metadata, profile_name, model_used):
+    """Title block, book information and translation statistics."""
+    buf.write(f"""\
+# Translation Report
+
+**Generated:** {datetime.now():%Y-%m-%d %H:%M:%S}
+**Model:** {model_used}
+**Profile:** {profile_name}
+
+""")
 
     # Book metadata
     if metadata:
-        lines.append(f"## Book Information")
-        lines.append(f"")
-        lines.append(f"| Field | Value |")
-        lines.append(f"|-------|-------|")
-        for key in ["title", "author", "format", "detected_language", "chapters", "total_paragraphs", "estimated_words"]:
+        buf.write("## Book Information\n\n| Field | Value |\n|-------|-------|\n")
+        for key, label in _METADATA_FIELDS:
             if key in metadata:
-                lines.append(f"| {key.replace('_', ' ').title()} | {metadata[key]} |")
-        lines.append(f"")
+                buf.write(f"| {label} | {metadata[key]} |\n")
+        buf.write("\n")
 
     # Translation stats
     if stats:
-        lines.append(f"## Translation Statistics")
-        lines.append(f"")
-        lines.append(f"| Metric | Value |")
-        lines.append(f"|--------|-------|")
-
-        stat_fields = [
-            ("total_requests", "API Calls"),
-            ("chunk_counter", "Chunks Processed"),
-            ("pass1_only_count", "Pass 1 Only"),
-            ("full_3pass_count", "Full 3-Pass"),
-            ("reviews_ok", "Reviews OK"),
-            ("reviews_fixed", "Reviews Fixed"),
-            ("glossary_terms", "Glossary Terms"),
-            ("total_input_tokens", "Input Tokens"),
-            ("total_output_tokens", "Output Tokens"),
-            ("total_cache_read_tokens", "Cache Read Tokens"),
-            ("total_cache_create_tokens", "Cache Create Tokens"),
-        ]
-        for key, label in stat_fields:
+        buf.write("## Translation Statistics\n\n| Metric | Value |\n|--------|-------|\n")
+        for key, label in _STAT_FIELDS:
             if key in stats:
                 val = stats[key]
                 if isinstance(val, (int, float)) and val > 1000:
-                    val = f"{val:,}"
-                lines.append(f"| {label} | {val} |")
+                    val = format(val, ",")
+                buf.write(f"| {label} | {val} |\n")
 
         if "cost_estimate" in stats:
-            lines.append(f"| **Estimated Cost** | **${stats['cost_estimate']:.2f}** |")
+            buf.write(f"| **Estimated Cost** | **${stats['cost_estimate']:.2f}** |\n")
         if "cost_without_cache" in stats:
             savings = stats["cost_without_cache"] - stats.get("cost_estimate", 0)
             if savings > 0.01:
-                lines.append(f"| Cache Savings | ${savings:.2f} |")
+                buf.write(f"| Cache Savings | ${savings:.2f} |\n")
 
-        lines.append(f"")
+        buf.write("\n")
 
-    # Quality results
+
+def _write_quality(buf, quality):
+    """Quality assessment section, for one spot check or a list of them."""
     if quality:
-        lines.append(f"## Quality Assessment")
-        lines.append(f"")
+        buf.write("## Quality Assessment\n\n")
 
         if isinstance(quality, list):
             # Multiple spot checks
             all_scores = []
             for i, check in enumerate(quality):
-                scores = check.get("scores", {})
                 avg = check.get("average", 0)
                 all_scores.append(avg)
-                summary = check.get("summary", "N/A")
-                lines.append(f"### Sample {i+1}")
-                lines.append(f"")
-                lines.append(f"- **Average:** {avg:.1f}/5")
-                lines.append(f"- **Summary:** {summary}")
+                buf.write(f"### Sample {i+1}\n\n"
+                          f"- **Average:** {avg:.1f}/5\n"
+                          f"- **Summary:** {check.get('summary', 'N/A')}\n")
                 issues = check.get("issues", [])
                 if issues:
-                    lines.append(f"- **Issues:** {', '.join(issues)}")
-                lines.append(f"")
+                    buf.write(f"- **Issues:** {', '.join(issues)}\n")
+                buf.write("\n")
 
             if all_scores:
                 overall = sum(all_scores) / len(all_scores)
-                lines.append(f"### Overall Quality Score: {overall:.1f}/5")
-                lines.append(f"")
                 if overall >= 4.0:
-                    lines.append(f"Quality is **good**. No retranslation recommended.")
+                    verdict = "Quality is **good**. No retranslation recommended."
                 elif overall >= 3.0:
-                    lines.append(f"Quality is **acceptable** but could be improved in specific areas.")
+                    verdict = "Quality is **acceptable** but could be improved in specific areas."
                 else:
-                    lines.append(f"Quality is **below threshold**. Consider retranslation with adjusted profile.")
+                    verdict = "Quality is **below threshold**. Consider retranslation with adjusted profile."
+                buf.write(f"### Overall Quality Score: {overall:.1f}/5\n\n{verdict}\n")
         elif isinstance(quality, dict) and "scores" in quality:
             # Single spot check
-            scores = quality.get("scores", {})
-            lines.append(f"| Dimension | Score |")
-            lines.append(f"|-----------|-------|")
-            for dim, score in scores.items():
-                lines.append(f"| {dim.title()} | {score}/5 |")
-            lines.append(f"| **Average** | **{quality.get('average', 0):.1f}/5** |")
-            lines.append(f"")
+            buf.write("| Dimension | Score |\n|-----------|-------|\n")
+            for dim, score in quality.get("scores", {}).items():
+                buf.write(f"| {dim.title()} | {score}/5 |\n")
+            buf.write(f"| **Average** | **{quality.get('average', 0):.1f}/5** |\n\n")
             if quality.get("summary"):
-                lines.append(f"**Summary:** {quality['summary']}")
+                buf.write(f"**Summary:** {quality['summary']}\n")
             issues = quality.get("issues", [])
             if issues:
-                lines.append(f"")
-                lines.append(f"**Issues found:**")
-                for issue in issues:
-                    lines.append(f"- {issue}")
+                buf.write("\n**Issues found:**\n")
+                buf.writelines(f"- {issue}\n" for issue in issues)
+
+        buf.write("\n")
 
-        lines.append(f"")
+
+def _save(buf, stats, quality, metadata, output_path) -> str:
+    """Finish the report in buf, write it out and return the JSON summary."""
+    # Auto-generate output path
+    if not output_path:
+        title = metadata.get("title", "unknown")
+        safe_title = _safe_filename(title)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = f"report_{safe_title}_{timestamp}.md"
 
     # Footer
-    lines.append(f"---")
-    lines.append(f"*Report generated by translation-orchestrator v0.1.0*")
+    buf.write("---\n*Report generated by translation-orchestrator v0.1.0*")
 
-    report_content = "\n".join(lines)
+    report_content = buf.getvalue()
 
     # Write report
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(report_content)
+    write_atomic(output_path, report_content.encode("utf-8"))
 
-    return json.dumps({
+    return dumps({
         "status": "generated",
         "path": output_path,
-        "lines": len(lines),
+        "lines": report_content.count("\n") + 1,
         "has_stats": bool(stats),
         "has_quality": bool(quality),
     })
+
+
+def _safe_filename(title: str) -> str:
+    """Title reduced to letters, digits, spaces, '-' and '_', at most 50 chars."""
+    title = title[:256]
+    if title.isascii():
+        return title.translate(_FILENAME_DELETE)[:50].strip()
+    return "".join(c for c in title if c.isalnum() or c in " -_")[:50].strip()
@@ -1,11 +1,35 @@
 """Translation tool — runs 3-pass literary translation directly via Python API."""
 
 import os
-import json
 import asyncio
+import itertools
 from dataclasses import asdict
 from pathlib import Path
 
+from ._client import anthropic_client
+from ._json import dumps
+
+# TXT books are translated and written out this many lines at a time
+TXT_CHUNK_LINES = 500
+
+# Language names the translator prompts with, by language code
+LANGUAGE_NAMES = {
+    "de": "German", "en": "English", "fr": "French", "es": "Spanish",
+    "it": "Italian", "pt": "Portuguese", "nl": "Dutch", "ru": "Russian",
+    "ja": "Japanese", "zh": "Chinese", "ko": "Korean", "pl": "Polish",
+}
+
+
+def language_to_name(code: str, default: str = "") -> str:
+    """Language name for a code; unknown codes are returned as-is.
+
+    An empty or "unknown" code (as analyze_book reports when detection
+    fails) gives default instead.
+    """
+    if not code or code == "unknown":
+        return default
+    return LANGUAGE_NAMES.get(code.lower(), code)
+
 
 def run_translation(
     book_path: str,
@@ -19,6 +43,9 @@ def run_translation(
     block_size: int = 1500,
     resume: bool = False,
     source_lang: str = "auto",
+    batch_api: bool = False,
+    rpm: int = 0,
+    tpm: int = 0,
 ) -> str:
     """Run 3-pass literary translation on a book.
 
@@ -36,21 +63,61 @@ def run_translation(
         block_size: Batch size in tokens (default: 1500, 0 to disable)
         resume: Resume interrupted translation (default: False)
         source_lang: Source language code (default: auto)
+        batch_api: Translate through Anthropic Message Batches — 50% cheaper,
+            finishes in minutes to hours. Requires use_context=False and
+            resume=False (default: False)
+        rpm: Requests per minute limit (default: 0, no limit)
+        tpm: Tokens per minute limit (default: 0, no limit)
 
     Returns:
         JSON string with translation results and stats.
     """
-    if not os.path.exists(book_path):
-        return json.dumps({"error": f"File not found: {book_path}"})
+    return dumps(run_translation_dict(
+        book_path=book_path,
+        language=language,
+        model=model,
+        profile_path=profile_path,
+        use_context=use_context,
+        skip_review=skip_review,
+        test_mode=test_mode,
+        test_num=test_num,
+        block_size=block_size,
+        resume=resume,
+        source_lang=source_lang,
+        batch_api=batch_api,
+        rpm=rpm,
+        tpm=tpm,
+    ))
+
 
+def run_translation_dict(
+    book_path: str,
+    language: str = "de",
+    model: str = "3pass-sonnet",
+    profile_path: str = "",
+    use_context: bool = True,
+    skip_review: bool = False,
+    test_mode: bool = False,
+    test_num: int = 5,
+    block_size: int = 1500,
+    resume: bool = False,
+    source_lang: str = "auto",
+    batch_api: bool = False,
+    rpm: int = 0,
+    tpm: int = 0,
+) -> dict:
+    """run_translation(), returning the result as a dict instead of a JSON string."""
     ext = Path(book_path).suffix.lower()
     if ext not in (".epub", ".txt", ".pdf"):
-        return json.dumps({"error": f"Unsupported format: {ext}"})
+        return {"error": f"Unsupported format: {ext}"}
+
+    if batch_api and (use_context or resume):
+        return {"error": "batch_api requires use_context=false and resume=false"}
 
     # Resolve API key
     api_key = os.environ.get("BBM_CLAUDE_API_KEY") or os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        return json.dumps({"error": "No API key found. Set ANTHROPIC_API_KEY or BBM_CLAUDE_API_KEY."})
+        return {"error": "No API key found. Set ANTHROPIC_API_KEY or BBM_CLAUDE_API_KEY."}
 
     # Resolve model
     model_id_map = {
@@ -60,13 +127,7 @@ def run_translation(
     }
     claude_model = model_id_map.get(model, "claude-sonnet-4-20250514")
 
-    # Resolve language name
-    lang_map = {
-        "de": "German", "en": "English", "fr": "French", "es": "Spanish",
-        "it": "Italian", "pt": "Portuguese", "nl": "Dutch", "ru": "Russian",
-        "ja": "Japanese", "zh": "Chinese", "ko": "Korean", "pl": "Polish",
-    }
-    language_name = lang_map.get(language.lower(), language)
+    language_name = language_to_name(language)
 
     try:
         return _run_translation_sync(
@@ -83,25 +144,40 @@ def run_translation(
             block_size=block_size,
             resume=resume,
             source_lang=source_lang,
+            batch_api=batch_api,
+            rpm=rpm,
+            tpm=tpm,
         )
+    except FileNotFoundError as e:
+        # The book is only opened once translation starts; no separate
+        # existence probe up front
+        if e.filename == book_path:
+            return {"error": f"File not found: {book_path}"}
+        return {"error": str(e), "type": type(e).__name__}
     except Exception as e:
-        return json.dumps({"error": str(e), "type": type(e).__name__})
+        return {"error": str(e), "type": type(e).__name__}
 
 
 def _run_translation_sync(
     book_path, ext, api_key, claude_model, language_name,
     profile_path, use_context, skip_review, test_mode,
-    test_num, block_size, resume, source_lang,
-) -> str:
+    test_num, block_size, resume, source_lang, batch_api=False, rpm=0, tpm=0,
+) -> dict:
     """Run translation synchronously."""
     from book_maker.translator.claude_3pass_translator import Claude3Pass
     from book_maker.utils import prompt_config_to_kwargs
 
+    if ext not in (".epub", ".txt"):
+        return {"error": f"Direct translation not yet supported for {ext}. Use epub or txt."}
+
     # Track progress events
     progress_events = []
-    chunk_results = []
+    chunks_processed = 0
+    name, _ = os.path.splitext(book_path)
+    chunks_log = f"{name}_bilingual{ext}.chunks.jsonl"
 
-    # Create translator instance
+    # Create translator instance; the translator holds per-book context,
+    # glossary and stats, so only the HTTP client is reused between runs
     translator = Claude3Pass(
         key=api_key,
         language=language_name,
@@ -109,117 +185,188 @@ def _run_translation_sync(
         skip_review=skip_review,
         model_name=claude_model,
         source_lang=source_lang,
+        state_path=f"{book_path}.trstate.json",
+        client=anthropic_client(api_key),
     )
 
-    # Load profile if specified
-    if profile_path and os.path.exists(profile_path):
-        translator.load_profile(profile_path)
+    # Load profile if specified; a missing profile file is skipped
+    if profile_path:
+        try:
+            translator.load_profile(profile_path)
+        except FileNotFoundError:
+            pass
+
+    if resume:
+        translator.load_state()
+
+    translator.set_rate_limits(rpm, tpm)
+
+    # Per-chunk records go to a JSON Lines file next to the output as they
+    # arrive, so the result stays small however long the book is. The file
+    # is opened on the first chunk: a book that fails to open leaves none.
+    log = None
 
-    # Register hooks for progress tracking
     def on_chunk(event):
-        chunk_results.append({
+        nonlocal log, chunks_processed
+        if log is None:
+            log = open(chunks_log, "w", encoding="utf-8")
+        chunks_processed += 1
+        log.write(dumps({
             "chunk": event.chunk_number,
             "passes": event.passes_used,
             "quality_ok": event.quality_ok,
             "is_batch": event.is_batch,
             "para_count": event.paragraph_count,
-        })
+        }) + "\n")
 
     translator.on("on_chunk_complete", on_chunk)
 
-    if ext == ".epub":
-        output_path = _translate_epub(
-            book_path, translator, language_name, use_context,
-            test_mode, test_num, block_size, resume, source_lang,
-            progress_events,
-        )
-    elif ext == ".txt":
-        output_path = _translate_txt(
-            book_path, translator, language_name,
-            test_mode, test_num,
-        )
-    else:
-        return json.dumps({"error": f"Direct translation not yet supported for {ext}. Use epub or txt."})
+    try:
+        if ext == ".epub":
+            output_path = _translate_epub(
+                book_path, translator, language_name, use_context,
+                test_mode, test_num, block_size, resume, source_lang,
+                progress_events, batch_api,
+            )
+        else:
+            output_path = _translate_txt(
+                book_path, translator, language_name,
+                test_mode, test_num, batch_api,
+            )
+    finally:
+        if log is not None:
+            log.close()
+        translator.close()
+
+    # The book is done, so there is nothing left to resume
+    translator.clear_state()
 
     # Get final stats
     stats = translator.get_stats()
 
-    return json.dumps({
+    return {
         "status": "completed",
         "output_path": output_path,
         "stats": asdict(stats),
-        "chunks_processed": len(chunk_results),
+        "chunks_processed": chunks_processed,
+        "chunks_log": chunks_log if chunks_processed else "",
         "model": claude_model,
         "profile": translator.profile_name,
-    }, ensure_ascii=False, indent=2)
+    }
+
+
+class _TranslatorFactory:
+    """Wraps a pre-built translator to satisfy EPUBBookLoader's model(key, lang, ...) call."""
+
+    __slots__ = ("_instance",)
+
+    def __init__(self, translator_instance):
+        self._instance = translator_instance
+
+    def __call__(self, key, language, **kwargs):
+        return self._instance
+
+
+class _ProgressRecorder:
+    """EPUBBookLoader progress callback that appends each event to a list."""
+
+    __slots__ = ("events",)
+
+    def __init__(self, events):
+        self.events = events
+
+    def __call__(self, event_type, data):
+        self.events.append({"event": event_type, **data})
 
 
 def _translate_epub(
     book_path, translator, language_name, use_context,
     test_mode, test_num, block_size, resume, source_lang,
-    progress_events,
+    progress_events, batch_api=False,
 ) -> str:
     """Run epub translation using the loader."""
     from book_maker.loader.epub_loader import EPUBBookLoader
 
-    # Progress callback for the loader
-    def progress_cb(event_type, data):
-        progress_events.append({"event": event_type, **data})
-
-    # EPUBBookLoader expects a model factory (class), not an instance.
-    # We wrap our pre-configured translator in a factory that returns it.
-    class TranslatorFactory:
-        """Wraps a pre-built translator to satisfy EPUBBookLoader's model(key, lang, ...) call."""
-        def __init__(self, translator_instance):
-            self._instance = translator_instance
+    # EPUBBookLoader expects a model factory (class), not an instance
+    factory = _TranslatorFactory(translator)
+    progress_cb = _ProgressRecorder(progress_events)
 
-        def __call__(self, key, language, **kwargs):
-            return self._instance
-
-    factory = TranslatorFactory(translator)
+    def make_loader():
+        return EPUBBookLoader(
+            epub_name=book_path,
+            model=factory,
+            key="unused",  # key already in translator
+            resume=resume,
+            language=language_name,
+            is_test=test_mode,
+            test_num=test_num,
+            single_translate=True,
+            context_flag=use_context,
+            source_lang=source_lang,
+            progress_callback=progress_cb,
+        )
 
-    loader = EPUBBookLoader(
-        epub_name=book_path,
-        model=factory,
-        key="unused",  # key already in translator
-        resume=resume,
-        language=language_name,
-        is_test=test_mode,
-        test_num=test_num,
-        single_translate=True,
-        context_flag=use_context,
-        source_lang=source_lang,
-        progress_callback=progress_cb,
-    )
+    if batch_api:
+        # Same two-step flow as the CLI's --batch / --batch-use: the first run
+        # queues paragraphs and runs the Message Batches, the second writes
+        # the epub from the stored results. block_size stays off so every
+        # paragraph goes through the queue.
+        loader = make_loader()
+        loader.batch_flag = True
+        loader.make_bilingual_book()
+
+        loader = make_loader()
+        loader.batch_use_flag = True
+        loader.make_bilingual_book()
+    else:
+        loader = make_loader()
 
-    # Set block_size
-    if block_size > 0:
-        loader.block_size = block_size
+        # Set block_size
+        if block_size > 0:
+            loader.block_size = block_size
 
-    loader.make_bilingual_book()
+        loader.make_bilingual_book()
 
     name, _ = os.path.splitext(book_path)
     return f"{name}_bilingual.epub"
 
 
-def _translate_txt(book_path, translator, language_name, test_mode, test_num) -> str:
-    """Simple TXT translation — translate line by line."""
-    with open(book_path, "r", encoding="utf-8") as f:
-        lines = [l.strip() for l in f.readlines() if l.strip()]
+def _iter_lines(f):
+    """Non-blank lines of an open text file, stripped, read lazily."""
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
 
-    if test_mode:
-        lines = lines[:test_num]
 
-    translated = []
-    for line in lines:
-        result = translator.translate(line)
-        translated.append(result)
+def _translate_txt(book_path, translator, language_name, test_mode, test_num, batch_api=False) -> str:
+    """Simple TXT translation — short lines are packed into batched calls.
 
+    Lines are read and written TXT_CHUNK_LINES at a time, so memory stays
+    flat however long the file is. A batch-API run submits all lines at once.
+    """
     name, _ = os.path.splitext(book_path)
     output_path = f"{name}_bilingual.txt"
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for orig, trans in zip(lines, translated):
-            f.write(f"{orig}\n{trans}\n\n")
+    # The book is opened before the output, so a missing book leaves no
+    # empty output file behind
+    with open(book_path, "r", encoding="utf-8") as src, \
+            open(output_path, "w", encoding="utf-8") as f:
+        lines = _iter_lines(src)
+        if test_mode:
+            lines = itertools.islice(lines, test_num)
+
+        if batch_api:
+            chunks = [list(lines)]
+        else:
+            chunks = iter(lambda: list(itertools.islice(lines, TXT_CHUNK_LINES)), [])
+
+        for chunk in chunks:
+            if batch_api:
+                translated = translator.translate_batched(chunk)
+            else:
+                translated = [r.text for r in translator.translate_chapter(chunk)]
+            for orig, trans in zip(chunk, translated):
+                f.write(f"{orig}\n{trans}\n\n")
 
     return output_path
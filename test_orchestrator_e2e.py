@@ -3,82 +3,186 @@
 
 Runs all orchestrator tool functions in sequence (same workflow the Agent SDK
 would drive), bypassing the SDK subprocess transport that has issues on Windows.
+For real books, `run_orchestrator.py --direct` runs the same steps in-process
+through orchestrator.pipeline.run_pipeline.
+
+Output is buffered and written at step boundaries; pass --verbose to see it
+as it happens. Pass --batch to run the quality spot-checks through Anthropic
+Message Batches (half price, but step 5 then takes minutes).
+
+The translation and quality-check results are checkpointed under
+E2E_CACHE_DIR, keyed on the book, its settings and the selected profile, so
+a rerun only repeats the API-bound steps whose inputs changed. Pass
+--no-cache to run everything again.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib
+import io
 import json
 import os
 import sys
+import threading
 import time
 
+from orchestrator.tools._json import dump_file, dumps, dumps_indented, loads
+
+# Per-step checkpoints of earlier runs
+E2E_CACHE_DIR = ".e2e_cache"
+
 # Ensure API key is set
 if not os.environ.get("ANTHROPIC_API_KEY"):
     print("ERROR: Set ANTHROPIC_API_KEY first")
     sys.exit(1)
 
+# Imported lazily by the tools; loaded in the background from startup so
+# the steps don't wait on them
+PREIMPORT_MODULES = (
+    "anthropic",
+    "ebooklib.epub",
+    "book_maker.loader.epub_loader",
+    "book_maker.translator.claude_3pass_translator",
+)
+
+
+def _preimport():
+    for name in PREIMPORT_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass  # the step that needs it reports the error
+
+
+threading.Thread(target=_preimport, daemon=True).start()
+
+
+# Output is collected here and written out at step boundaries, so console
+# writes don't stall the steps; --verbose writes it as it happens
+LOG = io.StringIO()
+VERBOSE = "--verbose" in sys.argv[1:]
+
+
+def say(*args):
+    print(*args, file=sys.stdout if VERBOSE else LOG)
+
+
+def flush_log():
+    sys.stdout.write(LOG.getvalue())
+    sys.stdout.flush()
+    LOG.seek(0)
+    LOG.truncate()
+
 
 def step(name):
-    print(f"\n{'=' * 60}")
-    print(f"  STEP: {name}")
-    print(f"{'=' * 60}\n")
+    flush_log()
+    say(f"\n{'=' * 60}")
+    say(f"  STEP: {name}")
+    say(f"{'=' * 60}\n")
+
+
+def pretty(data):
+    """Pretty-print a JSON string, or an already parsed result as-is."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", "replace")
+    if isinstance(data, str):
+        return _pretty_str(data)
+    try:
+        return dumps_indented(data).decode()
+    except TypeError:
+        return str(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_str(json_str):
+    try:
+        return dumps_indented(loads(json_str)).decode()
+    except json.JSONDecodeError:
+        return json_str
+
+
+def _checkpoint_key(book_path, profile_path, *settings):
+    """Short hash of the book, the profile and the run settings."""
+    parts = [os.path.abspath(book_path), os.stat(book_path).st_mtime_ns]
+    if profile_path:
+        parts += [os.path.abspath(profile_path), os.stat(profile_path).st_mtime_ns]
+    parts += settings
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:12]
 
 
-def pretty(json_str):
-    """Pretty-print a JSON string."""
+def _load_checkpoint(path):
+    """The result stored at path by an earlier run, or None."""
     try:
-        data = json.loads(json_str)
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    except (json.JSONDecodeError, TypeError):
-        return str(json_str)
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except (OSError, json.JSONDecodeError):
+        return None
 
 
-def main():
+def _save_checkpoint(path, result):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    dump_file(result, path)
+
+
+async def main():
     book_path = "test_books/animal_farm.epub"
     test_num = 10
     language = "de"
     model = "3pass-sonnet"
     profiles_dir = "examples/profiles"
     report_dir = "."
+    batch_api = "--batch" in sys.argv[1:]
+    use_cache = "--no-cache" not in sys.argv[1:]
 
-    print(f"Full Orchestrator E2E Test")
-    print(f"  Book: {book_path}")
-    print(f"  Language: {language}")
-    print(f"  Model: {model}")
-    print(f"  Paragraphs: {test_num}")
-    print(f"  Profiles dir: {profiles_dir}")
+    say(f"Full Orchestrator E2E Test")
+    say(f"  Book: {book_path}")
+    say(f"  Language: {language}")
+    say(f"  Model: {model}")
+    say(f"  Paragraphs: {test_num}")
+    say(f"  Profiles dir: {profiles_dir}")
 
     t0 = time.time()
 
+    from orchestrator.tools._client import anthropic_client
+    from orchestrator.tools.analyze import analyze_book_dict
+    from orchestrator.tools.profiles import list_profiles_dict
+    from orchestrator.tools.translate import language_to_name
+
+    # Build the shared API client up front; translation and the quality
+    # checks all reuse it
+    anthropic_client(os.environ["ANTHROPIC_API_KEY"])
+
+    # Steps 1 and 2 read different files and don't depend on each other,
+    # so they run together; their output is printed in step order after
+    analysis, profiles = await asyncio.gather(
+        asyncio.to_thread(analyze_book_dict, book_path=book_path, sample_count=3),
+        asyncio.to_thread(list_profiles_dict, profiles_dir=profiles_dir),
+    )
+
     # ── Step 1: Analyze book ──────────────────────────────────────────
     step("1/6 — Analyze Book")
-    from orchestrator.tools.analyze import analyze_book
-
-    analysis_json = analyze_book(book_path=book_path, sample_count=3)
-    analysis = json.loads(analysis_json)
-    print(f"  Title: {analysis.get('title', 'Unknown')}")
-    print(f"  Chapters: {analysis.get('chapters', '?')}")
-    print(f"  Total paragraphs: {analysis.get('total_paragraphs', '?')}")
-    print(f"  Source language: {analysis.get('source_language', '?')}")
-    print(f"  Word count: {analysis.get('word_count', '?')}")
+    say(f"  Title: {analysis.get('title', 'Unknown')}")
+    say(f"  Chapters: {analysis.get('chapters', '?')}")
+    say(f"  Total paragraphs: {analysis.get('total_paragraphs', '?')}")
+    say(f"  Source language: {analysis.get('detected_language', '?')}")
+    say(f"  Word count: {analysis.get('estimated_words', '?')}")
     if "cost_estimates" in analysis:
         est = analysis["cost_estimates"]
-        print(f"  Cost estimates: Sonnet ~${est.get('sonnet_with_cache', '?')}, "
-              f"Opus ~${est.get('opus_with_cache', '?')}")
+        say(f"  Cost estimates: Sonnet ~{est.get('sonnet_with_cache', '?')}, "
+            f"Opus ~{est.get('opus_with_cache', '?')}")
 
-    source_lang = analysis.get("source_language", "English")
+    source_lang = language_to_name(analysis.get("detected_language", ""), "English")
 
     # ── Step 2: List profiles ─────────────────────────────────────────
     step("2/6 — List Profiles & Select")
-    from orchestrator.tools.profiles import list_profiles
 
-    profiles_json = list_profiles(profiles_dir=profiles_dir)
-    profiles = json.loads(profiles_json)
-
-    print(f"  Found {len(profiles.get('profiles', []))} profiles:")
+    say(f"  Found {len(profiles.get('profiles', []))} profiles:")
     selected_profile = None
     for p in profiles.get("profiles", []):
         name = p.get("name", "?")
         desc = p.get("description", "")[:60]
-        print(f"    - {name}: {desc}")
+        say(f"    - {name}: {desc}")
         # Pick the "classic" or "literary" profile if available
         if "classic" in name.lower() or "literary" in name.lower():
             selected_profile = p.get("path", "")
@@ -92,135 +196,186 @@ def main():
                 break
 
     if selected_profile:
-        print(f"\n  Selected profile: {selected_profile}")
+        say(f"\n  Selected profile: {selected_profile}")
     else:
-        print("\n  No profile found, using defaults")
+        say("\n  No profile found, using defaults")
         selected_profile = ""
 
     # ── Step 3: Translate (10 paragraphs) ─────────────────────────────
     step(f"3/6 — Translate ({test_num} paragraphs)")
-    from orchestrator.tools.translate import run_translation
-
-    translate_json = run_translation(
-        book_path=book_path,
-        language=language,
-        model=model,
-        profile_path=selected_profile,
-        use_context=True,
-        skip_review=False,
-        test_mode=True,
-        test_num=test_num,
-        block_size=1500,
-        resume=False,
-        source_lang="en",
-    )
-    translate_result = json.loads(translate_json)
+    from orchestrator.tools.translate import run_translation_dict
 
-    if translate_result.get("error"):
-        print(f"  ERROR: {translate_result['error']}")
-        sys.exit(1)
+    checkpoint_dir = os.path.join(E2E_CACHE_DIR, _checkpoint_key(
+        book_path, selected_profile, test_num, language, model,
+    ))
+    translate_checkpoint = os.path.join(checkpoint_dir, "translate.json")
+
+    translate_result = _load_checkpoint(translate_checkpoint) if use_cache else None
+    if translate_result and os.path.exists(translate_result.get("output_path", "")):
+        say(f"  Reusing checkpoint {translate_checkpoint}")
+    else:
+        translate_result = run_translation_dict(
+            book_path=book_path,
+            language=language,
+            model=model,
+            profile_path=selected_profile,
+            use_context=True,
+            skip_review=False,
+            test_mode=True,
+            test_num=test_num,
+            block_size=1500,
+            resume=False,
+            source_lang="en",
+        )
+
+        if translate_result.get("error"):
+            say(f"  ERROR: {translate_result['error']}")
+            sys.exit(1)
+        _save_checkpoint(translate_checkpoint, translate_result)
+        # A fresh translation makes the old quality checks stale
+        try:
+            os.remove(os.path.join(checkpoint_dir, "quality.json"))
+        except FileNotFoundError:
+            pass
 
     output_path = translate_result.get("output_path", "")
     stats = translate_result.get("stats", {})
-    print(f"  Status: {translate_result.get('status', '?')}")
-    print(f"  Output: {output_path}")
-    print(f"  Chunks: {translate_result.get('chunks_processed', '?')}")
-    print(f"  API calls: {stats.get('total_requests', '?')}")
-    print(f"  Tokens: {stats.get('total_input_tokens', 0):,} in / {stats.get('total_output_tokens', 0):,} out")
-    print(f"  Cost: ${stats.get('cost_estimate', 0):.2f}")
-    print(f"  P1-only: {stats.get('pass1_only_count', 0)} | "
+    say(f"  Status: {translate_result.get('status', '?')}")
+    say(f"  Output: {output_path}")
+    say(f"  Chunks: {translate_result.get('chunks_processed', '?')}")
+    say(f"  API calls: {stats.get('total_requests', '?')}")
+    say(f"  Tokens: {stats.get('total_input_tokens', 0):,} in / {stats.get('total_output_tokens', 0):,} out")
+    say(f"  Cost: ${stats.get('cost_estimate', 0):.2f}")
+    say(f"  P1-only: {stats.get('pass1_only_count', 0)} | "
           f"3-pass: {stats.get('full_3pass_count', 0)} | "
           f"OK: {stats.get('reviews_ok', 0)} | "
           f"Fixed: {stats.get('reviews_fixed', 0)}")
 
     # ── Step 4: Extract paragraph pairs for quality check ─────────────
     step("4/6 — Extract Paragraph Pairs")
-    from orchestrator.tools.quality import extract_paragraphs, quality_spot_check
-
-    if output_path and os.path.exists(output_path):
-        pairs_json = extract_paragraphs(
-            original_path=book_path,
-            translated_path=output_path,
-            sample_count=3,
-            strategy="first",
-        )
-        pairs = json.loads(pairs_json)
-        pair_list = pairs.get("pairs", [])
-        print(f"  Extracted {len(pair_list)} paragraph pairs")
-        for i, pair in enumerate(pair_list[:3]):
-            orig = pair.get("original", "")[:80]
-            trans = pair.get("translated", "")[:80]
-            print(f"\n  Pair {i+1}:")
-            print(f"    EN: {orig}...")
-            print(f"    DE: {trans}...")
-    else:
-        print(f"  WARNING: Output file not found at {output_path}")
-        pair_list = []
+    from orchestrator.tools.quality import (
+        extract_paragraphs_dict, quality_spot_check_dict, quality_spot_check_batch,
+    )
 
-    # ── Step 5: Quality spot-check ────────────────────────────────────
-    step("5/6 — Quality Spot-Check")
-    quality_results = []
-
-    if pair_list:
-        # Check up to 2 pairs (to save API calls)
-        check_count = min(2, len(pair_list))
-        for i in range(check_count):
-            pair = pair_list[i]
-            print(f"\n  Checking pair {i+1}/{check_count}...")
-            qc_json = quality_spot_check(
+    # extract_paragraphs reports a missing file itself; no stat up front
+    pairs = extract_paragraphs_dict(
+        original_path=book_path,
+        translated_path=output_path,
+        sample_count=3,
+        strategy="first",
+    )
+    if pairs.get("error"):
+        say(f"  WARNING: {pairs['error']}")
+    pair_list = pairs.get("pairs", [])
+    say(f"  Extracted {len(pair_list)} paragraph pairs")
+    for i, pair in enumerate(pair_list[:3]):
+        orig = pair.get("original", "")[:80]
+        trans = pair.get("translated", "")[:80]
+        say(f"\n  Pair {i+1}:")
+        say(f"    EN: {orig}...")
+        say(f"    DE: {trans}...")
+
+    # ── Steps 5 & 6 run together: the report renders its book and stats
+    # sections while the spot-checks are in flight, then waits for them
+    from orchestrator.tools.report import generate_report_async
+
+    # Check up to 2 pairs (to save API calls)
+    check_pairs = pair_list[:2]
+    quality_checkpoint = os.path.join(checkpoint_dir, "quality.json")
+
+    async def spot_checks():
+        if not check_pairs:
+            return []
+        cached = _load_checkpoint(quality_checkpoint) if use_cache else None
+        if cached is not None:
+            return cached
+        results = await run_spot_checks()
+        if results and not any("error" in r for r in results):
+            _save_checkpoint(quality_checkpoint, results)
+        return results
+
+    async def run_spot_checks():
+        if batch_api:
+            batch = loads(await asyncio.to_thread(
+                quality_spot_check_batch,
+                pairs=dumps(check_pairs),
+                source_language=source_lang,
+                target_language="German",
+                batch_api=True,
+            ))
+            if batch.get("error"):
+                say(f"  ERROR: {batch['error']}")
+            return batch.get("results", [])
+        return await asyncio.gather(*(
+            asyncio.to_thread(
+                quality_spot_check_dict,
                 original_text=pair.get("original", ""),
                 translated_text=pair.get("translated", ""),
                 source_language=source_lang,
                 target_language="German",
             )
-            qc = json.loads(qc_json)
-            quality_results.append(qc)
+            for pair in check_pairs
+        ))
 
-            overall = qc.get("overall_score", "?")
-            print(f"    Overall score: {overall}/5")
+    report_path = os.path.join(report_dir, "translation_report.md")
+    quality_task = asyncio.create_task(spot_checks())
+    report_task = asyncio.create_task(generate_report_async(
+        translation_stats=stats,
+        quality_results=quality_task,
+        book_metadata=analysis,
+        profile_name=translate_result.get("profile") or "Default",
+        model_used=model,
+        output_path=report_path,
+    ))
+
+    # ── Step 5: Quality spot-check ────────────────────────────────────
+    step("5/6 — Quality Spot-Check")
+
+    if check_pairs:
+        check_count = len(check_pairs)
+        via = " via Message Batches" if batch_api else ""
+        say(f"  Checking {check_count} pairs{via}...")
+        quality_results = await quality_task
+        for i, qc in enumerate(quality_results):
+            say(f"\n  Pair {i+1}/{check_count}:")
+            overall = qc.get("average", "?")
+            say(f"    Overall score: {overall}/5")
             for dim, score in qc.get("scores", {}).items():
-                print(f"      {dim}: {score}/5")
+                say(f"      {dim}: {score}/5")
             if qc.get("issues"):
                 for issue in qc["issues"][:3]:
-                    print(f"    Issue: {issue}")
+                    say(f"    Issue: {issue}")
 
         if quality_results:
-            avg_score = sum(r.get("overall_score", 0) for r in quality_results) / len(quality_results)
-            print(f"\n  Average quality score: {avg_score:.1f}/5")
+            avg_score = sum(r.get("average", 0) for r in quality_results) / len(quality_results)
+            say(f"\n  Average quality score: {avg_score:.1f}/5")
     else:
-        print("  Skipped — no paragraph pairs available")
+        quality_results = await quality_task
+        say("  Skipped — no paragraph pairs available")
 
     # ── Step 6: Generate report ───────────────────────────────────────
     step("6/6 — Generate Report")
-    from orchestrator.tools.report import generate_report
-
-    report_path = os.path.join(report_dir, "translation_report.md")
-    report_json = generate_report(
-        translation_stats=json.dumps(stats),
-        quality_results=json.dumps(quality_results),
-        book_metadata=analysis_json,
-        profile_name=os.path.basename(selected_profile) if selected_profile else "Default",
-        model_used=model,
-        output_path=report_path,
-    )
-    report_result = json.loads(report_json)
-    print(f"  Report saved to: {report_result.get('path', report_path)}")
+    report_result = loads(await report_task)
+    say(f"  Report saved to: {report_result.get('path', report_path)}")
 
     # ── Summary ───────────────────────────────────────────────────────
     elapsed = time.time() - t0
-    print(f"\n{'=' * 60}")
-    print(f"  ORCHESTRATION COMPLETE")
-    print(f"{'=' * 60}")
-    print(f"  Total time: {elapsed:.0f}s")
-    print(f"  Paragraphs translated: {test_num}")
-    print(f"  API cost (translation): ${stats.get('cost_estimate', 0):.2f}")
-    print(f"  Output: {output_path}")
-    print(f"  Report: {report_path}")
+    say(f"\n{'=' * 60}")
+    say(f"  ORCHESTRATION COMPLETE")
+    say(f"{'=' * 60}")
+    say(f"  Total time: {elapsed:.0f}s")
+    say(f"  Paragraphs translated: {test_num}")
+    say(f"  API cost (translation): ${stats.get('cost_estimate', 0):.2f}")
+    say(f"  Output: {output_path}")
+    say(f"  Report: {report_path}")
     if quality_results:
-        avg = sum(r.get("overall_score", 0) for r in quality_results) / len(quality_results)
-        print(f"  Quality score: {avg:.1f}/5")
-    print()
+        avg = sum(r.get("average", 0) for r in quality_results) / len(quality_results)
+        say(f"  Quality score: {avg:.1f}/5")
+    say()
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    finally:
+        flush_log()
@@ -0,0 +1,250 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from book_maker.translator.claude_3pass_translator import (
+    PARA_DELIMITER, Claude3Pass, _RateLimiter, _parse_glossary_json,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_rate_limiter_without_limits_never_waits(clock):
+    limiter = _RateLimiter()
+    assert all(limiter._reserve(100_000) == 0 for _ in range(1000))
+
+
+def test_rate_limiter_rpm_waits_once_the_bucket_is_empty(clock):
+    limiter = _RateLimiter(rpm=60)
+    assert [limiter._reserve(0) for _ in range(60)] == [0.0] * 60
+    assert limiter._reserve(0) == pytest.approx(1.0)
+
+    # Two seconds refill two requests; one pays back the debt
+    clock[0] += 2
+    assert limiter._reserve(0) == 0.0
+    assert limiter._reserve(0) == pytest.approx(1.0)
+
+
+def test_rate_limiter_tpm_waits_for_the_token_debt(clock):
+    limiter = _RateLimiter(tpm=1000)
+    assert limiter._reserve(600) == 0.0
+    assert limiter._reserve(600) == pytest.approx(12.0)
+
+
+def test_rate_limiter_caps_oversized_requests_at_the_limit(clock):
+    # A request larger than tpm would otherwise never fit the bucket
+    limiter = _RateLimiter(tpm=1000)
+    assert limiter._reserve(5000) == 0.0
+    assert limiter._reserve(5000) == pytest.approx(60.0)
+
+
+def test_rate_limiter_async_acquire_sleeps_for_the_wait(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    limiter = _RateLimiter(rpm=60)
+
+    async def run():
+        for _ in range(61):
+            await limiter.aacquire(0)
+
+    asyncio.run(run())
+    assert slept == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize("reply", [
+    '{"Hans Castorp": "Hans Castorp", "Berghof": "Berghof"}',
+    'Here is the glossary:\n```json\n{"Hans Castorp": "Hans Castorp", "Berghof": "Berghof"}\n```',
+    '{"Hans Castorp": "Hans Castorp", "Berghof": "Berghof"}\nNote: {added two terms}',
+    '{"Hans Castorp": "Hans Castorp", "Berghof": "Berghof", "Settemb',
+])
+def test_parse_glossary_json_recovers_the_terms(reply):
+    assert _parse_glossary_json(reply) == {"Hans Castorp": "Hans Castorp", "Berghof": "Berghof"}
+
+
+@pytest.mark.parametrize("reply", ["No new terms.", "", "[]"])
+def test_parse_glossary_json_without_an_object(reply):
+    assert _parse_glossary_json(reply) == {}
+
+
+@pytest.fixture
+def translator(tmp_path):
+    profile = tmp_path / "profile.json"
+    profile.write_text(json.dumps({"name": "Test", "protected_nouns": ["Castorp", "Berghof"]}))
+    t = Claude3Pass(key="test", language="German", client=object())
+    t.load_profile(str(profile))
+    return t
+
+
+ORIGINAL = "<p>Castorp arrived at the Berghof late in the evening.</p>"
+
+
+def test_quality_gate_passes_a_plausible_translation(translator):
+    translation = "<p>Castorp kam spät am Abend im Berghof an.</p>"
+    assert translator._cheap_quality_gate(ORIGINAL, translation)
+
+
+@pytest.mark.parametrize("translation", [
+    "<p>Castorp kam.</p>",                                      # too short
+    "<p>" + "Castorp kam im Berghof an. " * 10 + "</p>",       # too long
+    "<p>Kastorp kam spät am Abend im Berghof an, ja.</p>",      # lost a protected noun
+    "Castorp kam spät am Abend im Berghof an, sehr spät.",      # lost the tags
+])
+def test_quality_gate_sends_suspect_translations_to_review(translator, translation):
+    assert not translator._cheap_quality_gate(ORIGINAL, translation)
+
+
+def test_quality_gate_only_covers_mid_length_chunks(translator):
+    original = ORIGINAL * 20
+    assert len(original) >= 2 * translator.min_review_chars
+    assert not translator._cheap_quality_gate(original, original)
+
+
+def test_quality_gate_can_be_switched_off(translator):
+    translator.quality_gate = False
+    assert not translator._cheap_quality_gate(ORIGINAL, ORIGINAL)
+
+
+def test_state_round_trip(tmp_path):
+    state_path = str(tmp_path / "book.epub.trstate.json")
+    saved = Claude3Pass(key="test", language="German", client=object(), state_path=state_path)
+    saved.glossary.update({"Zauberberg": "Magic Mountain", "Grüße": "greetings"})
+    saved.context_frozen = "Hans Castorp visits his cousin in Davos."
+    saved.context_recent = "He decides to stay."
+    saved.chunk_counter = 42
+    saved._save_state()
+
+    restored = Claude3Pass(key="test", language="German", client=object(), state_path=state_path)
+    restored.glossary["Berghof"] = "Berghof"  # e.g. a profile's seed glossary
+    assert restored.load_state()
+    assert restored.glossary == {
+        "Berghof": "Berghof", "Zauberberg": "Magic Mountain", "Grüße": "greetings",
+    }
+    assert restored.context_frozen == saved.context_frozen
+    assert restored.context_recent == saved.context_recent
+    assert restored.chunk_counter == 42
+
+
+def test_load_state_without_a_usable_snapshot(tmp_path):
+    state_path = tmp_path / "book.epub.trstate.json"
+    t = Claude3Pass(key="test", language="German", client=object(), state_path=str(state_path))
+    assert not t.load_state()
+    state_path.write_text("{truncated")
+    assert not t.load_state()
+    assert t.chunk_counter == 0
+
+
+def test_clear_state_removes_the_snapshot(tmp_path):
+    state_path = tmp_path / "book.epub.trstate.json"
+    t = Claude3Pass(key="test", language="German", client=object(), state_path=str(state_path))
+    t._save_state()
+    assert state_path.exists()
+    t.clear_state()
+    assert not state_path.exists()
+    t.clear_state()
+
+
+@pytest.fixture
+def packer(monkeypatch):
+    """A translator whose Pass 1 replies are scripted per call."""
+    t = Claude3Pass(key="test", language="German", client=object())
+    t.skip_review = True
+    monkeypatch.setattr(t, "_maybe_update_context_glossary", lambda *a, **kw: None)
+    calls = []
+
+    def pass1(text, batch_instruction=""):
+        calls.append(text)
+        if PARA_DELIMITER in text:
+            return t.batch_reply
+        return f"de:{text}"
+
+    monkeypatch.setattr(t, "_pass1", pass1)
+    t.calls = calls
+    return t
+
+
+def test_flush_splits_a_batch_reply_per_paragraph(packer):
+    packer.batch_reply = f"de:a\n{PARA_DELIMITER}\nde:b\n{PARA_DELIMITER}\nde:c"
+    results = packer.translate_chapter(["a", "b", "c"])
+    assert [r.text for r in results] == ["de:a", "de:b", "de:c"]
+    assert len(packer.calls) == 1
+
+
+@pytest.mark.parametrize("reply", [
+    f"de:a\n{PARA_DELIMITER}\nde:b\n{PARA_DELIMITER}\nde:c\n{PARA_DELIMITER}\nde:d",  # too many
+    f"de:a\n{PARA_DELIMITER}\nde:b de:c",                                             # too few
+])
+def test_flush_retranslates_one_by_one_on_a_line_count_mismatch(packer, reply):
+    packer.batch_reply = reply
+    results = packer.translate_chapter(["a", "b", "c"])
+    assert [r.text for r in results] == ["de:a", "de:b", "de:c"]
+    assert packer.calls[1:] == ["a", "b", "c"]
+
+
+def test_paragraph_after_a_pending_flush_runs_unbatched_on_a_context_boundary(packer):
+    packer.context_flag = True
+    packer.context_update_interval = 3
+    packer.context_freeze_interval = 100
+    packer.batch_char_budget = 3
+    packer.batch_reply = f"de:aa\n{PARA_DELIMITER}\nde:b"
+    results = packer.translate_chapter(["aa", "b", "c", "d"])
+    assert [r.text for r in results] == ["de:aa", "de:b", "de:c", "de:d"]
+    # Chunk 1 packs aa/b, chunk 2 flushes c early so d runs alone as chunk 3
+    assert packer.calls == [f"aa\n{PARA_DELIMITER}\nb", "c", "d"]
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self.text_stream = iter(chunks)
+        # Before message_delta the snapshot only has the message_start usage
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=1))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_stream_closed_on_quality_ok_counts_the_text_received():
+    verdict = "QUALITY_OK — the translation reads naturally and keeps every name."
+    chunks = [verdict[:20], verdict[20:40], verdict[40:], " never read"]
+    stream = _Stream(chunks)
+    t = Claude3Pass(key="test", language="German", client=SimpleNamespace(
+        messages=SimpleNamespace(stream=lambda **kw: stream)))
+
+    assert t._stream_until_ok({}) == "QUALITY_OK"
+    assert next(stream.text_stream) == verdict[40:]
+    assert t.total_input_tokens == 1000
+    assert t.total_output_tokens == len(verdict[:40]) // 4
+
+
+def test_batch_results_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    saved = Claude3Pass(key="test", language="German", client=object())
+    saved.book_name = "zauberberg"
+    saved.batch_text_list = [{"book_index": 3, "text": "Grüße"}, {"book_index": 7, "text": "aus Davos"}]
+    monkeypatch.setattr(saved, "translate_batched", lambda texts: [f"de:{t}" for t in texts])
+    saved.batch()
+
+    restored = Claude3Pass(key="test", language="German", client=object())
+    restored.book_name = "zauberberg"
+    assert restored.is_completed_batch()
+    assert restored.batch_translate(3) == "de:Grüße"
+    assert restored.batch_translate(7) == "de:aus Davos"
+    with pytest.raises(ValueError):
+        restored.batch_translate(5)
@@ -0,0 +1,83 @@
+import pytest
+
+from orchestrator.tools import analyze
+from orchestrator.tools.analyze import SAMPLE_CHARS, SAMPLE_MIN_CHARS, _count_words, _sample
+
+LONG = "x" * SAMPLE_MIN_CHARS
+
+
+def test_sample_picks_evenly_spaced_paragraphs():
+    paragraphs = [f"{i:03d} {LONG}" for i in range(100)]
+    samples = _sample(paragraphs.__getitem__, len(paragraphs), 5)
+    assert [s[:3] for s in samples] == ["000", "020", "040", "060", "080"]
+
+
+def test_sample_skips_headings_within_a_window():
+    paragraphs = ["Chapter 1", "* * *", f"a {LONG}", "Chapter 2", f"b {LONG}", f"c {LONG}"]
+    samples = _sample(paragraphs.__getitem__, len(paragraphs), 2)
+    assert samples == [f"a {LONG}", f"b {LONG}"]
+
+
+def test_sample_backfills_empty_windows_in_book_order():
+    # The second window only holds short lines, so another usable
+    # paragraph from the first window takes its place
+    paragraphs = [f"a {LONG}", f"b {LONG}", "I", "II"]
+    samples = _sample(paragraphs.__getitem__, len(paragraphs), 2)
+    assert samples == [f"a {LONG}", f"b {LONG}"]
+
+
+def test_sample_strips_and_truncates():
+    paragraphs = ["  " + "y" * (SAMPLE_CHARS + 100) + "  "]
+    assert _sample(paragraphs.__getitem__, 1, 3) == ["y" * SAMPLE_CHARS]
+
+
+def test_sample_with_too_few_usable_paragraphs():
+    paragraphs = ["short", f"only {LONG}", "tiny"]
+    assert _sample(paragraphs.__getitem__, len(paragraphs), 5) == [f"only {LONG}"]
+    assert _sample(paragraphs.__getitem__, 0, 5) == []
+
+
+PARAGRAPHS = [
+    "Es war einmal ein junger Mann.",
+    "  Leading and trailing\tspaces  ",
+    "Grüße aus Davos — «ça va?»",
+    "line one\nline two\r\nline three",
+    "",
+    "single",
+]
+
+
+def test_count_words_splits_on_whitespace():
+    assert _count_words(iter(PARAGRAPHS), len(PARAGRAPHS)) == 23
+
+
+def test_count_words_numpy_path_matches_split(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(analyze, "NUMPY_WORD_COUNT_MIN", 0)
+    paragraphs = PARAGRAPHS * 50
+    expected = sum(len(p.split()) for p in paragraphs)
+    assert _count_words(iter(paragraphs), len(paragraphs)) == expected
+
+
+@pytest.fixture
+def book(tmp_path, monkeypatch):
+    monkeypatch.setattr(analyze, "ANALYZE_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "book.txt"
+    path.write_text(f"A Title\n\n{LONG}\n\n{LONG}\n", encoding="utf-8")
+    return str(path)
+
+
+def test_analyze_book_reads_back_its_cache(book, tmp_path):
+    first = analyze.analyze_book_dict(book)
+    [entry] = (tmp_path / "cache").iterdir()
+    assert analyze.analyze_book_dict(book) == first
+    assert "file" not in analyze.loads(entry.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("corrupt", ['{"format": "txt", "estimated_wo', "", "[]", b"\xff\xfe"])
+def test_analyze_book_recomputes_a_corrupt_cache_entry(book, tmp_path, corrupt):
+    first = analyze.analyze_book_dict(book)
+    [entry] = (tmp_path / "cache").iterdir()
+    entry.write_bytes(corrupt.encode() if isinstance(corrupt, str) else corrupt)
+    assert analyze.analyze_book_dict(book) == first
+    assert analyze.loads(entry.read_text(encoding="utf-8"))["estimated_words"] == first["estimated_words"]
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from orchestrator.tools import _json
+
+orjson = pytest.importorskip("orjson")
+
+SAMPLES = [
+    {"title": "Der Zauberberg", "author": "Thomas Mann", "chapters": 7},
+    {"text": "Grüße — «ça va?» 日本語", "nested": {"list": [1, 2.5, None, True]}},
+    {1: "int keys", 2: ["are", "written", "as", "strings"]},
+    [],
+    {},
+]
+
+
+@pytest.fixture
+def stdlib(monkeypatch):
+    monkeypatch.setattr(_json, "orjson", None)
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_dumps_matches_the_stdlib_fallback(obj, monkeypatch):
+    fast = _json.dumps(obj)
+    monkeypatch.setattr(_json, "orjson", None)
+    assert fast == _json.dumps(obj)
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_dumps_indented_matches_the_stdlib_fallback(obj, monkeypatch):
+    fast = _json.dumps_indented(obj)
+    monkeypatch.setattr(_json, "orjson", None)
+    assert fast == _json.dumps_indented(obj)
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_loads_round_trips_with_either_backend(obj, stdlib):
+    text = _json.dumps(obj)
+    assert _json.loads(text) == json.loads(text)
+    assert _json.loads(text.encode("utf-8")) == json.loads(text)
+
+
+def test_decode_errors_are_stdlib_json_errors(monkeypatch):
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads("{not json")
+    monkeypatch.setattr(_json, "orjson", None)
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads("{not json")
+
+
+def test_dump_file_writes_indented_json(tmp_path, stdlib):
+    path = tmp_path / "profile.json"
+    _json.dump_file({"name": "Literary", "nouns": ["Castorp"]}, str(path))
+    assert path.read_bytes() == _json.dumps_indented({"name": "Literary", "nouns": ["Castorp"]})
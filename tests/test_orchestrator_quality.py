@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+import pytest
+
+from orchestrator.tools import quality
+from orchestrator.tools.quality import _pairs_at, _parse_spot_check
+
+MATCHED = [
+    ("ch1.xhtml", ["o0", "o1", "o2"], ["t0", "t1", "t2", "extra"], 3),
+    ("ch2.xhtml", ["o3"], ["t3"], 1),
+    ("ch3.xhtml", ["o4", "o5"], ["t4", "t5"], 2),
+]
+
+
+def test_pairs_at_maps_global_indices_to_chapters():
+    pairs = list(_pairs_at(MATCHED, [0, 3, 5]))
+    assert pairs == [
+        {"chapter": "ch1.xhtml", "index": 0, "original": "o0", "translated": "t0"},
+        {"chapter": "ch2.xhtml", "index": 0, "original": "o3", "translated": "t3"},
+        {"chapter": "ch3.xhtml", "index": 1, "original": "o5", "translated": "t5"},
+    ]
+
+
+def test_pairs_at_takes_several_pairs_from_one_chapter():
+    pairs = list(_pairs_at(MATCHED, range(4)))
+    assert [p["original"] for p in pairs] == ["o0", "o1", "o2", "o3"]
+
+
+def test_pairs_at_stops_after_the_last_index():
+    def chapters():
+        yield MATCHED[0]
+        raise AssertionError("walked past the last wanted index")
+
+    assert [p["translated"] for p in _pairs_at(chapters(), [1, 2])] == ["t1", "t2"]
+
+
+@pytest.mark.parametrize("indices", [[], [6, 7]])
+def test_pairs_at_without_indices_in_range(indices):
+    assert list(_pairs_at(MATCHED, indices)) == []
+
+
+def _response(*texts):
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=t) for t in texts],
+        usage=SimpleNamespace(input_tokens=321, output_tokens=45),
+    )
+
+
+SCORES = (
+    '{"scores": {"accuracy": 5, "fluency": 4}, "average": 4.5, '
+    '"issues": [], "summary": "Good."}'
+)
+
+
+def test_parse_spot_check_reads_the_json_reply():
+    result = _parse_spot_check(_response(SCORES))
+    assert result["scores"] == {"accuracy": 5, "fluency": 4}
+    assert result["average"] == 4.5
+    assert result["tokens_used"] == {"input": 321, "output": 45}
+
+
+def test_parse_spot_check_skips_fences_and_prose():
+    result = _parse_spot_check(_response("Here is my evaluation:\n```json\n", SCORES, "\n```\nThanks."))
+    assert result["summary"] == "Good."
+
+
+@pytest.mark.parametrize("text", ["I cannot rate this.", "{broken", "} {"])
+def test_parse_spot_check_reports_unparseable_replies(text):
+    result = _parse_spot_check(_response(text))
+    assert result["error"] == "Failed to parse quality evaluation response"
+    assert result["raw_response"] == text
+
+
+class _StuckBatches:
+    """A Message Batches API whose batch only ends once cancelled."""
+
+    def __init__(self, succeeded):
+        self.succeeded = succeeded
+        self.cancelled = False
+
+    def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status="ended" if self.cancelled else "in_progress")
+
+    def cancel(self, batch_id):
+        self.cancelled = True
+        return SimpleNamespace(id=batch_id, processing_status="canceling")
+
+    def results(self, batch_id):
+        for i in self.succeeded:
+            yield SimpleNamespace(custom_id=f"pair_{i}", result=SimpleNamespace(
+                type="succeeded", message=_response(SCORES)))
+        yield SimpleNamespace(custom_id="pair_2", result=SimpleNamespace(type="canceled"))
+
+
+def test_message_batch_past_its_deadline_is_cancelled_and_scored_directly(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(quality.time, "monotonic", lambda: now[0])
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(quality.time, "sleep", sleep)
+    batches = _StuckBatches(succeeded=[0])
+    direct = []
+
+    def create(**params):
+        direct.append(params["messages"][0]["content"])
+        return _response('{"average": 3.0}')
+
+    client = SimpleNamespace(messages=SimpleNamespace(batches=batches, create=create))
+    monkeypatch.setattr(quality, "anthropic_client", lambda api_key: client)
+
+    pairs = [{"original": f"o{i}", "translated": f"t{i}"} for i in range(3)]
+    results = quality._spot_check_message_batch("key", [], pairs, "English", "German")
+
+    assert batches.cancelled
+    assert now[0] >= quality.SPOT_CHECK_BATCH_TIMEOUT
+    assert results[0]["average"] == 4.5
+    assert [r["average"] for r in results[1:]] == [3.0, 3.0]
+    assert [d.splitlines()[1] for d in direct] == ["o1", "o2"]
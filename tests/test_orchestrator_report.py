@@ -0,0 +1,155 @@
+import asyncio
+import json
+import re
+
+from orchestrator.tools.report import generate_report, generate_report_async
+
+STATS = {
+    "total_requests": 1234, "chunk_counter": 40, "pass1_only_count": 12,
+    "full_3pass_count": 28, "reviews_ok": 20, "reviews_fixed": 8, "glossary_terms": 57,
+    "total_input_tokens": 987654, "total_output_tokens": 123456,
+    "total_cache_read_tokens": 500000, "total_cache_create_tokens": 20000,
+    "cost_estimate": 4.5678, "cost_without_cache": 7.25,
+}
+METADATA = {
+    "title": "Der Zauberberg", "author": "Thomas Mann", "format": "epub",
+    "detected_language": "de", "chapters": 7, "total_paragraphs": 4321,
+    "estimated_words": 250000,
+}
+QUALITY_LIST = [
+    {"average": 4.4, "summary": "Faithful.", "issues": []},
+    {"average": 3.6, "summary": "Some stiffness.", "issues": ["literal idiom", "tense shift"]},
+]
+QUALITY_SINGLE = {
+    "scores": {"accuracy": 5, "fluency": 4}, "average": 4.5,
+    "summary": "Good.", "issues": ["minor comma"],
+}
+
+# Output of the original line-by-line generate_report for the inputs above
+BASELINE_HEAD = """\
+# Translation Report
+
+**Generated:** <now>
+**Model:** claude-sonnet-4-20250514
+**Profile:** Literary
+
+## Book Information
+
+| Field | Value |
+|-------|-------|
+| Title | Der Zauberberg |
+| Author | Thomas Mann |
+| Format | epub |
+| Detected Language | de |
+| Chapters | 7 |
+| Total Paragraphs | 4321 |
+| Estimated Words | 250000 |
+
+## Translation Statistics
+
+| Metric | Value |
+|--------|-------|
+| API Calls | 1,234 |
+| Chunks Processed | 40 |
+| Pass 1 Only | 12 |
+| Full 3-Pass | 28 |
+| Reviews OK | 20 |
+| Reviews Fixed | 8 |
+| Glossary Terms | 57 |
+| Input Tokens | 987,654 |
+| Output Tokens | 123,456 |
+| Cache Read Tokens | 500,000 |
+| Cache Create Tokens | 20,000 |
+| **Estimated Cost** | **$4.57** |
+| Cache Savings | $2.68 |
+
+"""
+BASELINE_QUALITY_LIST = """\
+## Quality Assessment
+
+### Sample 1
+
+- **Average:** 4.4/5
+- **Summary:** Faithful.
+
+### Sample 2
+
+- **Average:** 3.6/5
+- **Summary:** Some stiffness.
+- **Issues:** literal idiom, tense shift
+
+### Overall Quality Score: 4.0/5
+
+Quality is **good**. No retranslation recommended.
+
+---
+*Report generated by translation-orchestrator v0.1.0*"""
+BASELINE_QUALITY_SINGLE = """\
+## Quality Assessment
+
+| Dimension | Score |
+|-----------|-------|
+| Accuracy | 5/5 |
+| Fluency | 4/5 |
+| **Average** | **4.5/5** |
+
+**Summary:** Good.
+
+**Issues found:**
+- minor comma
+
+---
+*Report generated by translation-orchestrator v0.1.0*"""
+
+
+def _read_report(result):
+    info = json.loads(result)
+    with open(info["path"], encoding="utf-8") as f:
+        text = f.read()
+    return info, re.sub(r"\*\*Generated:\*\* .*", "**Generated:** <now>", text)
+
+
+def test_report_matches_the_baseline_for_a_sweep(tmp_path):
+    info, text = _read_report(generate_report(
+        json.dumps(STATS), json.dumps(QUALITY_LIST), json.dumps(METADATA),
+        "Literary", "claude-sonnet-4-20250514", str(tmp_path / "report.md"),
+    ))
+    assert text == BASELINE_HEAD + BASELINE_QUALITY_LIST
+    assert info == {
+        "status": "generated", "path": str(tmp_path / "report.md"),
+        "lines": 55, "has_stats": True, "has_quality": True,
+    }
+
+
+def test_report_matches_the_baseline_for_one_check(tmp_path):
+    _, text = _read_report(generate_report(
+        STATS, QUALITY_SINGLE, METADATA,
+        "Literary", "claude-sonnet-4-20250514", str(tmp_path / "report.md"),
+    ))
+    assert text == BASELINE_HEAD + BASELINE_QUALITY_SINGLE
+
+
+def test_async_report_matches_the_sync_one(tmp_path):
+    async def quality():
+        return QUALITY_LIST
+
+    _, sync_text = _read_report(generate_report(
+        STATS, QUALITY_LIST, METADATA, "Literary", "claude-sonnet-4-20250514",
+        str(tmp_path / "sync.md"),
+    ))
+    _, async_text = _read_report(asyncio.run(generate_report_async(
+        STATS, quality(), METADATA, "Literary", "claude-sonnet-4-20250514",
+        str(tmp_path / "async.md"),
+    )))
+    assert async_text == sync_text
+
+
+def test_report_rejects_invalid_json():
+    assert "Invalid JSON input" in json.loads(generate_report("{broken"))["error"]
+
+
+def test_report_filename_keeps_only_safe_title_characters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    info = json.loads(generate_report(book_metadata={"title": "Grüße: Band 1/2 (Neu!)"}))
+    assert re.fullmatch(r"report_Grüße Band 12 Neu_\d{8}_\d{6}\.md", info["path"])
+    assert (tmp_path / info["path"]).exists()